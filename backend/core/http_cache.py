@@ -0,0 +1,38 @@
+from datetime import timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request
+
+from services.catalog_version import CatalogState
+
+
+def catalog_headers(state: CatalogState) -> dict[str, str]:
+    headers = {
+        "ETag": f'W/"catalog-{state.version}"',
+        # Cacheable, but always revalidated against the catalog version
+        "Cache-Control": "no-cache",
+    }
+    if state.updated_at is not None:
+        headers["Last-Modified"] = format_datetime(state.updated_at.replace(tzinfo=timezone.utc), usegmt=True)
+    return headers
+
+
+def is_not_modified(request: Request, headers: dict[str, str]) -> bool:
+    """
+    Evaluates If-None-Match (weak comparison), falling back to
+    If-Modified-Since only when no If-None-Match is sent.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        etag = headers["ETag"].removeprefix("W/")
+        candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in candidates or etag in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    last_modified = headers.get("Last-Modified")
+    if if_modified_since and last_modified:
+        try:
+            return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
@@ -0,0 +1,95 @@
+import os
+import atexit
+import queue
+import random
+import logging
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+
+# Hot-path loggers only keep this fraction of their DEBUG records.
+# Override with LOG_DEBUG_SAMPLE_RATES="routers.resources=0.5,db.database=0"
+DEFAULT_DEBUG_SAMPLE_RATES = {
+    "db.database": 0.01,
+    "routers.learning_path": 0.1,
+    "routers.resources": 0.1,
+    "routers.users": 0.1,
+    "services.skill_synthesizer": 0.1,
+}
+
+_listener: QueueListener | None = None
+
+
+class DebugSamplingFilter(logging.Filter):
+    """
+    Passes every record above DEBUG and a random `rate` fraction of DEBUG records.
+    """
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > logging.DEBUG or random.random() < self.rate
+
+
+def _parse_pairs(spec: str) -> dict[str, str]:
+    """
+    Parses "name=value,name=value" into a dict, ignoring malformed entries.
+    """
+    pairs = {}
+    for item in spec.split(","):
+        name, sep, value = item.partition("=")
+        if sep and name.strip() and value.strip():
+            pairs[name.strip()] = value.strip()
+    return pairs
+
+
+def configure_logging() -> None:
+    """
+    Installs the application logging setup once per process:
+    - root level from LOG_LEVEL, per-module levels from LOG_LEVELS
+      (e.g. "routers.resources=DEBUG,db.database=WARNING")
+    - sampled DEBUG output for hot-path loggers
+    - a QueueHandler so request threads never block on stream writes;
+      a background QueueListener does the actual I/O.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    root = logging.getLogger()
+    root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+
+    for name, level in _parse_pairs(os.getenv("LOG_LEVELS", "")).items():
+        logging.getLogger(name).setLevel(level.upper())
+
+    sample_rates = dict(DEFAULT_DEBUG_SAMPLE_RATES)
+    for name, rate in _parse_pairs(os.getenv("LOG_DEBUG_SAMPLE_RATES", "")).items():
+        try:
+            sample_rates[name] = float(rate)
+        except ValueError:
+            continue
+    for name, rate in sample_rates.items():
+        if rate < 1.0:
+            logging.getLogger(name).addFilter(DebugSamplingFilter(rate))
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root.handlers = [QueueHandler(log_queue)]
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """
+    Flushes queued records; safe to call more than once.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
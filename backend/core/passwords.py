@@ -0,0 +1,85 @@
+import os
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from passlib.context import CryptContext
+
+logger = logging.getLogger(__name__)
+
+# Kept free of app imports: spawned pool workers import this module on startup.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=12
+)
+
+def hash_password(password: str) -> str:
+    return pwd_context.hash(password)
+
+def verify_password(password: str, hashed: str) -> bool:
+    return pwd_context.verify(password, hashed)
+
+
+class PasswordHasherBusy(Exception):
+    """
+    Raised when the pool already has max_pending hash/verify calls queued.
+    """
+
+
+class PasswordHashPool:
+    """
+    Bounded process pool for bcrypt work, so ~250 ms of CPU per call never
+    runs on the event loop or in FastAPI's shared threadpool.
+    Calls beyond max_pending are rejected instead of queued without limit.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = max(1, workers)
+        self.max_pending = max_pending
+        self._pending = 0
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: forking a process that holds DB connections and event loop state is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info("Started password hash pool with %d workers", self.workers)
+        return self._executor
+
+    def pending(self) -> int:
+        return self._pending
+
+    async def _submit(self, fn, *args):
+        # Only touched from the event loop thread, so no lock is needed
+        if self._pending >= self.max_pending:
+            raise PasswordHasherBusy()
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            self._pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(hash_password, password)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await self._submit(verify_password, password, hashed)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_workers = int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 1)))
+
+password_hash_pool = PasswordHashPool(
+    workers=_workers,
+    max_pending=int(os.getenv("PASSWORD_HASH_MAX_PENDING", str(_workers * 8))),
+)
@@ -4,9 +4,10 @@ from datetime import datetime, timedelta
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from passlib.context import CryptContext
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
+from core.cache import TTLCache
 from db.database import get_db
 from models.user import User
 
@@ -14,19 +15,34 @@ SECRET_KEY = os.getenv("SECRET_KEY", "dev_secret_key_change_in_production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24
 
-pwd_context = CryptContext(
-    schemes=["bcrypt"],
-    deprecated="auto",
-    bcrypt__rounds=12
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
+
+# user id -> detached User, so most authenticated requests skip the users
+# query. Cached principals are shared between requests: treat them as read-only.
+principal_cache = TTLCache(
+    maxsize=int(os.getenv("PRINCIPAL_CACHE_SIZE", "10000")),
+    ttl=float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "60")),
 )
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
+def invalidate_principal(user_id: str) -> None:
+    principal_cache.pop(str(user_id))
 
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+def principal_cache_stats() -> dict:
+    """
+    Cache counters plus how often get_current_user had to fall back to the DB.
+    """
+    stats = principal_cache.stats()
+    lookups = stats["hits"] + stats["misses"]
+    stats["db_fallbacks"] = stats["misses"]
+    stats["db_fallback_rate"] = stats["misses"] / lookups if lookups else 0.0
+    return stats
 
-def verify_password(password: str, hashed: str) -> bool:
-    return pwd_context.verify(password, hashed)
+# ORM updates/deletes of a user drop its principal. Bulk query.update()/delete()
+# bypass these events, so such call sites must call invalidate_principal themselves.
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_changed_principal(mapper, connection, target: User) -> None:
+    invalidate_principal(target.id)
 
 def create_access_token(user_id: str) -> str:
     expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -54,10 +70,17 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
             status_code=401,
             detail="Invalid authentication token",
         )
+    user = principal_cache.get(str(user_id))
+    if user is not None:
+        return user
+
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
         raise HTTPException(
             status_code=401,
             detail="User not found",
         )
+    # Detach so the cached instance outlives this request's session
+    db.expunge(user)
+    principal_cache.set(str(user_id), user)
     return user
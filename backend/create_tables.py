@@ -1,9 +1,17 @@
 from db.database import Base, engine
 from models import Event, User, UserSkill
+from models.catalog_version import CatalogVersion
 from models.course import Course
 from models.course_prerequisite import CoursePrerequisite
 from models.skill_weight import SkillWeight
 from models.skill_profile import SkillProfile
+from models.user_course_completion import UserCourseCompletion
+from models.user_roadmap_progress import UserRoadmapProgress
+from models.github_repo_cache import GitHubRepoCache
+from models.ingestion_manifest import IngestionManifest
+from models.ingestion_pending import IngestionPending
+from models.roadmap_difficulty_state import RoadmapDifficultyState
+from models.roadmap_summary import RoadmapSummary
 
 
 def create_tables() -> None:
@@ -1,3 +1,13 @@
-from .database import Base, SessionLocal, engine, get_db
+from .database import AsyncSessionLocal, Base, SessionLocal, async_engine, engine, get_async_db, get_db
+from .upsert import insert_for
 
-__all__ = ["Base", "SessionLocal", "engine", "get_db"]
+__all__ = [
+    "AsyncSessionLocal",
+    "Base",
+    "SessionLocal",
+    "async_engine",
+    "engine",
+    "get_async_db",
+    "get_db",
+    "insert_for",
+]
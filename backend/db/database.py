@@ -1,7 +1,11 @@
 import os
+import logging
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 
+logger = logging.getLogger(__name__)
+
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./app.db")
 
 engine_kwargs = {
@@ -9,29 +13,71 @@ engine_kwargs = {
 }
 
 if DATABASE_URL.startswith("sqlite"):
-    print("Using SQLite database")
+    logger.info("Using SQLite database")
     engine_kwargs["connect_args"] = {"check_same_thread": False}
 else:
-    print("Using PostgreSQL database")
+    logger.info("Using PostgreSQL database")
     engine_kwargs["pool_size"] = 3
     engine_kwargs["max_overflow"] = 5
     engine_kwargs["connect_args"] = {"sslmode": "require"}
 
 engine = create_engine(DATABASE_URL, **engine_kwargs)
 
+
+def to_async_url(url: str) -> str:
+    """
+    Maps a sync DATABASE_URL onto its asyncio driver (aiosqlite / asyncpg).
+    """
+    if url.startswith("sqlite+aiosqlite") or url.startswith("postgresql+asyncpg"):
+        return url
+    if url.startswith("sqlite"):
+        return "sqlite+aiosqlite" + url[len("sqlite"):]
+    for prefix in ("postgresql+psycopg2", "postgresql", "postgres"):
+        if url.startswith(prefix + "://"):
+            return "postgresql+asyncpg" + url[len(prefix):]
+    return url
+
+
+async_engine_kwargs = {
+    "pool_pre_ping": True,
+}
+
+if DATABASE_URL.startswith("sqlite"):
+    async_engine_kwargs["connect_args"] = {"check_same_thread": False}
+else:
+    async_engine_kwargs["pool_size"] = 3
+    async_engine_kwargs["max_overflow"] = 5
+    async_engine_kwargs["connect_args"] = {"ssl": "require"}
+
+async_engine = create_async_engine(to_async_url(DATABASE_URL), **async_engine_kwargs)
+
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
     bind=engine,
 )
 
+# expire_on_commit=False: attribute access after commit must not trigger implicit IO
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+    class_=AsyncSession,
+)
+
 Base = declarative_base()
 
 def get_db():
-    print("DB session opened")
+    logger.debug("DB session opened")
     db = SessionLocal()
     try:
         yield db
     finally:
-        print("DB session closed")
+        logger.debug("DB session closed")
         db.close()
+
+async def get_async_db():
+    logger.debug("Async DB session opened")
+    async with AsyncSessionLocal() as db:
+        yield db
+    logger.debug("Async DB session closed")
@@ -0,0 +1,13 @@
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+
+def insert_for(db: Session, table):
+    """
+    Returns an INSERT construct for the session's dialect so callers can use
+    on_conflict_do_update / on_conflict_do_nothing on both SQLite and PostgreSQL.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return pg_insert(table)
+    return sqlite_insert(table)
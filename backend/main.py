@@ -1,3 +1,10 @@
+from contextlib import asynccontextmanager
+
+from core.logging_config import configure_logging
+
+# Configure logging before importing modules that log at import time
+configure_logging()
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -18,21 +25,49 @@ from routers import resources
 from routers import skill_graph
 from routers import quiz
 from routers import skill_profile
-from db.database import engine, Base
+from db.database import SessionLocal, async_engine, engine, Base
+from services.quiz_generation_service import quiz_pregeneration_queue
+from core.passwords import password_hash_pool
+from services.http_client import close_http_client
+from services.job_runner import get_job_runner
+from services.pdf_text import shutdown_pdf_pool
+from services.progress_service import backfill_roadmap_progress
 
 # Import all models to ensure metadata.create_all registers them
+import models.catalog_version
 import models.course
 import models.course_prerequisite
 import models.course_resource
 import models.event
+import models.github_repo_cache
+import models.ingestion_manifest
+import models.ingestion_pending
+import models.roadmap_difficulty_state
+import models.roadmap_summary
 import models.skill_profile
 import models.skill_weight
 import models.user
+import models.user_course_completion
 import models.user_skill
+import models.user_roadmap_progress
 
 Base.metadata.create_all(bind=engine)
 
-app = FastAPI(title="AI Learning Path Recommendation System")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Databases whose completion events predate user_course_completions get
+    # their progress counters built once, before the first request reads them
+    with SessionLocal() as db:
+        backfill_roadmap_progress(db)
+    yield
+    await quiz_pregeneration_queue.stop()
+    await get_job_runner().stop()
+    password_hash_pool.shutdown()
+    shutdown_pdf_pool()
+    await close_http_client()
+    await async_engine.dispose()
+
+app = FastAPI(title="AI Learning Path Recommendation System", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -40,6 +75,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let browser clients read the catalog pagination and revalidation headers
+    expose_headers=["X-Next-Cursor", "ETag", "Last-Modified"],
 )
 
 app.include_router(recommend_router, prefix="/recommend", tags=["recommend"])
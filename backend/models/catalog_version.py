@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Integer, DateTime
+from datetime import datetime
+from db.database import Base
+
+class CatalogVersion(Base):
+    __tablename__ = "catalog_versions"
+
+    # Single-row table: bumped by the ingestion scripts whenever courses or
+    # course_prerequisites are rewritten so long-lived processes can drop caches.
+    id = Column(Integer, primary_key=True, default=1)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime
+from sqlalchemy import Column, String, Integer, DateTime, Index
 from datetime import datetime
 from db.database import Base
 
@@ -12,3 +12,9 @@ class Course(Base):
     description = Column(String, nullable=True)
     difficulty_level = Column(Integer, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+
+    # Keyset pagination of the catalog walks (difficulty_level, id)
+    __table_args__ = (
+        Index("ix_courses_difficulty_id", "difficulty_level", "id"),
+        Index("ix_courses_roadmap_difficulty_id", "roadmap_id", "difficulty_level", "id"),
+    )
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey
+from datetime import datetime
+from db.database import Base
+
+class GitHubRepoCache(Base):
+    __tablename__ = "github_repo_cache"
+
+    # Last /repos/{full_name}/languages response per user, replayed with
+    # If-None-Match so a re-sync only downloads repos that changed.
+    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    repo_full_name = Column(String, primary_key=True)
+    etag = Column(String, nullable=True)
+    languages = Column(Text, nullable=False, default="{}")  # JSON {language: bytes}
+    fetched_at = Column(DateTime, default=datetime.utcnow, nullable=False)
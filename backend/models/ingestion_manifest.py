@@ -0,0 +1,20 @@
+from sqlalchemy import Column, String, Integer, Float, DateTime, PrimaryKeyConstraint
+from datetime import datetime
+from db.database import Base
+
+class IngestionManifest(Base):
+    __tablename__ = "ingestion_manifest"
+
+    # One row per (pipeline, source file) last ingested successfully, so
+    # re-runs of the ingestion scripts can skip files that did not change.
+    pipeline = Column(String, nullable=False)  # "roadmaps" or "resources"
+    source_path = Column(String, nullable=False)
+    roadmap_id = Column(String, nullable=False, index=True)
+    content_hash = Column(String, nullable=False)  # sha256 hex
+    mtime = Column(Float, nullable=False)
+    size = Column(Integer, nullable=False)
+    ingested_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        PrimaryKeyConstraint("pipeline", "source_path"),
+    )
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, String, DateTime, PrimaryKeyConstraint
+from datetime import datetime
+from db.database import Base
+
+class IngestionPending(Base):
+    __tablename__ = "ingestion_pending"
+
+    # Roadmaps whose catalog rows were committed by an ingestion pipeline but
+    # whose derived tables (difficulty, summaries, skill edges) have not been
+    # rebuilt yet. Written with the rows, cleared once the rebuild succeeds,
+    # so a failed run is picked up by the next one.
+    pipeline = Column(String, nullable=False)  # "roadmaps" or "resources"
+    roadmap_id = Column(String, nullable=False)
+    marked_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        PrimaryKeyConstraint("pipeline", "roadmap_id"),
+    )
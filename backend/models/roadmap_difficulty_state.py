@@ -0,0 +1,13 @@
+from sqlalchemy import Column, String, Integer, DateTime
+from datetime import datetime
+from db.database import Base
+
+class RoadmapDifficultyState(Base):
+    __tablename__ = "roadmap_difficulty_state"
+
+    # Fingerprint of the course ids and prerequisite edges a roadmap's
+    # difficulty levels were last computed from; unchanged graphs are skipped.
+    roadmap_id = Column(String, primary_key=True)
+    fingerprint = Column(String, nullable=False)  # sha256 hex
+    cycle_count = Column(Integer, nullable=False, default=0)
+    computed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
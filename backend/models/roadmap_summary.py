@@ -0,0 +1,15 @@
+from sqlalchemy import Column, String, Integer, Text, DateTime
+from datetime import datetime
+from db.database import Base
+
+class RoadmapSummary(Base):
+    __tablename__ = "roadmap_summaries"
+
+    # Per-roadmap catalog aggregates, rebuilt by the ingestion scripts
+    # right before they bump the catalog version.
+    roadmap_id = Column(String, primary_key=True)
+    topic_count = Column(Integer, nullable=False, default=0)
+    difficulty_histogram = Column(Text, nullable=False, default="{}")  # JSON {difficulty_level: courses}
+    edge_count = Column(Integer, nullable=False, default=0)
+    resource_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
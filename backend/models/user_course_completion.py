@@ -0,0 +1,14 @@
+from sqlalchemy import Column, String, DateTime, ForeignKey
+from datetime import datetime
+from db.database import Base
+
+class UserCourseCompletion(Base):
+    __tablename__ = "user_course_completions"
+
+    # One row per course a user completed. The primary key makes the first
+    # completion the only one that can be inserted, so concurrent
+    # course_completed events bump user_roadmap_progress exactly once.
+    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    course_id = Column(String, primary_key=True)
+    roadmap_id = Column(String, nullable=False, index=True)
+    completed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
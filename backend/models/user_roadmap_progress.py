@@ -0,0 +1,14 @@
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey
+from datetime import datetime
+from db.database import Base
+
+class UserRoadmapProgress(Base):
+    __tablename__ = "user_roadmap_progress"
+
+    # Materialized count of user_course_completions per roadmap (i.e.
+    # COUNT(DISTINCT events.course_id) of course_completed events),
+    # maintained in the same transaction as the event insert.
+    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    roadmap_id = Column(String, primary_key=True)
+    completed_courses = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -3,11 +3,16 @@ from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.security import create_access_token, get_current_user, hash_password, verify_password
-from db.database import get_db
+from core.passwords import PasswordHasherBusy, password_hash_pool
+from core.security import create_access_token, get_current_user
+from db.database import get_async_db
 from models.user import User
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -16,20 +21,33 @@ class AuthRequest(BaseModel):
     email: str
     password: str
 
+def _password_pool_busy() -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail="Authentication is busy, please retry shortly",
+        headers={"Retry-After": "1"}
+    )
+
+async def _find_user_by_email(email: str, db: AsyncSession) -> User | None:
+    result = await db.execute(select(User).where(User.email == email).limit(1))
+    return result.scalars().first()
+
 # Signup endpoint
 @router.post("/signup")
-def signup(request: AuthRequest, db: Session = Depends(get_db)):
+async def signup(request: AuthRequest, db: AsyncSession = Depends(get_async_db)):
     # Check if user already exists
-    existing_user = db.query(User).filter(User.email == request.email).first()
+    existing_user = await _find_user_by_email(request.email, db)
     if existing_user:
         raise HTTPException(status_code=400, detail="Email already registered")
 
     # Create new user
     user_id = str(uuid.uuid4())
     try:
-        hashed_pw = hash_password(request.password)
-    except Exception as e:
-        print(f"Password hashing failed: {e}")
+        hashed_pw = await password_hash_pool.hash(request.password)
+    except PasswordHasherBusy:
+        raise _password_pool_busy()
+    except Exception:
+        logger.exception("Password hashing failed")
         raise HTTPException(status_code=500, detail="Password hashing failed")
         
     new_user = User(
@@ -40,8 +58,7 @@ def signup(request: AuthRequest, db: Session = Depends(get_db)):
     )
     
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
 
     # Generate token
     access_token = create_access_token(user_id=new_user.id)
@@ -53,10 +70,17 @@ def signup(request: AuthRequest, db: Session = Depends(get_db)):
 
 # Login endpoint
 @router.post("/login")
-def login(request: AuthRequest, db: Session = Depends(get_db)):
+async def login(request: AuthRequest, db: AsyncSession = Depends(get_async_db)):
     # Find user
-    user = db.query(User).filter(User.email == request.email).first()
-    if not user or not verify_password(request.password, user.password_hash):
+    user = await _find_user_by_email(request.email, db)
+    if not user:
+        raise HTTPException(status_code=401, detail="Invalid email or password")
+
+    try:
+        verified = await password_hash_pool.verify(request.password, user.password_hash)
+    except PasswordHasherBusy:
+        raise _password_pool_busy()
+    if not verified:
         raise HTTPException(status_code=401, detail="Invalid email or password")
 
     # Generate token
@@ -1,25 +1,83 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+import json
+import base64
+import binascii
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Session
 
 from db.database import get_db
 from models.course import Course
 from models.course_prerequisite import CoursePrerequisite
+from core.http_cache import catalog_headers, is_not_modified
+from services.catalog_version import get_catalog_state
 
 router = APIRouter()
 
 
+def encode_cursor(difficulty_level: int | None, course_id: str) -> str:
+    raw = json.dumps([difficulty_level, course_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[int | None, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        difficulty_level, course_id = json.loads(raw)
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(course_id, str) or not (difficulty_level is None or isinstance(difficulty_level, int)):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return difficulty_level, course_id
+
+
 @router.get("")
 def list_courses(
-    limit: int = Query(default=100, ge=1),
+    request: Request,
+    response: Response,
+    limit: int = Query(default=100, ge=1, le=1000),
     roadmap_id: str | None = Query(default=None),
+    cursor: str | None = Query(default=None, description="X-Next-Cursor value from the previous page"),
     db: Session = Depends(get_db),
 ) -> list[dict[str, str | int | None]]:
-    query = db.query(Course)
+    """
+    Courses ordered by (difficulty_level, id), unrated courses last.
+    When more courses follow, the X-Next-Cursor response header holds the
+    cursor for the next page.
+    """
+    headers = catalog_headers(get_catalog_state(db))
+    if is_not_modified(request, headers):
+        return Response(status_code=304, headers=headers)
+
+    query = db.query(Course.id, Course.title, Course.roadmap_id, Course.difficulty_level)
     
     if roadmap_id:
         query = query.filter(Course.roadmap_id == roadmap_id)
-    
-    courses = query.order_by(Course.difficulty_level).limit(limit).all()
+
+    # Two phases, each a range seek on (difficulty_level, id): rated courses
+    # by a row-value comparison, then the unrated tail by id. An OR across
+    # both would make the database scan the whole index on every page.
+    after_level, after_id = decode_cursor(cursor) if cursor else (None, None)
+    courses = []
+    if cursor is None or after_level is not None:
+        rated = query.filter(Course.difficulty_level.is_not(None))
+        if cursor:
+            rated = rated.filter(tuple_(Course.difficulty_level, Course.id) > tuple_(after_level, after_id))
+        # One extra row tells whether another page exists
+        courses = rated.order_by(Course.difficulty_level, Course.id).limit(limit + 1).all()
+        after_id = None
+
+    if len(courses) <= limit:
+        unrated = query.filter(Course.difficulty_level.is_(None))
+        if after_id is not None:
+            unrated = unrated.filter(Course.id > after_id)
+        courses += unrated.order_by(Course.id).limit(limit + 1 - len(courses)).all()
+
+    if len(courses) > limit:
+        courses = courses[:limit]
+        headers["X-Next-Cursor"] = encode_cursor(courses[-1].difficulty_level, courses[-1].id)
+
+    response.headers.update(headers)
     return [
         {
             "id": course.id,
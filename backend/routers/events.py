@@ -6,6 +6,8 @@ from db.database import get_db
 from models import Event, UserSkill
 from models.user import User
 from core.security import get_current_user
+from services.adaptive_score_cache import invalidate_adaptive_score
+from services.progress_service import record_course_completion
 
 router = APIRouter()
 
@@ -39,6 +41,9 @@ def create_event(payload: EventPayload, current_user: User = Depends(get_current
     db.add(event)
     db.flush()
 
+    if payload.event_type == "course_completed":
+        record_course_completion(str(current_user.id), payload.course_id, roadmap_id, db)
+
     if payload.event_type == "course_completed" and roadmap_id:
         user_skill = (
             db.query(UserSkill)
@@ -61,4 +66,8 @@ def create_event(payload: EventPayload, current_user: User = Depends(get_current
             db.add(new_skill)
 
     db.commit()
+
+    if payload.event_type == "course_completed" and roadmap_id:
+        invalidate_adaptive_score(str(current_user.id), roadmap_id)
+
     return {"status": "event received"}
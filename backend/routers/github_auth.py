@@ -1,4 +1,5 @@
 import os
+import asyncio
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException
@@ -6,10 +7,11 @@ from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
 from dotenv import load_dotenv
 
-from core.security import get_current_user, create_access_token, decode_access_token
+from core.security import get_current_user, create_access_token, decode_access_token, invalidate_principal
 from db.database import get_db
 from models.user import User
 from services import github_service
+from services.github_skill_extractor import enqueue_github_sync, latest_github_sync
 
 load_dotenv()
 
@@ -47,8 +49,9 @@ async def github_callback(code: str, state: str, db: Session = Depends(get_db)):
     # Decode the state to fetch user_id, throwing 401 on JWTError
     user_id = decode_access_token(state)
     
-    # Strictly verify user exists in local database
-    user = db.query(User).filter(User.id == user_id).first()
+    # Strictly verify user exists in local database. The session is sync, so
+    # every DB step runs in a worker thread to keep the event loop free.
+    user = await asyncio.to_thread(lambda: db.query(User).filter(User.id == user_id).first())
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -79,28 +82,49 @@ async def github_callback(code: str, state: str, db: Session = Depends(get_db)):
     if user.github_id and user.github_id != github_id:
         raise HTTPException(status_code=400, detail="GitHub already connected. Disconnect first.")
         
-    # Check if this GitHub account is already linked to another system user
-    existing_link = db.query(User).filter(User.github_id == github_id).first()
-    if existing_link and existing_link.id != user.id:
-        raise HTTPException(status_code=400, detail="GitHub account already linked to another user")
+    def link_account() -> None:
+        # Check if this GitHub account is already linked to another system user
+        existing_link = db.query(User).filter(User.github_id == github_id).first()
+        if existing_link and existing_link.id != user.id:
+            raise HTTPException(status_code=400, detail="GitHub account already linked to another user")
 
-    # Update current user record with GitHub metadata
-    user.github_id = github_id
-    user.github_username = github_username
-    user.github_access_token = access_token
-    user.github_connected_at = datetime.utcnow()
+        # Update current user record with GitHub metadata
+        user.github_id = github_id
+        user.github_username = github_username
+        user.github_access_token = access_token
+        user.github_connected_at = datetime.utcnow()
 
-    db.commit()
+        db.commit()
 
-    from services.github_skill_extractor import extract_and_store_github_skills
-    await extract_and_store_github_skills(user, db)
+    await asyncio.to_thread(link_account)
+    # A request racing the flush could have re-cached the pre-link principal.
+    # Use the decoded id: the committed user is expired and would reload here.
+    invalidate_principal(user_id)
+
+    # Crawl repos in the background; progress is reported by /auth/github/status
+    bind = db.get_bind()
+    enqueue_github_sync(user_id, lambda: Session(bind=bind))
 
     FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:5174")
     return RedirectResponse(url=f"{FRONTEND_URL}/dashboard")
 
 @router.get("/status")
 def github_status(current_user: User = Depends(get_current_user)):
+    job = latest_github_sync(current_user.id)
     return {
         "connected": current_user.github_id is not None,
-        "username": current_user.github_username
+        "username": current_user.github_username,
+        "sync": job.to_dict() if job else None
     }
+
+@router.post("/sync", status_code=202)
+async def github_sync(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+    """
+    Re-syncs GitHub skills; only repositories whose ETag changed are re-fetched.
+    """
+    if current_user.github_id is None:
+        raise HTTPException(status_code=400, detail="GitHub not connected")
+
+    bind = db.get_bind()
+    job = enqueue_github_sync(current_user.id, lambda: Session(bind=bind))
+    return job.to_dict()
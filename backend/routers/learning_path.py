@@ -1,52 +1,35 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from db.database import get_db
+from db.database import get_async_db
 from models.course import Course
-from models.course_prerequisite import CoursePrerequisite
 from models.skill_profile import SkillProfile
 from models.skill_weight import SkillWeight
 from models.user import User
 from models.user_skill import UserSkill
 from core.security import get_current_user
 from services.skill_synthesizer import get_skill_profile
+from services.roadmap_graph import CourseNode, get_compiled_graph, invalidate_compiled_graph
+from services.adaptive_score_cache import adaptive_score_cache
+import logging
 
-router = APIRouter()
-
-
-def collect_prerequisites(course_id: str, db: Session):
-    visited = set()
-    stack = [course_id]
-    result = []
+logger = logging.getLogger(__name__)
 
-    while stack:
-        current = stack.pop()
-
-        prereqs = (
-            db.query(CoursePrerequisite)
-            .filter(CoursePrerequisite.course_id == current)
-            .all()
-        )
-
-        for prereq in prereqs:
-            if prereq.prerequisite_id not in visited:
-                visited.add(prereq.prerequisite_id)
-
-                course = (
-                    db.query(Course)
-                    .filter(Course.id == prereq.prerequisite_id)
-                    .first()
-                )
-
-                if course:
-                    result.append(course)
+router = APIRouter()
 
-                stack.append(prereq.prerequisite_id)
 
-    return result
+def collect_prerequisites(course_id: str, db: Session) -> list[CourseNode]:
+    # Pure in-memory traversal of the compiled prerequisite graph
+    return get_compiled_graph(db).ancestors(course_id)
 
 
 def get_adaptive_skill_score(user_id: str, roadmap_id: str, db: Session) -> float:
+    cache_key = (str(user_id), roadmap_id)
+    cached = adaptive_score_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     # Default baseline
     BASELINE_SCORE = 800.0
 
@@ -73,8 +56,9 @@ def get_adaptive_skill_score(user_id: str, roadmap_id: str, db: Session) -> floa
     # Blend trust_score and skill_weight_score
     adaptive_score = (0.7 * trust_score) + (0.3 * normalized_skill_score)
 
-    print(f"[AdaptiveScore] user={user_id} roadmap={roadmap_id} score={adaptive_score}")
+    logger.debug("[AdaptiveScore] user=%s roadmap=%s score=%s", user_id, roadmap_id, adaptive_score)
 
+    adaptive_score_cache.set(cache_key, adaptive_score)
     return adaptive_score
 
 def get_user_elo(user_id: str, roadmap_id: str, db: Session) -> float:
@@ -90,10 +74,13 @@ def get_user_elo(user_id: str, roadmap_id: str, db: Session) -> float:
     return 800.0  # default starting ELO
 
 
-@router.get("/{course_id}")
-def get_learning_path(course_id: str, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
-    user_id = str(current_user.id)
-    target = db.query(Course).filter(Course.id == course_id).first()
+def build_learning_path(db: Session, user_id: str, course_id: str) -> dict:
+    target = get_compiled_graph(db).get(course_id)
+
+    if not target and db.query(Course.id).filter(Course.id == course_id).first():
+        # The course was added after the graph was compiled
+        invalidate_compiled_graph()
+        target = get_compiled_graph(db).get(course_id)
 
     if not target:
         raise HTTPException(status_code=404, detail="Course not found")
@@ -131,3 +118,11 @@ def get_learning_path(course_id: str, current_user: User = Depends(get_current_u
         "target_course": target.title,
         "path": path,
     }
+
+
+@router.get("/{course_id}")
+async def get_learning_path(course_id: str, current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_async_db)):
+    user_id = str(current_user.id)
+    # Graph compilation and the score lookups reuse the sync helpers; their
+    # DB round trips are awaited on the async driver instead of blocking the loop
+    return await db.run_sync(build_learning_path, user_id, course_id)
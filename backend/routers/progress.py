@@ -1,49 +1,36 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from db.database import get_db
-from models.course import Course
-from models.event import Event
+from db.database import get_async_db
 from models.user import User
 from models.user_skill import UserSkill
 from core.security import get_current_user
+from services.progress_service import get_completed_courses
+from services.roadmap_graph import get_compiled_graph
 
 router = APIRouter()
 
 
 @router.get("/{roadmap_id}")
-def get_progress(roadmap_id: str, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def get_progress(roadmap_id: str, current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_async_db)):
     user_id = str(current_user.id)
     # total courses in roadmap
-    total_courses = (
-        db.query(func.count(Course.id))
-        .filter(Course.roadmap_id == roadmap_id)
-        .scalar()
-    )
-    total_courses = total_courses or 0
+    total_courses = await db.run_sync(lambda s: get_compiled_graph(s).roadmap_size(roadmap_id))
 
-    # completed courses
-    completed_courses = (
-        db.query(func.count(func.distinct(Event.course_id)))
-        .filter(
-            Event.user_id == user_id,
-            Event.event_type == "course_completed",
-            Event.roadmap_id == roadmap_id
-        )
-        .scalar()
-    )
-    completed_courses = completed_courses or 0
+    # completed courses (materialized in user_roadmap_progress)
+    completed_courses = await db.run_sync(lambda s: get_completed_courses(user_id, roadmap_id, s))
 
     # skill data
-    skill = (
-        db.query(UserSkill)
-        .filter(
+    result = await db.execute(
+        select(UserSkill)
+        .where(
             UserSkill.user_id == user_id,
             UserSkill.skill_name == roadmap_id
         )
-        .first()
+        .limit(1)
     )
+    skill = result.scalars().first()
 
     trust_score = skill.trust_score if skill and skill.trust_score is not None else 800.0
     proficiency_level = skill.proficiency_level if skill and skill.proficiency_level is not None else 0.0
@@ -1,56 +1,76 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
-from db.database import get_db
+from db.database import get_async_db
 from models.user import User
 from core.security import get_current_user
 from services.quiz_service import evaluate_quiz_attempt
-from services.quiz_generation_service import get_or_generate_quiz
+from services.quiz_generation_service import get_or_generate_quiz, quiz_pregeneration_queue
+from services.quiz_cache import parse_quiz
+from models.course import Course
+from models.skill_quiz import SkillQuiz
 
 router = APIRouter()
 
 @router.get("/{skill_id}")
-async def read_quiz_for_skill(skill_id: str, db: Session = Depends(get_db)):
+async def read_quiz_for_skill(skill_id: str, db: AsyncSession = Depends(get_async_db)):
     quiz = await get_or_generate_quiz(skill_id, db)
     if not quiz or not quiz.questions:
         raise HTTPException(status_code=404, detail="Quiz not found")
         
     # Return questions without correct answers to prevent cheating
-    import json
-    sanitized_questions = []
-    questions = quiz.questions if quiz.questions else []
-    if isinstance(questions, str):
-        try:
-            questions = json.loads(questions)
-        except json.JSONDecodeError:
-            questions = []
-            
-    for q in questions:
-        sq = dict(q)
-        if "correct_answer" in sq:
-            del sq["correct_answer"]
-        sanitized_questions.append(sq)
-        
     return {
         "id": quiz.id,
         "skill_id": quiz.skill_id,
-        "questions": sanitized_questions,
+        "questions": parse_quiz(quiz).public_questions,
         "passing_score": quiz.passing_score
     }
 
+@router.post("/pregenerate/{roadmap_id}")
+async def pregenerate_roadmap_quizzes(
+    roadmap_id: str,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Queues background generation for every skill in the roadmap that has no quiz yet.
+    """
+    result = await db.execute(
+        select(Course.id).outerjoin(
+            SkillQuiz, SkillQuiz.skill_id == Course.id
+        ).where(
+            Course.roadmap_id == roadmap_id,
+            SkillQuiz.id == None
+        )
+    )
+    missing = list(result.scalars())
+
+    bind = db.bind
+    queued = quiz_pregeneration_queue.enqueue(
+        missing, lambda: AsyncSession(bind=bind, expire_on_commit=False)
+    )
+    return {
+        "roadmap_id": roadmap_id,
+        "queued": queued,
+        "pending": quiz_pregeneration_queue.pending()
+    }
+
 class QuizSubmission(BaseModel):
     answers: dict
 
 @router.post("/{skill_id}/submit")
-def submit_quiz_attempt(
+async def submit_quiz_attempt(
     skill_id: str, 
     submission: QuizSubmission,
     current_user: User = Depends(get_current_user), 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     try:
         user_id = str(current_user.id)
-        attempt = evaluate_quiz_attempt(user_id, skill_id, submission.answers, db)
+        attempt = await db.run_sync(
+            lambda s: evaluate_quiz_attempt(user_id, skill_id, submission.answers, s)
+        )
         return {
             "attempt_id": attempt.id,
             "skill_id": attempt.skill_id,
@@ -32,7 +32,7 @@ def get_course_resources(
     roadmap_id = course.roadmap_id or (course.id.split(":")[0] if ":" in course.id else course.id)
     adaptive_score = get_adaptive_skill_score(str(current_user.id), roadmap_id, db)
 
-    logger.info(f"[Resource Fetch API] course_id={course_id} course_title='{course.title}' adaptive_score={adaptive_score}")
+    logger.debug("[Resource Fetch API] course_id=%s course_title='%s' adaptive_score=%s", course_id, course.title, adaptive_score)
 
     # Fetch all resources tied strictly to this course
     resources = db.query(CourseResource).filter(
@@ -40,7 +40,7 @@ def get_course_resources(
     ).all()
 
     if not resources:
-        logger.info(f"[Resource Fetch API] No static resources found for course_id={course_id}.")
+        logger.debug("[Resource Fetch API] No static resources found for course_id=%s.", course_id)
         return {"primary": None, "additional": []}
 
     # Rank resources by how close their difficulty_level is to the adaptive_score
@@ -60,9 +60,10 @@ def get_course_resources(
     primary = scored_resources[0][1]
     additional = [item[1] for item in scored_resources[1:]]
     
-    logger.info(f"[Resource Fetch API Result] Returning Primary: '{primary.title}' URL: '{primary.url}'")
-    for a in additional:
-        logger.info(f"[Resource Fetch API Result] Returning Additional: '{a.title}' URL: '{a.url}'")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[Resource Fetch API Result] Returning Primary: '%s' URL: '%s'", primary.title, primary.url)
+        for a in additional:
+            logger.debug("[Resource Fetch API Result] Returning Additional: '%s' URL: '%s'", a.title, a.url)
 
     return {
         "primary": {
@@ -1,31 +1,111 @@
-from fastapi import APIRouter, UploadFile, File, Depends
+from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, Request
+from fastapi.routing import APIRoute
 from sqlalchemy.orm import Session
-import shutil
+import asyncio
+import hashlib
+import uuid
 import os
 
 from core.security import get_current_user
 from db.database import get_db
-from services.resume_parser import ingest_resume
+from services.resume_parser import enqueue_resume_ingestion, get_resume_job
+import logging
 
-router = APIRouter()
+logger = logging.getLogger(__name__)
 
 UPLOAD_DIR = "uploads/resumes"
+RESUME_MAX_BYTES = int(os.getenv("RESUME_MAX_BYTES", str(10 * 1024 * 1024)))
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+# Room for multipart boundaries and part headers around the file itself
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
 
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
-@router.post("/upload")
+
+class UploadTooLarge(Exception):
+    pass
+
+
+class ResumeRoute(APIRoute):
+    """
+    Rejects requests whose declared Content-Length is over the upload cap
+    before FastAPI parses the multipart body, which would otherwise spool
+    the whole file to disk first. save_upload still enforces the cap for
+    chunked requests that declare no length.
+    """
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def limited_handler(request: Request):
+            content_length = request.headers.get("content-length", "")
+            if content_length.isdigit() and int(content_length) > RESUME_MAX_BYTES + MULTIPART_OVERHEAD_BYTES:
+                raise HTTPException(status_code=413, detail=f"Resume exceeds {RESUME_MAX_BYTES} bytes")
+            return await handler(request)
+
+        return limited_handler
+
+
+router = APIRouter(route_class=ResumeRoute)
+
+
+def save_upload(source, user_id: str) -> tuple[str, str]:
+    """
+    Streams the upload to disk in chunks while hashing it, enforcing
+    RESUME_MAX_BYTES. Files are stored by content hash, so re-uploads of the
+    same resume land on the same path. Returns (file_path, sha256 hex).
+    """
+    digest = hashlib.sha256()
+    size = 0
+    partial_path = f"{UPLOAD_DIR}/.{uuid.uuid4()}.part"
+    try:
+        with open(partial_path, "wb") as buffer:
+            while chunk := source.read(UPLOAD_CHUNK_BYTES):
+                size += len(chunk)
+                if size > RESUME_MAX_BYTES:
+                    raise UploadTooLarge()
+                digest.update(chunk)
+                buffer.write(chunk)
+
+        content_hash = digest.hexdigest()
+        file_path = f"{UPLOAD_DIR}/{user_id}_{content_hash}.pdf"
+        os.replace(partial_path, file_path)
+        return file_path, content_hash
+    finally:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+
+
+@router.post("/upload", status_code=202)
 async def upload_resume(
     file: UploadFile = File(...),
     current_user = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    print(f"\n[ResumeAPI] Received Resume upload request from User: {current_user.id}")
-    file_path = f"{UPLOAD_DIR}/{current_user.id}_{file.filename}"
+    logger.info("[ResumeAPI] Received Resume upload request from User: %s", current_user.id)
+    user_id = str(current_user.id)
+
+    try:
+        file_path, content_hash = await asyncio.to_thread(save_upload, file.file, user_id)
+    except UploadTooLarge:
+        raise HTTPException(status_code=413, detail=f"Resume exceeds {RESUME_MAX_BYTES} bytes")
+    logger.debug("[ResumeAPI] File successfully saved to disk: %s", file_path)
+
+    bind = db.get_bind()
+    job, deduplicated = enqueue_resume_ingestion(
+        user_id, content_hash, file_path, lambda: Session(bind=bind)
+    )
 
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-        print(f"[ResumeAPI] File successfully saved to disk: {file_path}")
+    return {
+        "status": job.status,
+        "job_id": job.id,
+        "deduplicated": deduplicated
+    }
 
-    ingest_resume(file_path, str(current_user.id), db)
 
-    return {"status": "resume processed"}
+@router.get("/jobs/{job_id}")
+def read_resume_job(job_id: str, current_user = Depends(get_current_user)):
+    job = get_resume_job(str(current_user.id), job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Resume job not found")
+    return job.to_dict()
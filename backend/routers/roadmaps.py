@@ -1,29 +1,19 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from db.database import get_db
-from models.course import Course
+from core.http_cache import catalog_headers, is_not_modified
+from services.catalog_version import get_catalog_state
+from services.roadmap_summary import get_roadmap_summaries
 
 router = APIRouter()
 
 @router.get("")
-def get_roadmaps(db: Session = Depends(get_db)):
-    # Group by roadmap_id and count courses
-    # SQLite logic: group_by roadmap_id
-    
-    results = db.query(
-        Course.roadmap_id,
-        func.count(Course.id).label("topic_count")
-    ).filter(
-        Course.roadmap_id != None
-    ).group_by(
-        Course.roadmap_id
-    ).all()
-    
-    return [
-        {
-            "id": r.roadmap_id,
-            "topic_count": r.topic_count
-        }
-        for r in results
-    ]
+def get_roadmaps(request: Request, response: Response, db: Session = Depends(get_db)):
+    # Served from the in-memory summary snapshot; only a catalog version
+    # change (re-checked every CATALOG_VERSION_CHECK_SECONDS) reloads it.
+    headers = catalog_headers(get_catalog_state(db))
+    if is_not_modified(request, headers):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return get_roadmap_summaries(db).roadmaps
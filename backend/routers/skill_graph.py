@@ -1,16 +1,17 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from db.database import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from db.database import get_async_db
 from models.user import User
 from core.security import get_current_user
 from services.skill_graph_service import get_roadmap_skill_status
 from models.course import Course
-from services.skill_profile_service import get_or_create_skill_profile, initialize_skill_profile_from_cold_start
+from services.skill_profile_service import bulk_initialize_skill_profiles
 
 router = APIRouter()
 
 @router.get("/{roadmap_id}/status")
-def read_roadmap_skill_status(roadmap_id: str, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def read_roadmap_skill_status(roadmap_id: str, current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_async_db)):
     """
     Returns the unlock status (completed, unlocked, locked) 
     for all skills in the given roadmap for the active user.
@@ -18,13 +19,10 @@ def read_roadmap_skill_status(roadmap_id: str, current_user: User = Depends(get_
     user_id = str(current_user.id)
     
     # 1. Fetch all skills for roadmap
-    courses = db.query(Course.id).filter(Course.roadmap_id == roadmap_id).all()
+    result = await db.execute(select(Course.id).where(Course.roadmap_id == roadmap_id))
+    skill_ids = list(result.scalars())
     
-    # 2. & 3. For each skill, get/create profile and initialize cold start if needed
-    for course in courses:
-        skill_id = course[0]
-        profile = get_or_create_skill_profile(user_id, skill_id, roadmap_id, db)
-        if profile.quiz_confidence == 0:
-            initialize_skill_profile_from_cold_start(user_id, skill_id, db)
-            
-    return get_roadmap_skill_status(user_id, roadmap_id, db)
+    # 2. & 3. Create missing profiles and apply cold start in one batched upsert
+    await db.run_sync(lambda s: bulk_initialize_skill_profiles(user_id, roadmap_id, skill_ids, s))
+
+    return await db.run_sync(lambda s: get_roadmap_skill_status(user_id, roadmap_id, s))
@@ -1,13 +1,15 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from sqlalchemy import func, distinct
 
 from db.database import get_db
 from models.skill_profile import SkillProfile
-from models.course import Course
-from models.event import Event
 from models.user import User
 from core.security import get_current_user
+from services.progress_service import get_completed_counts
+from services.roadmap_graph import get_compiled_graph
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -17,7 +19,7 @@ def get_user_skills(current_user: User = Depends(get_current_user), db: Session
     # Query all synthesized skills for the user
     profiles = db.query(SkillProfile).filter(SkillProfile.user_id == user_id).all()
 
-    print(f"[UsersRouter] Fetching skills for {user_id}: found {len(profiles)} profiles")
+    logger.debug("[UsersRouter] Fetching skills for %s: found %d profiles", user_id, len(profiles))
 
     if not profiles:
         return {
@@ -30,24 +32,16 @@ def get_user_skills(current_user: User = Depends(get_current_user), db: Session
     # Get distinct roadmaps from the user's profiles
     roadmap_ids = list(set(p.roadmap_id for p in profiles))
 
+    graph = get_compiled_graph(db)
+    completed_counts = get_completed_counts(user_id, db)
+
     for roadmap_id in roadmap_ids:
         roadmap_profiles = [p for p in profiles if p.roadmap_id == roadmap_id]
         avg_confidence = sum(p.confidence for p in roadmap_profiles) / len(roadmap_profiles)
         avg_proficiency = sum(p.proficiency_level for p in roadmap_profiles) / len(roadmap_profiles)
 
-        # Count total courses in roadmap
-        total_courses = db.query(func.count(Course.id)) \
-            .filter(Course.roadmap_id == roadmap_id) \
-            .scalar() or 0
-
-        # Count completed courses
-        completed_courses = db.query(func.count(distinct(Event.course_id))) \
-            .filter(
-                Event.user_id == user_id,
-                Event.event_type == "course_completed",
-                Event.roadmap_id == roadmap_id
-            ) \
-            .scalar() or 0
+        total_courses = graph.roadmap_size(roadmap_id)
+        completed_courses = completed_counts.get(roadmap_id, 0)
 
         # Calculate progress percent safely
         progress_percent = round((completed_courses / total_courses) * 100, 2) if total_courses > 0 else 0.0
@@ -0,0 +1,51 @@
+import sys
+import time
+import asyncio
+import argparse
+from pathlib import Path
+
+import httpx
+
+# Add parent directory to sys.path to allow importing from backend modules
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from services import github_service
+from services.http_client import close_http_client, set_http_client
+from scripts.fake_github_server import create_fake_github_app
+
+# Compares repository language fetching at several concurrency limits against
+# the in-process fake GitHub API (no network, latency simulated per request).
+
+
+async def run(concurrency: int, repos: int, latency: float) -> None:
+    app = create_fake_github_app(repo_count=repos, latency=latency)
+    set_http_client(httpx.AsyncClient(transport=httpx.ASGITransport(app=app)))
+    github_service.GITHUB_API_URL = "http://fake-github"
+
+    started = time.perf_counter()
+    repo_list = await github_service.fetch_user_repositories("fake-token")
+    names = [r["full_name"] for r in repo_list]
+    languages = await github_service.fetch_languages_for_repositories("fake-token", names, concurrency)
+    elapsed = time.perf_counter() - started
+    await close_http_client()
+
+    print(
+        f"concurrency={concurrency:>3}  repos={len(languages):>4}  "
+        f"{elapsed:6.2f}s  {len(languages) / elapsed:7.1f} repos/s  "
+        f"requests={app.state.stats.requests}  max_in_flight={app.state.stats.max_in_flight}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark GitHub language fetching against a fake API.")
+    parser.add_argument("--repos", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated seconds per GitHub call")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8, 16])
+    args = parser.parse_args()
+
+    for concurrency in args.concurrency:
+        asyncio.run(run(concurrency, args.repos, args.latency))
+
+
+if __name__ == "__main__":
+    main()
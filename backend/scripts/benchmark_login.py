@@ -0,0 +1,110 @@
+import os
+import sys
+import time
+import asyncio
+import argparse
+from pathlib import Path
+
+# Add parent directory to sys.path to allow importing from backend modules
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from core.passwords import PasswordHasherBusy, PasswordHashPool, hash_password
+
+# Measures bcrypt verify throughput (the CPU cost of /auth/login) for each pool
+# size. With --url, drives a running server's /auth/login over HTTP instead.
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * pct / 100
+    lower = int(k)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (k - lower)
+
+
+def report(label: str, latencies: list[float], rejected: int, elapsed: float) -> None:
+    latencies.sort()
+    print(
+        f"{label:>12}  {len(latencies) / elapsed:8.1f} logins/s  "
+        f"p50={percentile(latencies, 50) * 1000:7.1f}ms  "
+        f"p99={percentile(latencies, 99) * 1000:7.1f}ms  "
+        f"rejected={rejected}"
+    )
+
+
+async def bench_pool(workers: int, requests: int, concurrency: int) -> None:
+    pool = PasswordHashPool(workers=workers, max_pending=concurrency)
+    hashed = hash_password("benchmark-password")
+    # Warm up: spawn every worker before timing
+    await asyncio.gather(*(pool.verify("benchmark-password", hashed) for _ in range(workers)))
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    rejected = 0
+
+    async def one() -> None:
+        nonlocal rejected
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await pool.verify("benchmark-password", hashed)
+            except PasswordHasherBusy:
+                rejected += 1
+                return
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    report(f"{workers} workers", latencies, rejected, time.perf_counter() - started)
+    pool.shutdown()
+
+
+async def bench_http(url: str, email: str, password: str, requests: int, concurrency: int) -> None:
+    import httpx
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    rejected = 0
+
+    async with httpx.AsyncClient(base_url=url, timeout=60.0) as client:
+        async def one() -> None:
+            nonlocal rejected
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.post("/auth/login", json={"email": email, "password": password})
+                if response.status_code == 503:
+                    rejected += 1
+                    return
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+    report("http", latencies, rejected, time.perf_counter() - started)
+
+
+def main() -> None:
+    cpu_count = os.cpu_count() or 1
+    default_workers = sorted({1, 2, 4, cpu_count} & set(range(1, cpu_count + 1)))
+
+    parser = argparse.ArgumentParser(description="Benchmark login (bcrypt verify) throughput.")
+    parser.add_argument("--workers", type=int, nargs="+", default=default_workers, help="Pool sizes to measure")
+    parser.add_argument("--requests", type=int, default=64, help="Logins per run")
+    parser.add_argument("--concurrency", type=int, default=32, help="Logins in flight")
+    parser.add_argument("--url", help="Benchmark a running server, e.g. http://localhost:8000")
+    parser.add_argument("--email", default="bench@example.com")
+    parser.add_argument("--password", default="benchmark-password")
+    args = parser.parse_args()
+
+    print(f"{cpu_count} CPUs, {args.requests} logins, concurrency {args.concurrency}")
+    if args.url:
+        asyncio.run(bench_http(args.url, args.email, args.password, args.requests, args.concurrency))
+        return
+
+    for workers in args.workers:
+        asyncio.run(bench_pool(workers, args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import re
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+# Add parent directory to sys.path to allow importing from backend modules
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from db.database import SessionLocal
+from models.course import Course
+from services.skill_matcher import SkillMatcher, build_terms
+
+# Compares the precompiled single-pass matcher against the previous
+# per-roadmap re.findall loop on synthetic resume text built from the
+# catalog vocabulary. Falls back to a synthetic catalog if the DB is empty.
+
+
+def legacy_extract(text: str, roadmap_ids: list[str]) -> dict:
+    skill_scores = {}
+    for skill in roadmap_ids:
+        occurrences = len(re.findall(r"\b" + re.escape(skill) + r"\b", text))
+        if occurrences > 0:
+            skill_scores[skill] = occurrences
+    return skill_scores
+
+
+def load_catalog(synthetic_roadmaps: int) -> tuple[list[str], list[tuple[str, str]]]:
+    with SessionLocal() as db:
+        roadmap_ids = [r[0] for r in db.query(Course.roadmap_id).distinct().all()]
+        titles = [(r[0], r[1]) for r in db.query(Course.roadmap_id, Course.title).distinct().all()]
+    if roadmap_ids:
+        return roadmap_ids, titles
+
+    roadmap_ids = [f"skill-{i}" for i in range(synthetic_roadmaps)]
+    titles = [(r, f"{r} topic {j}") for r in roadmap_ids for j in range(15)]
+    return roadmap_ids, titles
+
+
+def make_text(vocabulary: list[str], words: int, hit_rate: float, seed: int) -> str:
+    rng = random.Random(seed)
+    filler = ["experience", "with", "built", "services", "team", "led", "years", "using", "and", "the"]
+    return " ".join(
+        rng.choice(vocabulary) if rng.random() < hit_rate else rng.choice(filler)
+        for _ in range(words)
+    ).lower()
+
+
+def timed(fn, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark resume skill matching.")
+    parser.add_argument("--words", type=int, nargs="+", default=[500, 5000, 30000], help="Resume sizes in words")
+    parser.add_argument("--hit-rate", type=float, default=0.05, help="Fraction of words that are catalog terms")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--synthetic-roadmaps", type=int, default=60)
+    args = parser.parse_args()
+
+    roadmap_ids, titles = load_catalog(args.synthetic_roadmaps)
+    roadmap_ids = [r.lower() for r in roadmap_ids]
+    terms = build_terms(roadmap_ids, titles)
+
+    started = time.perf_counter()
+    matcher = SkillMatcher(terms)
+    print(f"roadmaps={len(roadmap_ids)}  terms={len(terms)}  compile={1000 * (time.perf_counter() - started):.1f}ms")
+
+    for words in args.words:
+        text = make_text(list(terms), words, args.hit_rate, seed=words)
+        legacy = timed(lambda: legacy_extract(text, roadmap_ids), args.repeat)
+        single_pass = timed(lambda: matcher.count(text), args.repeat)
+        print(
+            f"words={words:>6}  per-skill loop={1000 * legacy:8.2f}ms  "
+            f"single pass={1000 * single_pass:8.2f}ms  speedup={legacy / single_pass:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,65 +1,38 @@
 import sys
+import argparse
 from pathlib import Path
-from collections import defaultdict, deque
 
 sys.path.append(str(Path(__file__).parent.parent))
 
 from db.database import SessionLocal
-from models.course import Course
-from models.course_prerequisite import CoursePrerequisite
+from create_tables import create_tables
+from services.catalog_version import bump_catalog_version
+from services.course_difficulty import compute_course_difficulty
+from services.roadmap_summary import rebuild_roadmap_summaries
 
 
-def compute_difficulty() -> None:
+def compute_difficulty(roadmap_ids: list[str] | None = None, force: bool = False) -> None:
+    # Ensure roadmap_difficulty_state exists on databases created before it was added
+    create_tables()
+
     db = SessionLocal()
     try:
-        courses = db.query(Course).all()
-        edges = db.query(CoursePrerequisite).all()
-
-        dependents_map = defaultdict(list)
-        in_degree = defaultdict(int)
-        depth = {}
-
-        for course in courses:
-            in_degree[course.id] = 0
-
-        for edge in edges:
-            prereq = edge.prerequisite_id
-            course = edge.course_id
-            dependents_map[prereq].append(course)
-            in_degree[course] += 1
-
-        queue = deque()
-        for course in courses:
-            if in_degree[course.id] == 0:
-                queue.append(course.id)
-                depth[course.id] = 0
-
-        while queue:
-            current = queue.popleft()
-            current_depth = depth[current]
-
-            for dependent in dependents_map[current]:
-                in_degree[dependent] -= 1
-                new_depth = current_depth + 1
-                if dependent not in depth or new_depth > depth[dependent]:
-                    depth[dependent] = new_depth
-
-                if in_degree[dependent] == 0:
-                    queue.append(dependent)
-
-        for course in courses:
-            d = depth.get(course.id, 0)
-            course.difficulty_level = 800 + (d * 100)
-
-        db.commit()
-
-        print(f"Updated {len(courses)} courses")
-        print("Sample output:")
-        for course in courses[:10]:
-            print(f"{course.id} difficulty={course.difficulty_level}")
+        report = compute_course_difficulty(db, roadmap_ids, force=force)
+        if report.changed_roadmaps:
+            rebuild_roadmap_summaries(db, report.changed_roadmaps)
+            bump_catalog_version(db)
+
+        print(f"Computed {len(report.computed)} roadmaps, skipped {len(report.skipped)} unchanged")
+        print(f"Updated {report.courses_updated} courses in {len(report.changed_roadmaps)} roadmaps")
+        # Each cycle is also logged as a warning by the engine
+        print(f"Found {sum(len(c) for c in report.cycles.values())} prerequisite cycles in {len(report.cycles)} roadmaps")
     finally:
         db.close()
 
 
 if __name__ == "__main__":
-    compute_difficulty()
+    parser = argparse.ArgumentParser(description="Recompute course difficulty from prerequisite depth.")
+    parser.add_argument("--roadmap", action="append", help="Only this roadmap id (repeatable)")
+    parser.add_argument("--force", action="store_true", help="Recompute roadmaps whose graph did not change")
+    args = parser.parse_args()
+    compute_difficulty(args.roadmap, args.force)
@@ -1,160 +1,66 @@
 import os
 import sys
-import json
-import re
-from datetime import datetime
+import argparse
 
 # Setup paths to import from backend
 BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 os.chdir(BACKEND_DIR)
 sys.path.append(BACKEND_DIR)
 
-from sqlalchemy.orm import Session
 from db.database import SessionLocal
-from models.course import Course
-from models.course_resource import CourseResource
+from services.catalog_version import bump_catalog_version
+from services.ingestion_manifest import (
+    RESOURCES_PIPELINE, clear_pending, forget_missing_files, get_pending, record_files, scan_files
+)
+from services.resource_ingestion import RESOURCE_PARSE_WORKERS, collect_resource_sources, ingest_resources
+from services.roadmap_summary import rebuild_roadmap_summaries
 
 # Specific repository mapping rule instructions path
 ROADMAP_REPO_PATH = "/Users/prajwal/Documents/Roadmap/developer-roadmap"
 ROADMAPS_DIR = os.path.join(ROADMAP_REPO_PATH, "src", "data", "roadmaps")
 
-# Regex to match: - [@type@Title](URL) or - [Title](URL)
-# Includes standard markdown link matching
-LINK_PATTERN = re.compile(r'- \[(?:@([^@]+)@)?([^\]]+)\]\(([^\)]+)\)')
-
-def get_platform_from_url(url: str) -> str:
-    url_lower = url.lower()
-    if "youtube.com" in url_lower or "youtu.be" in url_lower:
-        return "youtube"
-    elif "medium.com" in url_lower:
-        return "medium"
-    elif "github.com" in url_lower:
-        return "github"
-    else:
-        return "docs"
-
-def main():
-    db: Session = SessionLocal()
-    
+def main(full: bool = False, workers: int = RESOURCE_PARSE_WORKERS):
     if not os.path.exists(ROADMAPS_DIR):
         print(f"Error: Roadmap directory not found at {ROADMAPS_DIR}")
         return
 
-    added_count = 0
-    skipped_count = 0
-
     print("Starting static resource extraction pipeline...")
+    db = SessionLocal()
+    try:
+        sources = collect_resource_sources(ROADMAPS_DIR)
+
+        # Only files that changed since the last successful run are read
+        scan = scan_files(db, RESOURCES_PIPELINE, sources.files, full=full)
+        record_files(db, RESOURCES_PIPELINE, list(scan.touched.values()))
+        forget_missing_files(db, RESOURCES_PIPELINE, set(sources.files))
+        db.commit()
+        print(f"{len(scan.changed)} changed, {len(scan.touched)} touched, {scan.unchanged} unchanged source files.")
+
+        report = ingest_resources(db, sources, scan.changed, workers)
+        for path, error in report.errors.items():
+            print(f"Warning: Failed to parse {path}: {error}")
+
+        # Includes roadmaps a previous run committed resources for but failed to finish
+        affected = get_pending(db, RESOURCES_PIPELINE)
+        if affected:
+            # Resource counts are part of the served roadmap summaries
+            rebuild_roadmap_summaries(db, affected)
+            bump_catalog_version(db)
+            clear_pending(db, RESOURCES_PIPELINE, affected)
+            db.commit()
+    finally:
+        db.close()
 
-    # Iterate roadmaps
-    for roadmap_slug in os.listdir(ROADMAPS_DIR):
-        roadmap_path = os.path.join(ROADMAPS_DIR, roadmap_slug)
-        if not os.path.isdir(roadmap_path):
-            continue
-            
-        json_file = os.path.join(roadmap_path, f"{roadmap_slug}.json")
-        content_dir = os.path.join(roadmap_path, "content")
-        
-        if not os.path.exists(json_file):
-            continue
-            
-        with open(json_file, 'r', encoding='utf-8') as f:
-            try:
-                roadmap_data = json.load(f)
-            except json.JSONDecodeError:
-                print(f"Warning: Failed to parse {json_file}")
-                continue
-                
-        # 1. Load roadmap.sh structured JSON
-        nodes = roadmap_data.get('nodes', [])
-        
-        # Build mapping of node_id -> md_file_path for quick lookup
-        file_mapping = {}
-        if os.path.exists(content_dir):
-            for filename in os.listdir(content_dir):
-                if filename.endswith(".md") and "@" in filename:
-                    node_id = filename.split("@")[-1].replace(".md", "")
-                    file_mapping[node_id] = os.path.join(content_dir, filename)
-        
-        # 2. Iterate nodes -> find node.id
-        for node in nodes:
-            node_id = node.get('id')
-            if not node_id:
-                continue
-                
-            # 3. Map to Course.id
-            course_id = f"{roadmap_slug}:{node_id}"
-            
-            course = db.query(Course).filter(Course.id == course_id).first()
-            if not course:
-                # If course doesn't exist, skip it ensuring no wrong resources
-                continue
-                
-            # 4. Open markdown file referenced by node
-            md_file = file_mapping.get(node_id)
-            if not md_file:
-                continue
-                
-            with open(md_file, 'r', encoding='utf-8') as mf:
-                content_text = mf.read()
-                
-            # 5. Extract links
-            matches = LINK_PATTERN.findall(content_text)
-            
-            is_primary = True
-            for match in matches:
-                resource_type_raw = match[0].strip() if match[0] else ""
-                title = match[1].strip()
-                url = match[2].strip()
-                
-                resource_type = "article"
-                if "video" in resource_type_raw.lower() or "youtube" in url.lower() or "youtu.be" in url.lower():
-                    resource_type = "video"
-                    
-                platform = get_platform_from_url(url)
-                
-                # Check idempotency: course_id, url
-                existing = db.query(CourseResource).filter(
-                    CourseResource.course_id == course_id,
-                    CourseResource.url == url
-                ).first()
-                
-                if existing:
-                    skipped_count += 1
-                    continue
-                    
-                # 6. Insert CourseResource safely
-                new_resource = CourseResource(
-                    course_id=course_id,
-                    resource_type=resource_type,
-                    title=title,
-                    url=url,
-                    platform=platform,
-                    difficulty_level=course.difficulty_level,
-                    quality_score=1.0,
-                    is_primary=is_primary
-                )
-                
-                # Basic youtube video ID extraction for iframes to work off embed urls
-                if platform == "youtube":
-                    vid_id = None
-                    if "v=" in url:
-                        vid_id = url.split("v=")[-1].split("&")[0]
-                    elif "youtu.be/" in url:
-                        vid_id = url.split("youtu.be/")[-1].split("?")[0]
-                        
-                    if vid_id:
-                        new_resource.youtube_video_id = vid_id
-                        
-                db.add(new_resource)
-                added_count += 1
-                is_primary = False
-                
-    db.commit()
-    db.close()
-    
     print(f"Extraction Pipeline Complete.")
-    print(f"Assigned Curated Resources: {added_count}")
-    print(f"Skipped Duplicates: {skipped_count}")
+    print(f"Parsed {report.files_parsed} markdown files in {report.parse_seconds:.2f}s with {workers} workers.")
+    print(f"Assigned Curated Resources: {report.added} ({report.rows_per_second:.0f} rows/s)")
+    print(f"Skipped Duplicates: {report.skipped}")
+    print(f"Skipped Topics Without Course: {report.missing_courses}")
+    print(f"Roadmaps with new resources: {len(report.affected_roadmaps)}")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Import curated resource links from roadmap markdown content.")
+    parser.add_argument("--full", action="store_true", help="Ignore the ingestion manifest and re-read every file")
+    parser.add_argument("--workers", type=int, default=RESOURCE_PARSE_WORKERS, help="Parser processes (1 parses in-process)")
+    args = parser.parse_args()
+    main(args.full, args.workers)
@@ -0,0 +1,129 @@
+import sys
+import asyncio
+import argparse
+from pathlib import Path
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+# Add parent directory to sys.path to allow importing from backend modules
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+# Minimal stand-in for the parts of the GitHub API the app uses. Serve it with
+#   python scripts/fake_github_server.py --port 9000
+# and point GITHUB_URL / GITHUB_API_URL at http://localhost:9000.
+
+LANGUAGES = ["Python", "JavaScript", "TypeScript", "Go", "Rust", "Java", "HTML", "CSS"]
+
+
+class FakeGitHubStats:
+    def __init__(self):
+        self.requests = 0
+        self.language_requests = 0
+        self.rate_limited = 0
+        self.not_modified = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+
+def create_fake_github_app(
+    repo_count: int = 100,
+    latency: float = 0.05,
+    rate_limit_every: int = 0,
+    retry_after: float = 1.0
+) -> FastAPI:
+    """
+    Builds the fake API. Every `rate_limit_every`-th languages request is
+    rejected once with 403 + Retry-After, like GitHub's secondary rate limit.
+    Languages carry an ETag per repo; bump app.state.versions[repo] to
+    simulate a push. Pages added to app.state.failing_repo_pages answer 502.
+    Counters are exposed on app.state.stats.
+    """
+    app = FastAPI(title="Fake GitHub API")
+    stats = FakeGitHubStats()
+    app.state.stats = stats
+    versions: dict[str, int] = {}
+    app.state.versions = versions
+    failing_repo_pages: set[int] = set()
+    app.state.failing_repo_pages = failing_repo_pages
+
+    @app.middleware("http")
+    async def count_requests(request: Request, call_next):
+        stats.requests += 1
+        stats.in_flight += 1
+        stats.max_in_flight = max(stats.max_in_flight, stats.in_flight)
+        try:
+            return await call_next(request)
+        finally:
+            stats.in_flight -= 1
+
+    @app.post("/login/oauth/access_token")
+    async def access_token():
+        return {"access_token": "fake-token", "token_type": "bearer", "scope": "read:user"}
+
+    @app.get("/user")
+    async def user():
+        return {"id": 1, "login": "fake-user"}
+
+    @app.get("/user/repos")
+    async def user_repos(request: Request, per_page: int = 30, page: int = 1):
+        await asyncio.sleep(latency)
+        if page in failing_repo_pages:
+            return JSONResponse({"message": "Server Error"}, status_code=502)
+        start = (page - 1) * per_page
+        repos = [
+            {"id": i, "name": f"repo-{i}", "full_name": f"fake-user/repo-{i}"}
+            for i in range(start, min(start + per_page, repo_count))
+        ]
+        headers = {}
+        if start + per_page < repo_count:
+            next_url = request.url.include_query_params(page=page + 1, per_page=per_page)
+            headers["Link"] = f'<{next_url}>; rel="next"'
+        return JSONResponse(repos, headers=headers)
+
+    @app.get("/repos/{owner}/{repo}/languages")
+    async def languages(request: Request, owner: str, repo: str):
+        stats.language_requests += 1
+        if rate_limit_every and stats.language_requests % rate_limit_every == 0:
+            stats.rate_limited += 1
+            return JSONResponse(
+                {"message": "You have exceeded a secondary rate limit."},
+                status_code=403,
+                headers={"Retry-After": str(retry_after), "X-RateLimit-Remaining": "0"},
+            )
+
+        version = versions.get(repo, 1)
+        etag = f'"{repo}-v{version}"'
+        if request.headers.get("if-none-match") == etag:
+            stats.not_modified += 1
+            return Response(status_code=304, headers={"ETag": etag})
+
+        await asyncio.sleep(latency)
+        index = int(repo.rsplit("-", 1)[-1]) if repo.rsplit("-", 1)[-1].isdigit() else 0
+        return JSONResponse(
+            {
+                LANGUAGES[index % len(LANGUAGES)]: 1000 * (index + version),
+                LANGUAGES[(index + 3) % len(LANGUAGES)]: 250 * (index + 1),
+            },
+            headers={"ETag": etag},
+        )
+
+    return app
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Serve a fake GitHub API for local benchmarks.")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--repos", type=int, default=100, help="Repositories returned by /user/repos")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds added to each repo/languages call")
+    parser.add_argument("--rate-limit-every", type=int, default=0, help="Reject every Nth languages call with 403")
+    args = parser.parse_args()
+
+    app = create_fake_github_app(args.repos, args.latency, args.rate_limit_every)
+    uvicorn.run(app, host="127.0.0.1", port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
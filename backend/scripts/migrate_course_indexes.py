@@ -0,0 +1,20 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from db.database import engine
+from models.course import Course
+
+
+def migrate() -> None:
+    # create_all() only adds indexes for new tables; existing databases need
+    # the catalog pagination indexes created explicitly.
+    for index in Course.__table__.indexes:
+        index.create(bind=engine, checkfirst=True)
+        print(f"Ensured index {index.name}")
+    print("Migration complete.")
+
+
+if __name__ == "__main__":
+    migrate()
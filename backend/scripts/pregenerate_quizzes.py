@@ -0,0 +1,198 @@
+import sys
+import time
+import random
+import asyncio
+import argparse
+from pathlib import Path
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+# Add parent directory to sys.path to allow importing from backend modules
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from db.database import AsyncSessionLocal, SessionLocal
+from models.course import Course
+from models.skill_quiz import SkillQuiz
+from create_tables import create_tables
+from services.quiz_cache import is_valid_quiz
+from services.quiz_generation_service import get_or_generate_quiz
+
+# Generation is idempotent per skill and every success is committed immediately,
+# so re-running after a crash simply picks up the skills that are still missing.
+
+# Backoff between retries of a skill: base * 2^attempt seconds (plus jitter), capped
+RETRY_BASE_SECONDS = 1.0
+RETRY_MAX_SECONDS = 60.0
+
+
+class RateLimiter:
+    """
+    Token bucket allowing `rate` acquisitions per second with bursts up to `burst`.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def find_skills_with_invalid_quiz(db: Session, roadmap_id: str | None = None) -> list[str]:
+    """
+    Skills whose stored quiz is_valid_quiz rejects. The stored row blocks
+    their regeneration through the unique skill_id constraint.
+    """
+    query = db.query(SkillQuiz)
+    if roadmap_id:
+        query = query.join(Course, Course.id == SkillQuiz.skill_id).filter(Course.roadmap_id == roadmap_id)
+    return sorted(quiz.skill_id for quiz in query if not is_valid_quiz(quiz))
+
+
+def remove_skill_quizzes(db: Session, skill_ids: list[str]) -> None:
+    if skill_ids:
+        db.query(SkillQuiz).filter(SkillQuiz.skill_id.in_(skill_ids)).delete(synchronize_session=False)
+        db.commit()
+
+
+def find_skills_without_quiz(db: Session, roadmap_id: str | None = None) -> list[str]:
+    query = db.query(Course.id).outerjoin(
+        SkillQuiz, SkillQuiz.skill_id == Course.id
+    ).filter(SkillQuiz.id == None)
+    if roadmap_id:
+        query = query.filter(Course.roadmap_id == roadmap_id)
+    return [row[0] for row in query.order_by(Course.id).all()]
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * pct / 100
+    lower = int(k)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (k - lower)
+
+
+async def generate_one(
+    skill_id: str,
+    limiter: RateLimiter,
+    semaphore: asyncio.Semaphore,
+    retries: int,
+    session_factory=AsyncSessionLocal
+) -> float | None:
+    """
+    Generates one skill's quiz, retrying 5xx failures with jittered
+    exponential backoff. Returns the latency of the successful attempt, or
+    None when the skill failed.
+    """
+    async with semaphore:
+        for attempt in range(retries + 1):
+            await limiter.acquire()
+            db = session_factory()
+            started = time.perf_counter()
+            try:
+                await get_or_generate_quiz(skill_id, db)
+                return time.perf_counter() - started
+            except HTTPException as e:
+                if e.status_code < 500 or attempt == retries:
+                    print(f"FAILED {skill_id}: {e.detail}")
+                    return None
+                delay = min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * 2 ** attempt) + random.uniform(0, RETRY_BASE_SECONDS)
+                print(f"Retrying {skill_id} in {delay:.1f}s ({e.detail})")
+            except Exception as e:
+                print(f"FAILED {skill_id}: {e}")
+                return None
+            finally:
+                await db.close()
+            await asyncio.sleep(delay)
+    return None
+
+
+async def pregenerate(
+    skill_ids: list[str],
+    concurrency: int,
+    rate: float,
+    retries: int,
+    session_factory=AsyncSessionLocal
+) -> list[float | None]:
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = RateLimiter(rate, burst=concurrency)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(generate_one(s, limiter, semaphore, retries, session_factory) for s in skill_ids)
+    )
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(r for r in results if r is not None)
+    failed = len(results) - len(latencies)
+
+    print("\nQuiz Pre-generation Complete.")
+    print(f"Generated {len(latencies)} quizzes, {failed} failed, in {elapsed:.1f}s")
+    if elapsed > 0:
+        print(f"Throughput: {len(latencies) / elapsed:.2f} quizzes/s")
+    print(
+        f"Latency p50={percentile(latencies, 50):.2f}s "
+        f"p90={percentile(latencies, 90):.2f}s "
+        f"p99={percentile(latencies, 99):.2f}s "
+        f"max={latencies[-1] if latencies else 0.0:.2f}s"
+    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate quizzes for every skill that does not have one yet.")
+    parser.add_argument("--roadmap", help="Only process this roadmap_id")
+    parser.add_argument("--concurrency", type=int, default=4, help="Maximum generations in flight")
+    parser.add_argument("--rate", type=float, default=2.0, help="Maximum LLM requests per second")
+    parser.add_argument("--retries", type=int, default=3, help="Retries per skill on transient failures")
+    parser.add_argument("--limit", type=int, help="Stop after this many skills")
+    parser.add_argument(
+        "--replace-invalid", action="store_true",
+        help="Delete stored quizzes that fail validation so their skills are regenerated"
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Report what would be done without changing anything")
+    args = parser.parse_args()
+
+    create_tables()
+
+    db = SessionLocal()
+    try:
+        invalid = find_skills_with_invalid_quiz(db, args.roadmap)
+        if invalid and args.replace_invalid and not args.dry_run:
+            remove_skill_quizzes(db, invalid)
+            print(f"Removed {len(invalid)} invalid quizzes")
+        elif invalid:
+            action = "would be removed" if args.replace_invalid else "kept; pass --replace-invalid to regenerate them"
+            print(f"Found {len(invalid)} invalid quizzes ({action})")
+
+        skill_ids = find_skills_without_quiz(db, args.roadmap)
+    finally:
+        db.close()
+    if args.dry_run and args.replace_invalid:
+        # Their skills would be missing a quiz once the invalid ones are removed
+        skill_ids = sorted(set(skill_ids) | set(invalid))
+    if args.limit:
+        skill_ids = skill_ids[:args.limit]
+
+    print(f"Found {len(skill_ids)} skills without a quiz.")
+    if not skill_ids or args.dry_run:
+        return
+
+    asyncio.run(pregenerate(skill_ids, args.concurrency, args.rate, args.retries))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from db.database import SessionLocal
+from create_tables import create_tables
+from services.progress_service import rebuild_roadmap_progress
+
+
+def main() -> None:
+    # Ensure the progress tables exist on databases created before they were added
+    create_tables()
+
+    db = SessionLocal()
+    try:
+        rows = rebuild_roadmap_progress(db)
+        print(f"Rebuilt user_course_completions and user_roadmap_progress: {rows} (user, roadmap) rows")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
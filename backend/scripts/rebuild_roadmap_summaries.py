@@ -0,0 +1,26 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from db.database import SessionLocal
+from create_tables import create_tables
+from services.catalog_version import bump_catalog_version
+from services.roadmap_summary import rebuild_roadmap_summaries
+
+
+def main() -> None:
+    # Ensure roadmap_summaries exists on databases created before it was added
+    create_tables()
+
+    db = SessionLocal()
+    try:
+        rows = rebuild_roadmap_summaries(db)
+        bump_catalog_version(db)
+        print(f"Rebuilt roadmap_summaries: {rows} roadmaps")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
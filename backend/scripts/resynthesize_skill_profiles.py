@@ -0,0 +1,47 @@
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from db.database import SessionLocal
+from models.skill_weight import SkillWeight
+from services.skill_synthesis_engine import synthesize_profiles
+
+# Recomputes every synthesized skill profile from skill_weights, e.g. after a
+# SOURCE_MULTIPLIERS change. Users are processed in batches, one commit each,
+# so an interrupted run can simply be restarted. Running API processes pick up
+# the new values once their adaptive score cache entries expire.
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Re-synthesize skill profiles for all (or some) users.")
+    parser.add_argument("--user", action="append", help="Only this user id (repeatable)")
+    parser.add_argument("--batch-size", type=int, default=500, help="Users per transaction")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.user:
+            user_ids = args.user
+        else:
+            user_ids = [r[0] for r in db.query(SkillWeight.user_id).distinct().order_by(SkillWeight.user_id)]
+
+        print(f"Re-synthesizing profiles for {len(user_ids)} users")
+        started = time.perf_counter()
+        profiles = 0
+        for i in range(0, len(user_ids), args.batch_size):
+            batch = user_ids[i:i + args.batch_size]
+            profiles += len(synthesize_profiles(db, batch))
+            print(f"  {min(i + args.batch_size, len(user_ids))}/{len(user_ids)} users, {profiles} profiles")
+
+        elapsed = time.perf_counter() - started
+        rate = profiles / elapsed if elapsed > 0 else 0.0
+        print(f"Done: {profiles} profiles in {elapsed:.2f}s ({rate:.0f} profiles/s)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+import os
+
+from core.cache import TTLCache
+
+# Cross-request cache for routers.learning_path.get_adaptive_skill_score,
+# keyed by (user_id, roadmap_id). Every write path that changes UserSkill or
+# SkillProfile rows must call invalidate_adaptive_score after committing.
+adaptive_score_cache = TTLCache(
+    maxsize=int(os.getenv("ADAPTIVE_SCORE_CACHE_SIZE", "10000")),
+    ttl=float(os.getenv("ADAPTIVE_SCORE_CACHE_TTL_SECONDS", "60")),
+)
+
+
+def invalidate_adaptive_score(user_id: str, roadmap_id: str | None = None) -> None:
+    """
+    Drops the cached score for one roadmap, or for every roadmap of the user
+    when roadmap_id is not known.
+    """
+    if roadmap_id is None:
+        adaptive_score_cache.discard_where(lambda key: key[0] == str(user_id))
+    else:
+        adaptive_score_cache.pop((str(user_id), roadmap_id))
+
+
+def adaptive_score_cache_stats() -> dict[str, int]:
+    return adaptive_score_cache.stats()
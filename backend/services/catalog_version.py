@@ -0,0 +1,104 @@
+import os
+import threading
+import time
+import logging
+from datetime import datetime
+from typing import Callable, NamedTuple
+
+from sqlalchemy.orm import Session
+
+from models.catalog_version import CatalogVersion
+
+logger = logging.getLogger(__name__)
+
+# How long a process trusts its last read of catalog_versions before re-checking.
+CATALOG_VERSION_CHECK_SECONDS = float(os.getenv("CATALOG_VERSION_CHECK_SECONDS", "30"))
+
+_lock = threading.Lock()
+_invalidation_hooks: list[Callable[[], None]] = []
+_known_version: int | None = None
+_known_updated_at: datetime | None = None
+_checked_at = 0.0
+
+
+class CatalogState(NamedTuple):
+    version: int
+    updated_at: datetime | None
+
+
+def register_invalidation_hook(hook: Callable[[], None]) -> None:
+    """
+    Registers a callback that drops a process-local cache built from the
+    course catalog. Hooks run whenever the catalog version changes.
+    """
+    _invalidation_hooks.append(hook)
+
+
+def invalidate_catalog_caches() -> None:
+    global _checked_at
+    _checked_at = 0.0
+    for hook in _invalidation_hooks:
+        hook()
+
+
+def _read_state(db: Session) -> CatalogState:
+    row = db.query(CatalogVersion.version, CatalogVersion.updated_at).filter(CatalogVersion.id == 1).first()
+    return CatalogState(row[0], row[1]) if row else CatalogState(0, None)
+
+
+def get_catalog_version(db: Session) -> int:
+    """
+    Returns the current catalog version, reading the database at most once
+    every CATALOG_VERSION_CHECK_SECONDS. Fires the invalidation hooks when
+    another process (e.g. an ingestion script) has bumped the version.
+    """
+    return get_catalog_state(db).version
+
+
+def get_catalog_state(db: Session) -> CatalogState:
+    """
+    Same as get_catalog_version, also returning when the catalog was last
+    rewritten (None if it never was).
+    """
+    global _known_version, _known_updated_at, _checked_at
+
+    now = time.monotonic()
+    if _known_version is not None and now - _checked_at < CATALOG_VERSION_CHECK_SECONDS:
+        return CatalogState(_known_version, _known_updated_at)
+
+    version, updated_at = _read_state(db)
+    with _lock:
+        changed = _known_version is not None and version != _known_version
+        _known_version = version
+        _known_updated_at = updated_at
+        _checked_at = now
+
+    if changed:
+        logger.info("Catalog version changed to %s, invalidating catalog caches", version)
+        for hook in _invalidation_hooks:
+            hook()
+
+    return CatalogState(version, updated_at)
+
+
+def bump_catalog_version(db: Session) -> int:
+    """
+    Marks the catalog (courses / course_prerequisites) as rewritten.
+    Called by the ingestion scripts after they commit their changes.
+    """
+    global _known_version, _known_updated_at
+
+    row = db.query(CatalogVersion).filter(CatalogVersion.id == 1).first()
+    if not row:
+        row = CatalogVersion(id=1, version=0)
+        db.add(row)
+
+    row.version = (row.version or 0) + 1
+    row.updated_at = datetime.utcnow()
+    db.commit()
+
+    with _lock:
+        _known_version = row.version
+        _known_updated_at = row.updated_at
+    invalidate_catalog_caches()
+    return row.version
@@ -0,0 +1,257 @@
+import hashlib
+import logging
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from sqlalchemy import bindparam
+from sqlalchemy.orm import Session
+
+from db.upsert import insert_for
+from models.course import Course
+from models.course_prerequisite import CoursePrerequisite
+from models.roadmap_difficulty_state import RoadmapDifficultyState
+
+logger = logging.getLogger(__name__)
+
+BASE_DIFFICULTY = 800
+DIFFICULTY_STEP = 100
+
+
+@dataclass
+class DifficultyReport:
+    computed: list[str] = field(default_factory=list)
+    # Roadmaps whose course ids and edges match the stored fingerprint
+    skipped: list[str] = field(default_factory=list)
+    # Roadmaps where at least one course's level changed
+    changed_roadmaps: list[str] = field(default_factory=list)
+    courses_updated: int = 0
+    # roadmap_id -> prerequisite cycles, each as a sorted list of course ids
+    cycles: dict[str, list[list[str]]] = field(default_factory=dict)
+
+
+class RoadmapGraph:
+    """
+    One roadmap's prerequisite graph over integer course indexes, with
+    edges prerequisite -> dependent stored as CSR arrays.
+    """
+
+    def __init__(self, course_ids: list[str], edges: list[tuple[str, str]]):
+        self.course_ids = course_ids
+        index = {course_id: i for i, course_id in enumerate(course_ids)}
+
+        pairs = sorted({
+            (index[prereq], index[course])
+            for course, prereq in edges
+            if course in index and prereq in index
+        })
+        self.edge_count = len(pairs)
+        self.offsets = array("i", [0] * (len(course_ids) + 1))
+        for source, _ in pairs:
+            self.offsets[source + 1] += 1
+        for i in range(len(course_ids)):
+            self.offsets[i + 1] += self.offsets[i]
+        self.targets = array("i", (target for _, target in pairs))
+
+    def dependents(self, node: int) -> array:
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+    def components(self) -> tuple[array, int]:
+        """
+        Strongly connected components (iterative Tarjan). Returns
+        (component index per node, component count); components come out in
+        reverse topological order.
+        """
+        n = len(self.course_ids)
+        order = array("i", [-1] * n)
+        low = array("i", [0] * n)
+        component = array("i", [-1] * n)
+        on_stack = bytearray(n)
+        stack: list[int] = []
+        counter = 0
+        count = 0
+
+        for root in range(n):
+            if order[root] != -1:
+                continue
+            work = [(root, self.offsets[root])]
+            order[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+
+            while work:
+                node, edge = work[-1]
+                if edge < self.offsets[node + 1]:
+                    work[-1] = (node, edge + 1)
+                    target = self.targets[edge]
+                    if order[target] == -1:
+                        order[target] = low[target] = counter
+                        counter += 1
+                        stack.append(target)
+                        on_stack[target] = 1
+                        work.append((target, self.offsets[target]))
+                    elif on_stack[target]:
+                        low[node] = min(low[node], order[target])
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == order[node]:
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        component[member] = count
+                        if member == node:
+                            break
+                    count += 1
+
+        return component, count
+
+    def depths(self) -> tuple[array, list[list[str]]]:
+        """
+        Longest prerequisite chain ending at each course. Courses on a
+        cycle share the depth of their cycle, which counts as one step.
+        Returns (depth per node, cycles).
+        """
+        n = len(self.course_ids)
+        component, count = self.components()
+
+        members: list[list[int]] = [[] for _ in range(count)]
+        for node in range(n):
+            members[component[node]].append(node)
+
+        # Tarjan emits components in reverse topological order
+        component_depth = array("i", [0] * count)
+        cyclic = bytearray(count)
+        for c in range(count - 1, -1, -1):
+            for node in members[c]:
+                for target in self.dependents(node):
+                    t = component[target]
+                    if t == c:
+                        cyclic[c] = 1
+                    elif component_depth[c] + 1 > component_depth[t]:
+                        component_depth[t] = component_depth[c] + 1
+
+        depth = array("i", (component_depth[component[node]] for node in range(n)))
+        cycles = [
+            sorted(self.course_ids[node] for node in members[c])
+            for c in range(count)
+            if cyclic[c]
+        ]
+        return depth, sorted(cycles)
+
+    def fingerprint(self) -> str:
+        digest = hashlib.sha256()
+        digest.update("\n".join(self.course_ids).encode())
+        digest.update(b"\0")
+        digest.update(self.offsets.tobytes())
+        digest.update(self.targets.tobytes())
+        return digest.hexdigest()
+
+
+def load_roadmap_graphs(db: Session, roadmap_ids: list[str] | None = None) -> dict[str, tuple[RoadmapGraph, dict[str, int | None]]]:
+    """
+    Loads course ids, current levels and edges with one query each and
+    groups them per roadmap: {roadmap_id: (graph, {course_id: level})}.
+    """
+    course_query = db.query(Course.id, Course.roadmap_id, Course.difficulty_level)
+    edge_query = db.query(CoursePrerequisite.course_id, CoursePrerequisite.prerequisite_id, Course.roadmap_id).join(
+        Course, Course.id == CoursePrerequisite.course_id
+    )
+    if roadmap_ids is not None:
+        course_query = course_query.filter(Course.roadmap_id.in_(roadmap_ids))
+        edge_query = edge_query.filter(Course.roadmap_id.in_(roadmap_ids))
+
+    levels: dict[str, dict[str, int | None]] = {}
+    for course_id, roadmap_id, level in course_query.order_by(Course.roadmap_id, Course.id):
+        levels.setdefault(roadmap_id, {})[course_id] = level
+
+    edges: dict[str, list[tuple[str, str]]] = {}
+    for course_id, prereq_id, roadmap_id in edge_query:
+        edges.setdefault(roadmap_id, []).append((course_id, prereq_id))
+
+    return {
+        roadmap_id: (RoadmapGraph(list(course_levels), edges.get(roadmap_id, [])), course_levels)
+        for roadmap_id, course_levels in levels.items()
+    }
+
+
+def compute_course_difficulty(db: Session, roadmap_ids: list[str] | None = None, force: bool = False) -> DifficultyReport:
+    """
+    Sets difficulty_level = 800 + 100 * (longest prerequisite chain depth)
+    for the courses of the given roadmaps (all when None). Prerequisites
+    never cross roadmaps, so each roadmap is computed on its own, and
+    roadmaps whose courses and edges match the stored fingerprint are
+    skipped unless force is set. Changed levels are written with one
+    executemany UPDATE. Commits.
+    """
+    report = DifficultyReport()
+    graphs = load_roadmap_graphs(db, roadmap_ids)
+
+    known = dict(
+        db.query(RoadmapDifficultyState.roadmap_id, RoadmapDifficultyState.fingerprint).filter(
+            RoadmapDifficultyState.roadmap_id.in_(list(graphs))
+        ).all()
+    )
+
+    updates = []
+    states = []
+    now = datetime.utcnow()
+    for roadmap_id, (graph, course_levels) in graphs.items():
+        fingerprint = graph.fingerprint()
+        if not force and known.get(roadmap_id) == fingerprint:
+            report.skipped.append(roadmap_id)
+            continue
+
+        depth, cycles = graph.depths()
+        report.computed.append(roadmap_id)
+        if cycles:
+            report.cycles[roadmap_id] = cycles
+            for cycle in cycles:
+                logger.warning("Prerequisite cycle in %s: %s", roadmap_id, " -> ".join(cycle))
+
+        changed = False
+        for i, course_id in enumerate(graph.course_ids):
+            level = BASE_DIFFICULTY + depth[i] * DIFFICULTY_STEP
+            if course_levels[course_id] != level:
+                updates.append({"b_id": course_id, "b_level": level})
+                changed = True
+        if changed:
+            report.changed_roadmaps.append(roadmap_id)
+
+        states.append({
+            "roadmap_id": roadmap_id,
+            "fingerprint": fingerprint,
+            "cycle_count": len(cycles),
+            "computed_at": now,
+        })
+
+    if updates:
+        table = Course.__table__
+        db.execute(
+            table.update().where(table.c.id == bindparam("b_id")).values(difficulty_level=bindparam("b_level")),
+            updates,
+        )
+    if states:
+        stmt = insert_for(db, RoadmapDifficultyState.__table__)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["roadmap_id"],
+            set_={
+                "fingerprint": stmt.excluded.fingerprint,
+                "cycle_count": stmt.excluded.cycle_count,
+                "computed_at": stmt.excluded.computed_at,
+            },
+        )
+        db.execute(stmt, states)
+    db.commit()
+
+    report.courses_updated = len(updates)
+    logger.info(
+        "Difficulty: %d roadmaps computed, %d skipped, %d courses updated, %d cycles",
+        len(report.computed), len(report.skipped), report.courses_updated,
+        sum(len(c) for c in report.cycles.values())
+    )
+    return report
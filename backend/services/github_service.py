@@ -1,50 +1,205 @@
+import os
+import time
+import asyncio
+import logging
+from typing import NamedTuple
+
 import httpx
 
+from services.http_client import get_http_client
+
+logger = logging.getLogger(__name__)
+
+# Point these at a local server (see scripts/fake_github_server.py) for tests and benchmarks
+GITHUB_URL = os.getenv("GITHUB_URL", "https://github.com")
+GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com")
+
+# Repository language requests in flight per user
+GITHUB_FETCH_CONCURRENCY = int(os.getenv("GITHUB_FETCH_CONCURRENCY", "8"))
+# Longest rate-limit wait we sit out before giving up on a request
+GITHUB_MAX_RATE_LIMIT_WAIT_SECONDS = float(os.getenv("GITHUB_MAX_RATE_LIMIT_WAIT_SECONDS", "30"))
+GITHUB_MAX_RETRIES = int(os.getenv("GITHUB_MAX_RETRIES", "3"))
+GITHUB_MAX_REPO_PAGES = int(os.getenv("GITHUB_MAX_REPO_PAGES", "10"))
+
+def _auth_headers(access_token: str) -> dict:
+    return {
+        "Authorization": f"Bearer {access_token}",
+        "Accept": "application/json",
+    }
+
+def rate_limit_delay(response: httpx.Response) -> float | None:
+    """
+    Returns how long GitHub asks us to wait before retrying, or None when the
+    response is not a rate-limit rejection.
+    """
+    if response.status_code not in (403, 429):
+        return None
+
+    retry_after = response.headers.get("retry-after")
+    if retry_after is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            return None
+
+    if response.headers.get("x-ratelimit-remaining") == "0":
+        reset = response.headers.get("x-ratelimit-reset")
+        try:
+            return max(0.0, float(reset) - time.time()) if reset else None
+        except ValueError:
+            return None
+    return None
+
+async def github_get(
+    url: str,
+    access_token: str,
+    params: dict | None = None,
+    headers: dict | None = None
+) -> httpx.Response:
+    """
+    GET against the GitHub API through the shared client, sleeping out
+    rate-limit windows (primary or secondary) that fit within the wait budget.
+    """
+    client = get_http_client()
+    request_headers = {**_auth_headers(access_token), **(headers or {})}
+    for attempt in range(GITHUB_MAX_RETRIES + 1):
+        response = await client.get(url, headers=request_headers, params=params)
+        delay = rate_limit_delay(response)
+        if delay is None or attempt == GITHUB_MAX_RETRIES or delay > GITHUB_MAX_RATE_LIMIT_WAIT_SECONDS:
+            return response
+        logger.warning("GitHub rate limit hit for %s, retrying in %.1fs", url, delay)
+        await asyncio.sleep(delay)
+    return response
+
 async def exchange_code_for_token(client_id: str, client_secret: str, code: str, redirect_uri: str, state: str) -> dict:
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            "https://github.com/login/oauth/access_token",
-            headers={"Accept": "application/json"},
-            data={
-                "client_id": client_id,
-                "client_secret": client_secret,
-                "code": code,
-                "redirect_uri": redirect_uri,
-                "state": state,
-            },
-        )
-        return response.json()
+    response = await get_http_client().post(
+        f"{GITHUB_URL}/login/oauth/access_token",
+        headers={"Accept": "application/json"},
+        data={
+            "client_id": client_id,
+            "client_secret": client_secret,
+            "code": code,
+            "redirect_uri": redirect_uri,
+            "state": state,
+        },
+    )
+    return response.json()
 
 async def fetch_github_profile(access_token: str) -> dict:
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            "https://api.github.com/user",
-            headers={
-                "Authorization": f"Bearer {access_token}",
-                "Accept": "application/json",
-            },
-        )
-        return response.json()
+    response = await github_get(f"{GITHUB_API_URL}/user", access_token)
+    return response.json()
+
+class RepoListing(NamedTuple):
+    repos: list
+    # False when a page failed or GITHUB_MAX_REPO_PAGES was reached with more
+    # pages left: repos missing from `repos` may still exist
+    complete: bool
+
+async def list_user_repositories(access_token: str) -> RepoListing:
+    """
+    Lists the user's repositories, following the Link: rel="next" pages, and
+    reports whether every page was read.
+    """
+    repos = []
+    url = f"{GITHUB_API_URL}/user/repos"
+    params = {"per_page": 100}
+
+    for _ in range(GITHUB_MAX_REPO_PAGES):
+        response = await github_get(url, access_token, params=params)
+        if response.status_code != 200:
+            logger.warning("Listing GitHub repos stopped at %s: HTTP %d", url, response.status_code)
+            return RepoListing(repos, False)
+        page = response.json()
+        if not isinstance(page, list):
+            return RepoListing(repos, False)
+        repos.extend(page)
+
+        next_link = response.links.get("next")
+        if not next_link:
+            return RepoListing(repos, True)
+        # The next URL already carries the query string
+        url, params = next_link["url"], None
+
+    logger.warning("Listing GitHub repos stopped after %d pages", GITHUB_MAX_REPO_PAGES)
+    return RepoListing(repos, False)
 
 async def fetch_user_repositories(access_token: str) -> list:
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            "https://api.github.com/user/repos",
-            headers={
-                "Authorization": f"Bearer {access_token}",
-                "Accept": "application/json",
-            },
-        )
-        return response.json() if response.status_code == 200 else []
+    """
+    Returns the user's repositories; see list_user_repositories for whether
+    the listing was complete.
+    """
+    return (await list_user_repositories(access_token)).repos
 
 async def fetch_repository_languages(access_token: str, repo_name: str) -> dict:
-    async with httpx.AsyncClient() as client:
-        # repo_name is expected to be "owner/repo" (full_name)
-        response = await client.get(
-            f"https://api.github.com/repos/{repo_name}/languages",
-            headers={
-                "Authorization": f"Bearer {access_token}",
-                "Accept": "application/json",
-            },
-        )
-        return response.json() if response.status_code == 200 else {}
+    # repo_name is expected to be "owner/repo" (full_name)
+    response = await github_get(f"{GITHUB_API_URL}/repos/{repo_name}/languages", access_token)
+    return response.json() if response.status_code == 200 else {}
+
+class RepoLanguages(NamedTuple):
+    # None when GitHub answered 304: the cached languages for `etag` still hold
+    languages: dict | None
+    etag: str | None
+
+async def fetch_repository_languages_if_changed(access_token: str, repo_name: str, etag: str | None) -> RepoLanguages:
+    """
+    Conditional languages request. 304 responses do not count against the
+    GitHub rate limit, so re-syncs of unchanged repos are nearly free.
+    """
+    headers = {"If-None-Match": etag} if etag else None
+    response = await github_get(f"{GITHUB_API_URL}/repos/{repo_name}/languages", access_token, headers=headers)
+    if response.status_code == 404:
+        return RepoLanguages({}, None)
+    if response.status_code != 200:
+        # 304, or a transient failure: keep whatever is cached
+        return RepoLanguages(None, etag)
+    return RepoLanguages(response.json(), response.headers.get("etag"))
+
+async def _bounded_gather(repo_names: list[str], fetch, fallback, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(repo_name: str):
+        async with semaphore:
+            try:
+                return await fetch(repo_name)
+            except httpx.HTTPError as e:
+                logger.warning("Fetching languages for %s failed: %s", repo_name, e)
+                return fallback
+
+    results = await asyncio.gather(*(run(name) for name in repo_names))
+    return dict(zip(repo_names, results))
+
+async def fetch_languages_for_repositories(
+    access_token: str,
+    repo_names: list[str],
+    concurrency: int = GITHUB_FETCH_CONCURRENCY
+) -> dict[str, dict]:
+    """
+    Fetches languages for many repositories with at most `concurrency`
+    requests in flight. Repos whose request fails map to {}.
+    """
+    return await _bounded_gather(
+        repo_names,
+        lambda name: fetch_repository_languages(access_token, name),
+        {},
+        concurrency,
+    )
+
+async def fetch_changed_repository_languages(
+    access_token: str,
+    etags: dict[str, str | None],
+    concurrency: int = GITHUB_FETCH_CONCURRENCY
+) -> dict[str, RepoLanguages]:
+    """
+    Like fetch_languages_for_repositories, but sends each repo's cached ETag.
+    Failed requests keep the cached ETag and report the repo as unchanged.
+    """
+    results = await _bounded_gather(
+        list(etags),
+        lambda name: fetch_repository_languages_if_changed(access_token, name, etags[name]),
+        None,
+        concurrency,
+    )
+    return {
+        name: result if result is not None else RepoLanguages(None, etags[name])
+        for name, result in results.items()
+    }
@@ -1,65 +1,183 @@
 from sqlalchemy.orm import Session
 from datetime import datetime
-from models.skill_weight import SkillWeight
-from services.github_service import fetch_user_repositories, fetch_repository_languages
-
-async def extract_and_store_github_skills(user, db: Session):
-
-    access_token = user.github_access_token
-
-    if not access_token:
-        return
-
-    repos = await fetch_user_repositories(access_token)
-    if not isinstance(repos, list):
-        return
+from typing import Callable, NamedTuple
+import json
+import asyncio
+import logging
+
+from db.upsert import insert_for
+from models.user import User
+from models.github_repo_cache import GitHubRepoCache
+from services.github_service import RepoLanguages, list_user_repositories, fetch_changed_repository_languages
+from services.job_runner import Job, get_job_runner
+from services.skill_weight_service import store_skill_weights
+
+logger = logging.getLogger(__name__)
+
+GITHUB_SYNC_JOB = "github_sync"
+
+class GitHubCrawl(NamedTuple):
+    # repo full name -> languages (None when unchanged since the cached ETag)
+    repos: dict[str, RepoLanguages]
+    # Whether the repo listing was read to the end; cached repos missing from
+    # an incomplete listing may still exist and must not be dropped
+    complete: bool
+
+def load_repo_etags(user_id: str, db: Session) -> dict[str, str | None]:
+    rows = db.query(GitHubRepoCache.repo_full_name, GitHubRepoCache.etag).filter(
+        GitHubRepoCache.user_id == user_id
+    ).all()
+    return {r[0]: r[1] for r in rows}
+
+async def crawl_github_languages(access_token: str, etags: dict[str, str | None]) -> GitHubCrawl:
+    """
+    Network half of the extraction: lists the user's repos and conditionally
+    re-fetches languages for each, using the cached ETags. No DB access.
+    """
+    listing = await list_user_repositories(access_token)
+
+    # Use full_name (e.g. owner/repo) for the API call
+    repo_names = [repo.get("full_name") or repo["name"] for repo in listing.repos]
+    repos = await fetch_changed_repository_languages(
+        access_token, {name: etags.get(name) for name in repo_names}
+    )
+    return GitHubCrawl(repos, listing.complete)
+
+def store_github_skills(user_id: str, crawl: GitHubCrawl, db: Session) -> dict:
+    """
+    DB half of the extraction: refreshes the repo cache from a crawl and, if
+    any repo changed, recomputes the user's GitHub skill weights. Cached repos
+    are only dropped when the crawl listed every repo.
+    """
+    summary = {"repos": len(crawl.repos), "changed": 0, "skills": 0}
+    if not crawl.repos:
+        # Listing repos failed or the account has none; keep what is cached
+        return summary
+
+    cached = {
+        row.repo_full_name: row
+        for row in db.query(GitHubRepoCache).filter(GitHubRepoCache.user_id == user_id)
+    }
+    changed = {name: result for name, result in crawl.repos.items() if result.languages is not None}
+    removed = set(cached) - set(crawl.repos) if crawl.complete else set()
+    summary["changed"] = len(changed)
+
+    if changed:
+        table = GitHubRepoCache.__table__
+        stmt = insert_for(db, table).values([
+            {
+                "user_id": user_id,
+                "repo_full_name": name,
+                "etag": result.etag,
+                "languages": json.dumps(result.languages),
+                "fetched_at": datetime.utcnow(),
+            }
+            for name, result in changed.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "repo_full_name"],
+            set_={
+                "etag": stmt.excluded.etag,
+                "languages": stmt.excluded.languages,
+                "fetched_at": stmt.excluded.fetched_at,
+            },
+        )
+        db.execute(stmt)
+
+    if removed:
+        db.query(GitHubRepoCache).filter(
+            GitHubRepoCache.user_id == user_id,
+            GitHubRepoCache.repo_full_name.in_(removed)
+        ).delete(synchronize_session=False)
+
+    if not changed and not removed and cached:
+        # Nothing moved since the last sync: the stored weights are current
+        db.commit()
+        return summary
 
     language_counts = {}
 
-    for repo in repos:
-        # Use full_name (e.g. owner/repo) for the API call
-        repo_name = repo.get("full_name") or repo["name"]
-
-        languages = await fetch_repository_languages(access_token, repo_name)
+    # Repos an incomplete listing missed still count with their cached languages
+    unlisted = {} if crawl.complete else {
+        name: RepoLanguages(None, row.etag) for name, row in cached.items() if name not in crawl.repos
+    }
+    for name, result in {**crawl.repos, **unlisted}.items():
+        languages = result.languages
+        if languages is None:
+            languages = json.loads(cached[name].languages) if name in cached else {}
         if not isinstance(languages, dict):
             continue
 
         for lang, bytes_used in languages.items():
-            language_counts[lang] = language_counts.get(lang, 0) + bytes_used
+            skill = lang.lower()
+            language_counts[skill] = language_counts.get(skill, 0) + bytes_used
 
     if not language_counts:
-        return
+        db.commit()
+        return summary
 
     total_bytes = sum(language_counts.values())
 
+    weights = {}
     for skill, bytes_used in language_counts.items():
 
         weight = bytes_used / total_bytes
 
         confidence = min(1.0, weight * 2.0)
 
-        existing = db.query(SkillWeight).filter(
-            SkillWeight.user_id == user.id,
-            SkillWeight.skill_name == skill.lower()
-        ).first()
-
-        if existing:
-            existing.weight = weight
-            existing.confidence = confidence
-            existing.last_updated = datetime.utcnow()
-        else:
-            new_skill = SkillWeight(
-                user_id=user.id,
-                skill_name=skill.lower(),
-                weight=weight,
-                confidence=confidence,
-                source="github"
-            )
-            db.add(new_skill)
-
-    db.commit()
-
-    # Automatically synthesize the skills for the user's fetched roadmaps
-    from services.skill_synthesizer import synthesize_skill_profile
-    for skill in language_counts.keys():
-        synthesize_skill_profile(user.id, skill.lower(), db)
+        weights[skill] = (weight, confidence)
+
+    # Upsert the weights and synthesize the user's skill profiles in one commit
+    store_skill_weights(user_id, weights, "github", db)
+
+    summary["skills"] = len(weights)
+    return summary
+
+async def extract_and_store_github_skills(user, db: Session) -> dict | None:
+
+    access_token = user.github_access_token
+
+    if not access_token:
+        return None
+
+    crawl = await crawl_github_languages(access_token, load_repo_etags(user.id, db))
+    return store_github_skills(user.id, crawl, db)
+
+async def run_github_sync(user_id: str, session_factory: Callable[[], Session]) -> dict | None:
+    """
+    Background job body: DB work runs in worker threads, so the event loop
+    only ever waits on GitHub.
+    """
+    def load():
+        with session_factory() as db:
+            user = db.query(User).filter(User.id == user_id).first()
+            if not user or not user.github_access_token:
+                return None, {}
+            return user.github_access_token, load_repo_etags(user_id, db)
+
+    access_token, etags = await asyncio.to_thread(load)
+    if not access_token:
+        return None
+
+    crawl = await crawl_github_languages(access_token, etags)
+
+    def store():
+        with session_factory() as db:
+            return store_github_skills(user_id, crawl, db)
+
+    summary = await asyncio.to_thread(store)
+    logger.info("GitHub sync for user %s: %s", user_id, summary)
+    return summary
+
+def enqueue_github_sync(user_id: str, session_factory: Callable[[], Session]) -> Job:
+    """
+    Starts a sync for the user unless one is already queued or running.
+    Must be called from the event loop.
+    """
+    user_id = str(user_id)
+    return get_job_runner().submit(
+        GITHUB_SYNC_JOB, user_id, lambda job: run_github_sync(user_id, session_factory)
+    )
+
+def latest_github_sync(user_id: str) -> Job | None:
+    return get_job_runner().latest(GITHUB_SYNC_JOB, str(user_id))
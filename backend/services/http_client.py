@@ -0,0 +1,58 @@
+import os
+import asyncio
+import logging
+import importlib.util
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _build_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=httpx.Timeout(float(os.getenv("HTTP_CLIENT_TIMEOUT_SECONDS", "30"))),
+        limits=httpx.Limits(
+            max_connections=int(os.getenv("HTTP_CLIENT_MAX_CONNECTIONS", "100")),
+            max_keepalive_connections=int(os.getenv("HTTP_CLIENT_MAX_KEEPALIVE", "20")),
+        ),
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Returns the app-wide pooled client, so outbound calls reuse connections
+    (and TLS sessions) instead of opening a new client per request.
+    Pooled connections belong to an event loop, so a new loop gets a new client.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = _build_client()
+        _client_loop = loop
+        logger.debug("Opened shared HTTP client (http2=%s)", HTTP2_AVAILABLE)
+    return _client
+
+
+def set_http_client(client: httpx.AsyncClient) -> None:
+    """
+    Replaces the shared client for the running loop, e.g. with one using a
+    mock or ASGI transport in tests and benchmarks.
+    """
+    global _client, _client_loop
+    _client = client
+    _client_loop = asyncio.get_running_loop()
+
+
+async def close_http_client() -> None:
+    global _client, _client_loop
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
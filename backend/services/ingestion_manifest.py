@@ -0,0 +1,169 @@
+import os
+import hashlib
+import logging
+from datetime import datetime
+from typing import NamedTuple
+
+from sqlalchemy.orm import Session
+
+from db.upsert import insert_for
+from models.ingestion_manifest import IngestionManifest
+from models.ingestion_pending import IngestionPending
+
+logger = logging.getLogger(__name__)
+
+ROADMAPS_PIPELINE = "roadmaps"
+RESOURCES_PIPELINE = "resources"
+
+
+class FileState(NamedTuple):
+    path: str
+    roadmap_id: str
+    content_hash: str
+    mtime: float
+    size: int
+
+
+class ManifestScan(NamedTuple):
+    # Files whose content differs from the last successful ingestion
+    changed: dict[str, FileState]
+    # Files with the same content but a new mtime (e.g. a fresh checkout);
+    # only their manifest rows need refreshing
+    touched: dict[str, FileState]
+    unchanged: int
+
+    @property
+    def changed_roadmaps(self) -> set[str]:
+        return {state.roadmap_id for state in self.changed.values()}
+
+
+def hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def scan_files(db: Session, pipeline: str, files: dict[str, str], full: bool = False) -> ManifestScan:
+    """
+    Compares {path: roadmap_id} against the pipeline's manifest. Files whose
+    mtime and size match are trusted without being read; the rest are hashed.
+    With full=True every file is reported as changed.
+    """
+    known = {
+        r[0]: (r[1], r[2], r[3])
+        for r in db.query(
+            IngestionManifest.source_path, IngestionManifest.content_hash,
+            IngestionManifest.mtime, IngestionManifest.size
+        ).filter(IngestionManifest.pipeline == pipeline)
+    }
+
+    changed, touched = {}, {}
+    unchanged = 0
+    for path, roadmap_id in files.items():
+        stat = os.stat(path)
+        entry = known.get(path)
+        if not full and entry is not None and entry[1] == stat.st_mtime and entry[2] == stat.st_size:
+            unchanged += 1
+            continue
+
+        state = FileState(path, roadmap_id, hash_file(path), stat.st_mtime, stat.st_size)
+        if not full and entry is not None and entry[0] == state.content_hash:
+            touched[path] = state
+        else:
+            changed[path] = state
+
+    logger.info(
+        "[%s] %d changed, %d touched, %d unchanged files", pipeline, len(changed), len(touched), unchanged
+    )
+    return ManifestScan(changed, touched, unchanged)
+
+
+def record_files(db: Session, pipeline: str, states: list[FileState]) -> None:
+    """
+    Upserts manifest rows for successfully ingested files. Does not commit,
+    so callers can record a file in the same transaction as its data.
+    """
+    if not states:
+        return
+
+    now = datetime.utcnow()
+    stmt = insert_for(db, IngestionManifest.__table__)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["pipeline", "source_path"],
+        set_={
+            "roadmap_id": stmt.excluded.roadmap_id,
+            "content_hash": stmt.excluded.content_hash,
+            "mtime": stmt.excluded.mtime,
+            "size": stmt.excluded.size,
+            "ingested_at": stmt.excluded.ingested_at,
+        },
+    )
+    db.execute(stmt, [
+        {
+            "pipeline": pipeline,
+            "source_path": state.path,
+            "roadmap_id": state.roadmap_id,
+            "content_hash": state.content_hash,
+            "mtime": state.mtime,
+            "size": state.size,
+            "ingested_at": now,
+        }
+        for state in states
+    ])
+
+
+def forget_missing_files(db: Session, pipeline: str, present: set[str]) -> int:
+    """
+    Drops manifest rows for files no longer on disk, so a file that comes
+    back is ingested again. Stored catalog rows are left alone. Does not commit.
+    """
+    stale = [
+        r[0] for r in db.query(IngestionManifest.source_path).filter(IngestionManifest.pipeline == pipeline)
+        if r[0] not in present
+    ]
+    if stale:
+        db.query(IngestionManifest).filter(
+            IngestionManifest.pipeline == pipeline,
+            IngestionManifest.source_path.in_(stale)
+        ).delete(synchronize_session=False)
+    return len(stale)
+
+
+def mark_pending(db: Session, pipeline: str, roadmap_ids: list[str]) -> None:
+    """
+    Records roadmaps whose derived tables still need rebuilding. Does not
+    commit, so callers mark a roadmap in the same transaction as its rows.
+    """
+    if not roadmap_ids:
+        return
+
+    now = datetime.utcnow()
+    stmt = insert_for(db, IngestionPending.__table__).on_conflict_do_nothing(
+        index_elements=["pipeline", "roadmap_id"]
+    )
+    db.execute(stmt, [
+        {"pipeline": pipeline, "roadmap_id": roadmap_id, "marked_at": now}
+        for roadmap_id in roadmap_ids
+    ])
+
+
+def get_pending(db: Session, pipeline: str) -> list[str]:
+    return [
+        r[0] for r in db.query(IngestionPending.roadmap_id)
+        .filter(IngestionPending.pipeline == pipeline)
+        .order_by(IngestionPending.roadmap_id)
+    ]
+
+
+def clear_pending(db: Session, pipeline: str, roadmap_ids: list[str]) -> None:
+    """
+    Drops pending marks once the derived tables of those roadmaps were
+    rebuilt. Does not commit.
+    """
+    if roadmap_ids:
+        db.query(IngestionPending).filter(
+            IngestionPending.pipeline == pipeline,
+            IngestionPending.roadmap_id.in_(roadmap_ids)
+        ).delete(synchronize_session=False)
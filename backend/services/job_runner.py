@@ -0,0 +1,168 @@
+import os
+import uuid
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+# Job bodies receive their Job so they can report progress
+JobFn = Callable[["Job"], Awaitable[Any]]
+
+
+@dataclass
+class Job:
+    kind: str
+    key: str
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    status: str = "queued"  # queued | running | succeeded | failed
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    error: str | None = None
+    progress: Any = None
+    result: Any = None
+
+    @property
+    def active(self) -> bool:
+        return self.status in ("queued", "running")
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+            "progress": self.progress,
+            "result": self.result,
+        }
+
+
+class JobRunner(ABC):
+    """
+    Interface for background jobs. Jobs are identified by (kind, key), e.g.
+    ("github_sync", user_id); submitting while one is still active returns it.
+    """
+
+    @abstractmethod
+    def submit(self, kind: str, key: str, fn: JobFn) -> Job:
+        ...
+
+    @abstractmethod
+    def get(self, job_id: str) -> Job | None:
+        ...
+
+    @abstractmethod
+    def latest(self, kind: str, key: str) -> Job | None:
+        ...
+
+    async def stop(self) -> None:
+        pass
+
+
+class InProcessJobRunner(JobRunner):
+    """
+    Runs jobs as asyncio tasks on the current event loop, at most
+    `concurrency` at a time. Job state lives in this process only and is lost
+    on restart; a queue-backed runner can replace it via set_job_runner.
+    """
+
+    def __init__(self, concurrency: int = 4, history: int = 1000):
+        self.concurrency = concurrency
+        self.history = history
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._latest: dict[tuple[str, str], str] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def submit(self, kind: str, key: str, fn: JobFn) -> Job:
+        """
+        Must be called from the event loop.
+        """
+        current = self.latest(kind, key)
+        if current is not None and current.active:
+            return current
+
+        job = Job(kind=kind, key=key)
+        self._jobs[job.id] = job
+        self._latest[(kind, key)] = job.id
+        self._prune()
+
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._loop = loop
+        task = asyncio.create_task(self._run(job, fn))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    async def _run(self, job: Job, fn: JobFn) -> None:
+        async with self._semaphore:
+            job.status = "running"
+            job.started_at = datetime.utcnow()
+            try:
+                job.result = await fn(job)
+                job.status = "succeeded"
+            except asyncio.CancelledError:
+                job.status = "failed"
+                job.error = "cancelled"
+                raise
+            except Exception as e:
+                logger.exception("Job %s (%s:%s) failed", job.id, job.kind, job.key)
+                job.status = "failed"
+                job.error = str(e) or type(e).__name__
+            finally:
+                job.finished_at = datetime.utcnow()
+
+    def _prune(self) -> None:
+        # Drop the oldest finished jobs once history is exceeded
+        for job_id in list(self._jobs):
+            if len(self._jobs) <= self.history:
+                break
+            job = self._jobs[job_id]
+            if job.active:
+                continue
+            del self._jobs[job_id]
+            if self._latest.get((job.kind, job.key)) == job_id:
+                del self._latest[(job.kind, job.key)]
+
+    def get(self, job_id: str) -> Job | None:
+        return self._jobs.get(job_id)
+
+    def latest(self, kind: str, key: str) -> Job | None:
+        job_id = self._latest.get((kind, key))
+        return self._jobs.get(job_id) if job_id else None
+
+    async def join(self) -> None:
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    async def stop(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*list(self._tasks), return_exceptions=True)
+        self._tasks.clear()
+        self._semaphore = None
+        self._loop = None
+
+
+_job_runner: JobRunner = InProcessJobRunner(
+    concurrency=int(os.getenv("JOB_RUNNER_CONCURRENCY", "4"))
+)
+
+
+def get_job_runner() -> JobRunner:
+    return _job_runner
+
+
+def set_job_runner(runner: JobRunner) -> None:
+    global _job_runner
+    _job_runner = runner
@@ -0,0 +1,103 @@
+import os
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+
+import pdfplumber
+
+logger = logging.getLogger(__name__)
+
+# Kept free of app imports: spawned pool workers import this module on startup.
+
+RESUME_MAX_PAGES = int(os.getenv("RESUME_MAX_PAGES", "20"))
+RESUME_MAX_CHARS = int(os.getenv("RESUME_MAX_CHARS", "200000"))
+# Pages handed to one worker call; progress is reported per chunk
+PDF_PAGES_PER_TASK = int(os.getenv("PDF_PAGES_PER_TASK", "4"))
+
+_executor: ProcessPoolExecutor | None = None
+
+
+def count_pages(file_path: str) -> int:
+    with pdfplumber.open(file_path) as pdf:
+        return len(pdf.pages)
+
+
+def extract_page_range(file_path: str, start: int, stop: int, max_chars: int) -> str:
+    """
+    Extracts text of pages [start, stop), stopping once max_chars is reached.
+    """
+    parts = []
+    size = 0
+    with pdfplumber.open(file_path) as pdf:
+        for page in pdf.pages[start:stop]:
+            text = page.extract_text() or ""
+            parts.append(text)
+            size += len(text)
+            page.close()  # frees the page's parsed layout right away
+            if size >= max_chars:
+                break
+    return "".join(parts)[:max_chars]
+
+
+def extract_text(file_path: str, max_pages: int = RESUME_MAX_PAGES, max_chars: int = RESUME_MAX_CHARS) -> str:
+    """
+    In-process, page-by-page extraction with the same caps as the pool path.
+    """
+    return extract_page_range(file_path, 0, max_pages, max_chars)
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=int(os.getenv("PDF_PARSE_WORKERS", "2")),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+async def extract_text_in_pool(
+    file_path: str,
+    max_pages: int = RESUME_MAX_PAGES,
+    max_chars: int = RESUME_MAX_CHARS,
+    on_progress: Callable[[int, int], None] | None = None
+) -> str:
+    """
+    Parses the PDF in a process pool, PDF_PAGES_PER_TASK pages per call, and
+    joins the chunks in page order. on_progress(pages_done, pages_total) is
+    called on the event loop as chunks finish.
+    """
+    loop = asyncio.get_running_loop()
+    executor = _get_executor()
+
+    total = min(max_pages, await loop.run_in_executor(executor, count_pages, file_path))
+    if on_progress:
+        on_progress(0, total)
+
+    ranges = [(start, min(start + PDF_PAGES_PER_TASK, total)) for start in range(0, total, PDF_PAGES_PER_TASK)]
+    futures = [
+        loop.run_in_executor(executor, extract_page_range, file_path, start, stop, max_chars)
+        for start, stop in ranges
+    ]
+
+    done = 0
+
+    async def track(future, pages: int) -> str:
+        nonlocal done
+        text = await future
+        done += pages
+        if on_progress:
+            on_progress(done, total)
+        return text
+
+    chunks = await asyncio.gather(*(track(f, stop - start) for f, (start, stop) in zip(futures, ranges)))
+    return "".join(chunks)[:max_chars]
+
+
+def shutdown_pdf_pool() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,139 @@
+import logging
+from datetime import datetime
+
+from sqlalchemy import func, insert, select, delete, literal
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from db.upsert import insert_for
+from models.event import Event
+from models.user_course_completion import UserCourseCompletion
+from models.user_roadmap_progress import UserRoadmapProgress
+
+logger = logging.getLogger(__name__)
+
+
+def record_course_completion(user_id: str, course_id: str, roadmap_id: str, db: Session) -> bool:
+    """
+    Records a completed course and counts it towards the user's roadmap
+    progress, once: the completion row is inserted with ON CONFLICT DO
+    NOTHING and the counter only moves when a row was inserted, so repeated
+    or concurrent course_completed events count a course a single time.
+    Does not commit: call it in the same transaction as the event insert.
+    Returns whether this was the first completion.
+    """
+    stmt = insert_for(db, UserCourseCompletion.__table__).values(
+        user_id=user_id,
+        course_id=course_id,
+        roadmap_id=roadmap_id,
+        completed_at=datetime.utcnow(),
+    ).on_conflict_do_nothing(index_elements=["user_id", "course_id"])
+    if db.execute(stmt).rowcount == 0:
+        return False
+
+    increment_completed_courses(user_id, roadmap_id, db)
+    return True
+
+
+def increment_completed_courses(user_id: str, roadmap_id: str, db: Session) -> None:
+    """
+    Adds one completed course to the user's roadmap progress. Use
+    record_course_completion, which guarantees it runs once per course.
+    """
+    table = UserRoadmapProgress.__table__
+    stmt = insert_for(db, table).values(
+        user_id=user_id,
+        roadmap_id=roadmap_id,
+        completed_courses=1,
+        updated_at=datetime.utcnow(),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id", "roadmap_id"],
+        set_={
+            "completed_courses": table.c.completed_courses + 1,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    db.execute(stmt)
+
+
+def get_completed_courses(user_id: str, roadmap_id: str, db: Session) -> int:
+    row = db.query(UserRoadmapProgress.completed_courses).filter(
+        UserRoadmapProgress.user_id == user_id,
+        UserRoadmapProgress.roadmap_id == roadmap_id
+    ).first()
+    return row[0] if row else 0
+
+
+def get_completed_counts(user_id: str, db: Session) -> dict[str, int]:
+    rows = db.query(UserRoadmapProgress.roadmap_id, UserRoadmapProgress.completed_courses).filter(
+        UserRoadmapProgress.user_id == user_id
+    ).all()
+    return {r[0]: r[1] for r in rows}
+
+
+def rebuild_roadmap_progress(db: Session) -> int:
+    """
+    Reconciles user_course_completions and user_roadmap_progress from the
+    events log in one transaction. Returns the number of (user, roadmap)
+    rows written.
+    """
+    completions = (
+        select(
+            Event.user_id,
+            Event.course_id,
+            func.min(Event.roadmap_id),
+            func.min(Event.created_at),
+        )
+        .where(
+            Event.event_type == "course_completed",
+            Event.course_id.is_not(None),
+            Event.roadmap_id.is_not(None),
+        )
+        .group_by(Event.user_id, Event.course_id)
+    )
+    counts = (
+        select(
+            UserCourseCompletion.user_id,
+            UserCourseCompletion.roadmap_id,
+            func.count(),
+            literal(datetime.utcnow()),
+        )
+        .group_by(UserCourseCompletion.user_id, UserCourseCompletion.roadmap_id)
+    )
+
+    db.execute(delete(UserCourseCompletion))
+    db.execute(
+        insert(UserCourseCompletion).from_select(
+            ["user_id", "course_id", "roadmap_id", "completed_at"], completions
+        )
+    )
+    db.execute(delete(UserRoadmapProgress))
+    result = db.execute(
+        insert(UserRoadmapProgress).from_select(
+            ["user_id", "roadmap_id", "completed_courses", "updated_at"], counts
+        )
+    )
+    db.commit()
+    return result.rowcount
+
+
+def backfill_roadmap_progress(db: Session) -> bool:
+    """
+    Rebuilds progress once on databases whose events predate
+    user_course_completions: when that table is empty but completion events
+    exist. Costs two indexed lookups otherwise. Returns whether it rebuilt.
+    """
+    if db.query(UserCourseCompletion.user_id).first() is not None:
+        return False
+    if db.query(Event.id).filter(Event.event_type == "course_completed").first() is None:
+        return False
+
+    try:
+        rows = rebuild_roadmap_progress(db)
+    except IntegrityError:
+        # Another worker backfilled concurrently
+        db.rollback()
+        return False
+    logger.info("Backfilled roadmap progress for %d (user, roadmap) rows", rows)
+    return True
@@ -0,0 +1,88 @@
+import os
+import json
+import logging
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
+
+from core.cache import TTLCache
+from models.skill_quiz import SkillQuiz
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ParsedQuiz:
+    """
+    Decoded form of SkillQuiz.questions. Shared between requests, so callers
+    must treat every field (including the nested question dicts) as read-only.
+    """
+    questions: tuple[dict, ...]
+    # Questions without correct_answer, ready to be returned to clients
+    public_questions: tuple[dict, ...]
+    # question id -> correct answer, both as strings
+    answer_key: Mapping[str, str]
+
+
+# Generated quizzes always have this many questions; stored quizzes with a
+# different count are incomplete and get regenerated
+QUIZ_QUESTION_COUNT = 4
+
+# Quizzes are immutable once stored, so (id, created_at) identifies a version
+# and entries never need to expire.
+_parsed_quizzes = TTLCache(maxsize=int(os.getenv("PARSED_QUIZ_CACHE_SIZE", "2048")), ttl=None)
+
+
+def question_id(question: dict, index: int) -> str:
+    # Generated questions carry no id; clients then answer with "q<index>"
+    qid = question.get("id")
+    return str(qid) if qid is not None else f"q{index}"
+
+
+def _decode_questions(raw) -> list[dict]:
+    if isinstance(raw, str):
+        try:
+            raw = json.loads(raw)
+        except json.JSONDecodeError:
+            logger.warning("Stored quiz questions are not valid JSON")
+            return []
+    return list(raw) if raw else []
+
+
+def parse_quiz(quiz: SkillQuiz) -> ParsedQuiz:
+    """
+    Returns the parsed questions, public payload and answer key for a quiz,
+    decoding the stored JSON at most once per quiz version.
+    """
+    key = (quiz.id, quiz.created_at)
+    parsed = _parsed_quizzes.get(key)
+    if parsed is not None:
+        return parsed
+
+    questions = tuple(dict(q) for q in _decode_questions(quiz.questions))
+    public_questions = tuple(
+        {k: v for k, v in q.items() if k != "correct_answer"}
+        for q in questions
+    )
+    answer_key = MappingProxyType({
+        question_id(q, i): str(q.get("correct_answer"))
+        for i, q in enumerate(questions)
+    })
+
+    parsed = ParsedQuiz(questions, public_questions, answer_key)
+    _parsed_quizzes.set(key, parsed)
+    return parsed
+
+
+def is_valid_quiz(quiz: SkillQuiz) -> bool:
+    return len(parse_quiz(quiz).questions) == QUIZ_QUESTION_COUNT
+
+
+def grade_answers(parsed: ParsedQuiz, answers: dict) -> int:
+    """
+    Returns how many submitted answers match the answer key.
+    """
+    return sum(
+        1 for qid, correct in parsed.answer_key.items()
+        if str(answers.get(qid)) == correct
+    )
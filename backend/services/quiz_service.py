@@ -1,9 +1,16 @@
+import json
+import uuid
+from sqlalchemy import and_, exists
 from sqlalchemy.orm import Session
 from models.skill_quiz import SkillQuiz
 from models.quiz_attempt import QuizAttempt
 from models.event import Event
 from models.course import Course
-from services.skill_profile_service import update_skill_profile_from_quiz
+from models.skill_profile import SkillProfile
+from services.skill_profile_service import apply_quiz_signal, create_skill_profile_if_missing
+from services.progress_service import record_course_completion
+from services.quiz_cache import parse_quiz, grade_answers
+from services.adaptive_score_cache import invalidate_adaptive_score
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,37 +22,42 @@ def evaluate_quiz_attempt(user_id: str, skill_id: str, answers: dict, db: Sessio
     """
     Evaluates a user's quiz attempt, calculates score, and saves the attempt.
     If passed, emits a 'course_completed' event.
+    Everything is written in a single transaction with one commit.
     """
-    quiz = get_quiz_for_skill(skill_id, db)
-    if not quiz:
+    # Load quiz, course, profile and completion state in one round trip
+    already_completed = exists().where(
+        Event.user_id == user_id,
+        Event.event_type == "course_completed",
+        Event.course_id == skill_id
+    )
+    row = db.query(SkillQuiz, Course, SkillProfile, already_completed.label("already_completed")) \
+        .outerjoin(Course, Course.id == SkillQuiz.skill_id) \
+        .outerjoin(SkillProfile, and_(
+            SkillProfile.user_id == user_id,
+            SkillProfile.skill_id == SkillQuiz.skill_id
+        )) \
+        .filter(SkillQuiz.skill_id == skill_id) \
+        .first()
+
+    if not row:
         raise ValueError(f"Quiz not found for skill: {skill_id}")
 
-    # Assuming quiz.questions is a list of dicts: {"id": "q1", "correct_answer": "A"}
-    # And answers is a dict mapping question ids to user's answer: {"q1": "A"}
-    import json
-    questions = quiz.questions if quiz.questions else []
-    if isinstance(questions, str):
-        try:
-            questions = json.loads(questions)
-        except json.JSONDecodeError:
-            questions = []
-            
-    total_questions = len(questions)
+    quiz, course, profile, completed = row
+
+    # answers is a dict mapping question ids to user's answer: {"q1": "A"}
+    parsed = parse_quiz(quiz)
+    total_questions = len(parsed.questions)
     
     if total_questions == 0:
         score = 100.0
         passed = True
     else:
-        correct_count = 0
-        for q in questions:
-            q_id = str(q.get("id"))
-            if str(answers.get(q_id)) == str(q.get("correct_answer")):
-                correct_count += 1
-                
+        correct_count = grade_answers(parsed, answers)
         score = (correct_count / total_questions) * 100.0
         passed = score >= quiz.passing_score
         
     attempt = QuizAttempt(
+        id=str(uuid.uuid4()),
         user_id=user_id,
         skill_id=skill_id,
         score=score,
@@ -53,29 +65,15 @@ def evaluate_quiz_attempt(user_id: str, skill_id: str, answers: dict, db: Sessio
         answers=json.dumps(answers) if isinstance(answers, dict) else answers
     )
     db.add(attempt)
-    db.flush() # Flush to get attempt.id if needed
     
-    # We need the course to get roadmap_id
-    course = db.query(Course).filter(Course.id == skill_id).first()
     if course:
         # As per integration instructions, update adaptive profile securely
-        update_skill_profile_from_quiz(
-            user_id=user_id,
-            skill_id=skill_id,
-            quiz_score=score,
-            roadmap_id=course.roadmap_id,
-            db=db
-        )
+        if profile is None:
+            profile = create_skill_profile_if_missing(user_id, skill_id, course.roadmap_id, db)
+        apply_quiz_signal(profile, score)
     
-    if passed:
-        # Check if they already have a completed event to avoid duplicates
-        existing_event = db.query(Event).filter(
-            Event.user_id == user_id,
-            Event.event_type == "course_completed",
-            Event.course_id == skill_id
-        ).first()
-        
-        if not existing_event and course:
+        # Avoid duplicate completion events
+        if passed and not completed:
             event = Event(
                 user_id=user_id,
                 event_type="course_completed",
@@ -84,7 +82,13 @@ def evaluate_quiz_attempt(user_id: str, skill_id: str, answers: dict, db: Sessio
                 payload=json.dumps({"score": score, "attempt_id": attempt.id})
             )
             db.add(event)
-                
+            record_course_completion(user_id, skill_id, course.roadmap_id, db)
+
+    db.flush()
+    # Detach so the committed attempt can be returned without a refresh query
+    db.expunge(attempt)
     db.commit()
-    db.refresh(attempt)
+
+    if course:
+        invalidate_adaptive_score(user_id, course.roadmap_id)
     return attempt
@@ -0,0 +1,232 @@
+import os
+import json
+import time
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
+from models.course import Course
+from models.course_resource import CourseResource
+from services.ingestion_manifest import RESOURCES_PIPELINE, FileState, mark_pending, record_files
+from services.roadmap_parsing import ResourceLink, try_parse_resource_file
+
+logger = logging.getLogger(__name__)
+
+RESOURCE_PARSE_WORKERS = int(os.getenv("RESOURCE_PARSE_WORKERS", str(os.cpu_count() or 1)))
+# Spawning workers costs about a second; a full roadmap.sh checkout (~2k small
+# files) parses in-process in well under that, so the pool only pays off beyond this.
+RESOURCE_POOL_MIN_FILES = int(os.getenv("RESOURCE_POOL_MIN_FILES", "10000"))
+
+
+@dataclass
+class ResourceSources:
+    # roadmap_id -> (roadmap JSON path, {node_id: markdown path})
+    roadmaps: dict[str, tuple[str, dict[str, str]]] = field(default_factory=dict)
+    # every source file -> roadmap_id, for the ingestion manifest
+    files: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class ResourceIngestionReport:
+    files_parsed: int = 0
+    added: int = 0
+    skipped: int = 0
+    missing_courses: int = 0
+    affected_roadmaps: list[str] = field(default_factory=list)
+    errors: dict[str, str] = field(default_factory=dict)
+    parse_seconds: float = 0.0
+    write_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.added / self.write_seconds if self.write_seconds > 0 else 0.0
+
+
+def collect_resource_sources(roadmaps_dir: str) -> ResourceSources:
+    """
+    Finds <roadmap>/<roadmap>.json and its content/*@<node_id>.md files.
+    """
+    sources = ResourceSources()
+    for roadmap_slug in sorted(os.listdir(roadmaps_dir)):
+        roadmap_path = os.path.join(roadmaps_dir, roadmap_slug)
+        if not os.path.isdir(roadmap_path):
+            continue
+
+        json_file = os.path.join(roadmap_path, f"{roadmap_slug}.json")
+        content_dir = os.path.join(roadmap_path, "content")
+        if not os.path.exists(json_file):
+            continue
+
+        # Build mapping of node_id -> md_file_path for quick lookup
+        file_mapping = {}
+        if os.path.exists(content_dir):
+            for filename in os.listdir(content_dir):
+                if filename.endswith(".md") and "@" in filename:
+                    node_id = filename.split("@")[-1].replace(".md", "")
+                    file_mapping[node_id] = os.path.join(content_dir, filename)
+
+        sources.roadmaps[roadmap_slug] = (json_file, file_mapping)
+        sources.files[json_file] = roadmap_slug
+        for md_file in file_mapping.values():
+            sources.files[md_file] = roadmap_slug
+    return sources
+
+
+def parse_resource_files(paths: list[str], workers: int = RESOURCE_PARSE_WORKERS) -> tuple[dict[str, list[ResourceLink]], dict[str, str]]:
+    """
+    Parses markdown files in a process pool when there are at least
+    RESOURCE_POOL_MIN_FILES of them and workers > 1, in-process otherwise.
+    Returns ({path: links}, {path: error}).
+    """
+    if workers > 1 and len(paths) >= max(2, RESOURCE_POOL_MIN_FILES):
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(paths)),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            # Content files are small: batch them to keep IPC overhead down
+            results = list(executor.map(try_parse_resource_file, paths, chunksize=32))
+    else:
+        results = [try_parse_resource_file(path) for path in paths]
+
+    links: dict[str, list[ResourceLink]] = {}
+    errors: dict[str, str] = {}
+    for path, (file_links, error) in zip(paths, results):
+        if error is not None:
+            errors[path] = error
+        else:
+            links[path] = file_links
+    return links, errors
+
+
+def ingest_resources(
+    db: Session,
+    sources: ResourceSources,
+    changed: dict[str, FileState],
+    workers: int = RESOURCE_PARSE_WORKERS
+) -> ResourceIngestionReport:
+    """
+    Imports the links of changed markdown files (every file of a roadmap
+    whose JSON changed) with two preload queries, parallel parsing and one
+    bulk insert. Links already stored for a course are skipped; the first
+    new link of a file is marked primary. Manifest rows for the ingested
+    files are committed with the resources, and so are pending marks for
+    the affected roadmaps. Files whose course does not exist yet stay
+    unrecorded, so they are retried on the next run.
+    """
+    report = ResourceIngestionReport()
+    settled: list[FileState] = []
+    # (roadmap_id, course_id, markdown path) to import, in roadmap/node order
+    targets: list[tuple[str, str, str]] = []
+
+    for roadmap_slug, (json_file, file_mapping) in sources.roadmaps.items():
+        json_changed = json_file in changed
+        if not json_changed and not any(md_file in changed for md_file in file_mapping.values()):
+            continue
+
+        try:
+            with open(json_file, "r", encoding="utf-8") as f:
+                nodes = json.load(f).get("nodes", [])
+        except (OSError, ValueError, AttributeError) as e:
+            report.errors[json_file] = f"{type(e).__name__}: {e}"
+            continue
+        if json_changed:
+            settled.append(changed[json_file])
+
+        mapped_files = set()
+        for node in nodes:
+            node_id = node.get("id")
+            md_file = file_mapping.get(node_id) if node_id else None
+            if not md_file:
+                continue
+            mapped_files.add(md_file)
+            # Unchanged files were ingested already unless the roadmap JSON changed
+            if json_changed or md_file in changed:
+                targets.append((roadmap_slug, f"{roadmap_slug}:{node_id}", md_file))
+
+        # Markdown files no node points at have nothing to ingest
+        settled += [
+            changed[md_file] for md_file in file_mapping.values()
+            if md_file in changed and md_file not in mapped_files
+        ]
+
+    if not targets:
+        record_files(db, RESOURCES_PIPELINE, settled)
+        db.commit()
+        return report
+
+    started = time.perf_counter()
+    roadmap_ids = sorted({roadmap_id for roadmap_id, _, _ in targets})
+    course_levels = dict(
+        db.query(Course.id, Course.difficulty_level).filter(Course.roadmap_id.in_(roadmap_ids)).all()
+    )
+    stored = set(
+        db.query(CourseResource.course_id, CourseResource.url)
+        .join(Course, Course.id == CourseResource.course_id)
+        .filter(Course.roadmap_id.in_(roadmap_ids))
+        .all()
+    )
+    preload_seconds = time.perf_counter() - started
+
+    # If course doesn't exist, skip it ensuring no wrong resources
+    present = [t for t in targets if t[1] in course_levels]
+    report.missing_courses = len(targets) - len(present)
+
+    started = time.perf_counter()
+    links, errors = parse_resource_files(sorted({md_file for _, _, md_file in present}), workers)
+    report.errors.update(errors)
+    report.files_parsed = len(links)
+    report.parse_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    now = datetime.utcnow()
+    rows = []
+    affected = set()
+    for roadmap_id, course_id, md_file in present:
+        if md_file not in links:
+            continue
+
+        is_primary = True
+        for link in links[md_file]:
+            # Check idempotency: course_id, url
+            if (course_id, link.url) in stored:
+                report.skipped += 1
+                continue
+            stored.add((course_id, link.url))
+
+            rows.append({
+                "course_id": course_id,
+                "resource_type": link.resource_type,
+                "title": link.title,
+                "url": link.url,
+                "platform": link.platform,
+                "difficulty_level": course_levels[course_id],
+                "quality_score": 1.0,
+                "is_primary": is_primary,
+                "youtube_video_id": link.youtube_video_id,
+                "created_at": now,
+                "generated_at": now,
+            })
+            affected.add(roadmap_id)
+            is_primary = False
+
+        if md_file in changed:
+            settled.append(changed[md_file])
+
+    if rows:
+        db.execute(CourseResource.__table__.insert(), rows)
+        mark_pending(db, RESOURCES_PIPELINE, sorted(affected))
+    # Manifest rows are committed together with the resources they produced
+    record_files(db, RESOURCES_PIPELINE, list({state.path: state for state in settled}.values()))
+    db.commit()
+    report.write_seconds = preload_seconds + time.perf_counter() - started
+
+    report.added = len(rows)
+    report.affected_roadmaps = sorted(affected)
+    logger.info(
+        "Imported %d resources for %d roadmaps from %d files", report.added, len(affected), report.files_parsed
+    )
+    return report
@@ -1,87 +1,113 @@
-import pdfplumber
-import re
+import asyncio
+import logging
+from typing import Callable
 from sqlalchemy.orm import Session
 
-from models.course import Course
-from models.skill_weight import SkillWeight
-from services.skill_synthesizer import synthesize_skill_profile
+from services.pdf_text import extract_text, extract_text_in_pool
+from services.job_runner import Job, get_job_runner
+from services.skill_matcher import get_skill_matcher
+from services.skill_weight_service import store_skill_weights
+
+logger = logging.getLogger(__name__)
+
+RESUME_INGEST_JOB = "resume_ingest"
 
 
 def extract_text_from_pdf(file_path: str) -> str:
-    print(f"[ResumeParser] Starting text extraction from {file_path}")
-    text = ""
-    with pdfplumber.open(file_path) as pdf:
-        for page in pdf.pages:
-            text += page.extract_text() or ""
+    logger.debug("[ResumeParser] Starting text extraction from %s", file_path)
+    text = extract_text(file_path)
     
-    print(f"[ResumeParser] Resume parsed successfully. Extracted {len(text)} characters.")
+    logger.info("[ResumeParser] Resume parsed successfully. Extracted %d characters.", len(text))
     return text.lower()
 
 
 def extract_skills_from_text(text: str, db: Session) -> dict:
-    print("[ResumeParser] Starting skill extraction matched against DB roadmaps...")
-    roadmap_ids = db.query(Course.roadmap_id).distinct().all()
-    roadmap_ids = [r[0].lower() for r in roadmap_ids]
-    
-    # Fallback to hardcoded roadmap ids if db is empty during testing
-    if not roadmap_ids:
-        print("[ResumeParser] WARNING: No courses found in DB! Falling back to default list.")
-        roadmap_ids = ["frontend", "backend", "fullstack", "devops", "qa", "android", "ios", "ai", "react", "python"]
+    logger.debug("[ResumeParser] Starting skill extraction matched against DB roadmaps...")
+    skill_scores = get_skill_matcher(db).count(text)
 
-    skill_scores = {}
-
-    for skill in roadmap_ids:
-        occurrences = len(re.findall(r"\b" + re.escape(skill) + r"\b", text))
-        if occurrences > 0:
-            skill_scores[skill] = occurrences
-
-    print(f"[ResumeParser] Skills extracted: {skill_scores}")
+    logger.debug("[ResumeParser] Skills extracted: %s", skill_scores)
     return skill_scores
 
 
 def ingest_resume(file_path: str, user_id: str, db: Session):
-    print(f"[ResumeParser] Ingestion initiated for user {user_id}")
+    logger.info("[ResumeParser] Ingestion initiated for user %s", user_id)
     text = extract_text_from_pdf(file_path)
+    return ingest_resume_text(text, user_id, db)
+
+
+def ingest_resume_text(text: str, user_id: str, db: Session) -> dict:
+    """
+    Matches already-extracted (lowercased) resume text against the catalog
+    and stores the resulting skill weights. Returns {skill: occurrences}.
+    """
     skill_scores = extract_skills_from_text(text, db)
 
     if not skill_scores:
-        print("[ResumeParser] No recognizable skills found in resume.")
-        return
+        logger.info("[ResumeParser] No recognizable skills found in resume.")
+        return skill_scores
 
     max_score = max(skill_scores.values())
 
-    for skill_name, score in skill_scores.items():
-        normalized_weight = score / max_score
-        confidence = min(1.0, score / 5.0)
-
-        existing = db.query(SkillWeight).filter(
-            SkillWeight.user_id == user_id,
-            SkillWeight.skill_name == skill_name,
-            SkillWeight.source == "resume"
-        ).first()
-
-        if existing:
-            existing.weight = normalized_weight
-            existing.confidence = confidence
-            print(f"[ResumeParser] Updated existing SkillWeight for {skill_name}")
-        else:
-            db.add(
-                SkillWeight(
-                    user_id=user_id,
-                    skill_name=skill_name,
-                    weight=normalized_weight,
-                    confidence=confidence,
-                    source="resume"
-                )
-            )
-            print(f"[ResumeParser] Inserted new SkillWeight for {skill_name}")
-
-        print(f"[ResumeParser] Triggering synthesizer for {skill_name}")
-        db.flush()
-        try:
-            synthesize_skill_profile(user_id, skill_name, db)
-        except Exception as e:
-            print(f"[ResumeParser] Non-fatal error synthesizing profile for {skill_name}: {e}")
-
-    db.commit()
-    print("[ResumeParser] Ingestion pipeline complete.")
+    weights = {
+        skill_name: (score / max_score, min(1.0, score / 5.0))
+        for skill_name, score in skill_scores.items()
+    }
+
+    logger.debug("[ResumeParser] Storing %d skill weights and synthesizing profiles", len(weights))
+    store_skill_weights(user_id, weights, "resume", db)
+    logger.info("[ResumeParser] Ingestion pipeline complete.")
+    return skill_scores
+
+
+async def run_resume_ingestion(job: Job, file_path: str, user_id: str, session_factory: Callable[[], Session]) -> dict:
+    """
+    Background job body: parses the PDF in the process pool, then stores the
+    skills from a worker thread so the event loop never blocks.
+    """
+    def on_progress(pages_done: int, pages_total: int) -> None:
+        job.progress = {"stage": "parsing", "pages_done": pages_done, "pages_total": pages_total}
+
+    on_progress(0, 0)
+    text = (await extract_text_in_pool(file_path, on_progress=on_progress)).lower()
+    logger.info("[ResumeParser] Resume parsed successfully. Extracted %d characters.", len(text))
+
+    job.progress = {**job.progress, "stage": "storing"}
+
+    def store():
+        with session_factory() as db:
+            return ingest_resume_text(text, user_id, db)
+
+    skill_scores = await asyncio.to_thread(store)
+    job.progress = {**job.progress, "stage": "done"}
+    return {"characters": len(text), "skills": sorted(skill_scores)}
+
+
+def enqueue_resume_ingestion(
+    user_id: str,
+    content_hash: str,
+    file_path: str,
+    session_factory: Callable[[], Session]
+) -> tuple[Job, bool]:
+    """
+    Starts ingestion of an uploaded resume. Returns (job, deduplicated): an
+    identical upload that is in progress or already ingested is not parsed again.
+    Must be called from the event loop.
+    """
+    runner = get_job_runner()
+    key = f"{user_id}:{content_hash}"
+    previous = runner.latest(RESUME_INGEST_JOB, key)
+    if previous is not None and previous.status != "failed":
+        return previous, True
+
+    job = runner.submit(
+        RESUME_INGEST_JOB, key,
+        lambda job: run_resume_ingestion(job, file_path, str(user_id), session_factory)
+    )
+    return job, False
+
+
+def get_resume_job(user_id: str, job_id: str) -> Job | None:
+    job = get_job_runner().get(job_id)
+    if job is None or job.kind != RESUME_INGEST_JOB or not job.key.startswith(f"{user_id}:"):
+        return None
+    return job
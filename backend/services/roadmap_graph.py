@@ -0,0 +1,137 @@
+import threading
+import logging
+from array import array
+from typing import NamedTuple
+
+from sqlalchemy.orm import Session
+
+from models.course import Course
+from models.course_prerequisite import CoursePrerequisite
+from services.catalog_version import get_catalog_version, register_invalidation_hook
+
+logger = logging.getLogger(__name__)
+
+
+class CourseNode(NamedTuple):
+    id: str
+    roadmap_id: str
+    title: str
+    difficulty_level: int | None
+
+
+class CompiledRoadmapGraph:
+    """
+    Immutable in-memory view of courses and course_prerequisites.
+    Courses are addressed by integer index; prerequisite adjacency is kept in
+    compact int arrays and the transitive closure (all ancestors of a node)
+    is compiled lazily, one roadmap at a time.
+    """
+
+    def __init__(self, nodes: list[CourseNode], edges: list[tuple[str, str]]):
+        self.nodes = nodes
+        self.index = {node.id: i for i, node in enumerate(nodes)}
+
+        prerequisites: list[list[int]] = [[] for _ in nodes]
+        for course_id, prerequisite_id in edges:
+            course_idx = self.index.get(course_id)
+            prereq_idx = self.index.get(prerequisite_id)
+            if course_idx is None or prereq_idx is None:
+                continue
+            prerequisites[course_idx].append(prereq_idx)
+        self.prerequisites = [array("i", p) for p in prerequisites]
+
+        roadmaps: dict[str, list[int]] = {}
+        for i, node in enumerate(nodes):
+            roadmaps.setdefault(node.roadmap_id, []).append(i)
+        self.roadmaps = {r: array("i", members) for r, members in roadmaps.items()}
+
+        self._ancestors: dict[str, dict[int, array]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, course_id: str) -> CourseNode | None:
+        idx = self.index.get(course_id)
+        return self.nodes[idx] if idx is not None else None
+
+    def roadmap_size(self, roadmap_id: str) -> int:
+        members = self.roadmaps.get(roadmap_id)
+        return len(members) if members is not None else 0
+
+    def _closure_for(self, idx: int) -> array:
+        visited = set()
+        stack = list(self.prerequisites[idx])
+        while stack:
+            current = stack.pop()
+            if current in visited:
+                continue
+            visited.add(current)
+            stack.extend(self.prerequisites[current])
+        visited.discard(idx)  # a cycle back to the node itself is not a prerequisite
+        return array("i", sorted(visited))
+
+    def _roadmap_closure(self, roadmap_id: str) -> dict[int, array]:
+        closure = self._ancestors.get(roadmap_id)
+        if closure is not None:
+            return closure
+
+        with self._lock:
+            closure = self._ancestors.get(roadmap_id)
+            if closure is None:
+                closure = {idx: self._closure_for(idx) for idx in self.roadmaps.get(roadmap_id, ())}
+                self._ancestors[roadmap_id] = closure
+        return closure
+
+    def ancestors(self, course_id: str) -> list[CourseNode]:
+        """
+        Returns every direct and transitive prerequisite of a course.
+        """
+        idx = self.index.get(course_id)
+        if idx is None:
+            return []
+
+        closure = self._roadmap_closure(self.nodes[idx].roadmap_id).get(idx)
+        if closure is None:
+            closure = self._closure_for(idx)
+        return [self.nodes[i] for i in closure]
+
+
+_graph: CompiledRoadmapGraph | None = None
+_build_lock = threading.Lock()
+
+
+def build_compiled_graph(db: Session) -> CompiledRoadmapGraph:
+    rows = db.query(
+        Course.id, Course.roadmap_id, Course.title, Course.difficulty_level
+    ).order_by(Course.id).all()
+    edges = db.query(CoursePrerequisite.course_id, CoursePrerequisite.prerequisite_id).all()
+
+    nodes = [CourseNode(r[0], r[1], r[2], r[3]) for r in rows]
+    graph = CompiledRoadmapGraph(nodes, [(e[0], e[1]) for e in edges])
+    logger.info("Compiled roadmap graph: %d courses, %d prerequisite edges", len(nodes), len(edges))
+    return graph
+
+
+def get_compiled_graph(db: Session) -> CompiledRoadmapGraph:
+    """
+    Returns the process-wide compiled graph, building it on first use or
+    after the catalog version has changed.
+    """
+    global _graph
+
+    get_catalog_version(db)
+
+    graph = _graph
+    if graph is not None:
+        return graph
+
+    with _build_lock:
+        if _graph is None:
+            _graph = build_compiled_graph(db)
+        return _graph
+
+
+def invalidate_compiled_graph() -> None:
+    global _graph
+    _graph = None
+
+
+register_invalidation_hook(invalidate_compiled_graph)
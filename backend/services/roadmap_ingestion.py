@@ -0,0 +1,226 @@
+import os
+import time
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from sqlalchemy.orm import Session
+
+from db.upsert import insert_for
+from models.course import Course
+from models.course_prerequisite import CoursePrerequisite
+from services.ingestion_manifest import ROADMAPS_PIPELINE, FileState, mark_pending, record_files
+from services.roadmap_parsing import CourseRow, ParsedRoadmap, try_parse_roadmap_file
+
+logger = logging.getLogger(__name__)
+
+ROADMAP_PARSE_WORKERS = int(os.getenv("ROADMAP_PARSE_WORKERS", str(os.cpu_count() or 1)))
+
+
+@dataclass
+class IngestionReport:
+    files: int = 0
+    roadmaps: list[str] = field(default_factory=list)
+    # Roadmaps whose courses or prerequisites actually changed
+    changed_roadmaps: list[str] = field(default_factory=list)
+    errors: dict[str, str] = field(default_factory=dict)
+    courses_inserted: int = 0
+    courses_updated: int = 0
+    courses_unchanged: int = 0
+    edges_inserted: int = 0
+    parse_seconds: float = 0.0
+    write_seconds: float = 0.0
+
+    @property
+    def rows_written(self) -> int:
+        return self.courses_inserted + self.courses_updated + self.edges_inserted
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_written / self.write_seconds if self.write_seconds > 0 else 0.0
+
+
+@dataclass
+class CatalogSnapshot:
+    # course_id -> (title, description)
+    courses: dict[str, tuple[str, str | None]]
+    edges: set[tuple[str, str]]
+
+
+@dataclass
+class RoadmapDiff:
+    inserts: list[CourseRow]
+    updates: list[CourseRow]
+    unchanged: int
+    edges: list[tuple[str, str]]
+
+    def __bool__(self) -> bool:
+        return bool(self.inserts or self.updates or self.edges)
+
+
+def parse_roadmap_files(paths: list[str], workers: int = ROADMAP_PARSE_WORKERS) -> tuple[list[ParsedRoadmap], dict[str, str]]:
+    """
+    Parses roadmap files in a process pool (in-process for workers <= 1).
+    Returns the parsed roadmaps in path order and {path: error}.
+    """
+    if workers > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(paths)),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            results = list(executor.map(try_parse_roadmap_file, paths, chunksize=4))
+    else:
+        results = [try_parse_roadmap_file(path) for path in paths]
+
+    parsed = []
+    errors = {}
+    for path, (roadmap, error) in zip(paths, results):
+        if error is not None:
+            errors[path] = error
+        elif roadmap is not None:
+            parsed.append(roadmap)
+    return parsed, errors
+
+
+def load_catalog_snapshot(db: Session, roadmap_ids: list[str]) -> CatalogSnapshot:
+    """
+    Reads the existing courses and prerequisite edges of the given roadmaps
+    with one query each.
+    """
+    courses = {
+        r[0]: (r[1], r[2])
+        for r in db.query(Course.id, Course.title, Course.description).filter(Course.roadmap_id.in_(roadmap_ids))
+    }
+    edges = {
+        (r[0], r[1])
+        for r in db.query(CoursePrerequisite.course_id, CoursePrerequisite.prerequisite_id)
+        .join(Course, Course.id == CoursePrerequisite.course_id)
+        .filter(Course.roadmap_id.in_(roadmap_ids))
+    }
+    return CatalogSnapshot(courses, edges)
+
+
+def diff_roadmap(roadmap: ParsedRoadmap, snapshot: CatalogSnapshot) -> RoadmapDiff:
+    """
+    Splits a parsed roadmap into new courses, courses whose title or
+    description changed, and prerequisite edges not stored yet. Courses and
+    edges missing from the file are left alone, as before.
+    """
+    inserts, updates = [], []
+    unchanged = 0
+    for row in roadmap.courses:
+        existing = snapshot.courses.get(row.id)
+        if existing is None:
+            inserts.append(row)
+        elif existing != (row.title, row.description):
+            updates.append(row)
+        else:
+            unchanged += 1
+
+    edges = [edge for edge in roadmap.edges if edge not in snapshot.edges]
+    return RoadmapDiff(inserts, updates, unchanged, edges)
+
+
+def apply_roadmap_diff(db: Session, diff: RoadmapDiff) -> None:
+    """
+    Writes one roadmap's diff with a bulk course upsert and a bulk edge
+    insert. Does not commit.
+    """
+    rows = diff.inserts + diff.updates
+    if rows:
+        stmt = insert_for(db, Course.__table__)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["id"],
+            # Don't touch difficulty or other fields
+            set_={"title": stmt.excluded.title, "description": stmt.excluded.description},
+        )
+        db.execute(stmt, [
+            {
+                "id": row.id,
+                "roadmap_id": row.roadmap_id,
+                "node_id": row.node_id,
+                "title": row.title,
+                "description": row.description,
+                "difficulty_level": None,
+            }
+            for row in rows
+        ])
+
+    if diff.edges:
+        stmt = insert_for(db, CoursePrerequisite.__table__).on_conflict_do_nothing(
+            index_elements=["course_id", "prerequisite_id"]
+        )
+        db.execute(stmt, [
+            {"course_id": course_id, "prerequisite_id": prerequisite_id}
+            for course_id, prerequisite_id in diff.edges
+        ])
+
+
+def ingest_roadmaps(
+    db: Session,
+    paths: list[str],
+    workers: int = ROADMAP_PARSE_WORKERS,
+    manifest: dict[str, FileState] | None = None
+) -> IngestionReport:
+    """
+    Parses every file in parallel, diffs the result against one snapshot of
+    the stored catalog and applies each changed roadmap in its own
+    transaction. When manifest states are given, each file's manifest row
+    is written in the same transaction as its data; files that failed to
+    parse are not recorded, so the next run retries them. Changed roadmaps
+    are marked pending in the same transaction; callers rebuild their
+    derived tables, bump the catalog version and then clear the marks.
+    """
+    manifest = manifest or {}
+    report = IngestionReport(files=len(paths))
+
+    started = time.perf_counter()
+    parsed, report.errors = parse_roadmap_files(paths, workers)
+    report.parse_seconds = time.perf_counter() - started
+    for path, error in report.errors.items():
+        logger.error("Error processing file %s: %s", path, error)
+
+    started = time.perf_counter()
+    snapshot = load_catalog_snapshot(db, sorted({r.roadmap_id for r in parsed}))
+    # Manifest rows that carry no catalog writes, recorded together at the end
+    settled: list[FileState] = []
+
+    for roadmap in parsed:
+        report.roadmaps.append(roadmap.roadmap_id)
+        diff = diff_roadmap(roadmap, snapshot)
+        report.courses_unchanged += diff.unchanged
+        state = manifest.get(roadmap.path)
+        if not diff:
+            if state is not None:
+                settled.append(state)
+            continue
+
+        apply_roadmap_diff(db, diff)
+        mark_pending(db, ROADMAPS_PIPELINE, [roadmap.roadmap_id])
+        if state is not None:
+            record_files(db, ROADMAPS_PIPELINE, [state])
+        db.commit()
+        report.changed_roadmaps.append(roadmap.roadmap_id)
+        report.courses_inserted += len(diff.inserts)
+        report.courses_updated += len(diff.updates)
+        report.edges_inserted += len(diff.edges)
+
+        # Later files for the same roadmap id diff against what was just written
+        for row in diff.inserts + diff.updates:
+            snapshot.courses[row.id] = (row.title, row.description)
+        snapshot.edges.update(diff.edges)
+
+    # JSON files that are not roadmap graphs are remembered too, so they are skipped
+    parsed_paths = {r.path for r in parsed}
+    settled += [manifest[p] for p in paths if p in manifest and p not in parsed_paths and p not in report.errors]
+    if settled:
+        record_files(db, ROADMAPS_PIPELINE, settled)
+        db.commit()
+
+    report.write_seconds = time.perf_counter() - started
+    logger.info(
+        "Ingested %d roadmaps (%d changed): %d rows in %.2fs",
+        len(report.roadmaps), len(report.changed_roadmaps), report.rows_written, report.write_seconds
+    )
+    return report
@@ -0,0 +1,164 @@
+import os
+import re
+import json
+from typing import NamedTuple
+
+# Kept free of app imports: spawned pool workers import this module on startup.
+
+
+class CourseRow(NamedTuple):
+    id: str
+    roadmap_id: str
+    node_id: str
+    title: str
+    description: str | None
+
+
+class ResourceLink(NamedTuple):
+    title: str
+    url: str
+    resource_type: str  # video or article
+    platform: str
+    youtube_video_id: str | None
+
+
+class ParsedRoadmap(NamedTuple):
+    roadmap_id: str
+    path: str
+    courses: list[CourseRow]
+    # (course_id, prerequisite_id), both among `courses`
+    edges: list[tuple[str, str]]
+
+
+def find_roadmap_files(roadmaps_dir: str) -> list[str]:
+    paths = []
+    for root, dirs, files in os.walk(roadmaps_dir):
+        for filename in files:
+            if filename.endswith(".json"):
+                paths.append(os.path.join(root, filename))
+    return sorted(paths)
+
+
+def parse_roadmap_file(path: str) -> ParsedRoadmap | None:
+    """
+    Reads one roadmap.sh graph file into course and prerequisite rows.
+    Only "topic" nodes with a title (or label) become courses, and only
+    edges between two such courses are kept. Returns None for JSON files
+    that are not roadmap graphs (no nodes and no edges).
+    """
+    roadmap_id = os.path.basename(path)[:-5]  # Remove .json
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    if not isinstance(data, dict):
+        return None
+
+    nodes = data.get("nodes", [])
+    edges = data.get("edges", [])
+    if not nodes and not edges:
+        return None
+
+    courses: dict[str, CourseRow] = {}
+    for node in nodes:
+        if node.get("type") != "topic":
+            continue
+
+        node_id = node.get("id")
+        if not node_id:
+            continue
+
+        node_data = node.get("data", {})
+        title = node_data.get("title") or node_data.get("label")
+        if not title:
+            continue
+
+        course_id = f"{roadmap_id}:{node_id}"
+        courses[course_id] = CourseRow(course_id, roadmap_id, node_id, title, node_data.get("description"))
+
+    prerequisites: dict[tuple[str, str], None] = {}
+    for edge in edges:
+        source = edge.get("source")
+        target = edge.get("target")
+        if not source or not target:
+            continue
+
+        prereq_id = f"{roadmap_id}:{source}"
+        course_id = f"{roadmap_id}:{target}"
+        if prereq_id in courses and course_id in courses:
+            prerequisites[(course_id, prereq_id)] = None
+
+    return ParsedRoadmap(roadmap_id, path, list(courses.values()), list(prerequisites))
+
+
+def try_parse_roadmap_file(path: str) -> tuple[ParsedRoadmap | None, str | None]:
+    """
+    parse_roadmap_file for pool workers: returns (parsed, error) instead of
+    raising, so one bad file does not abort the whole import.
+    """
+    try:
+        return parse_roadmap_file(path), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+# Regex to match: - [@type@Title](URL) or - [Title](URL)
+# Includes standard markdown link matching
+LINK_PATTERN = re.compile(r'- \[(?:@([^@]+)@)?([^\]]+)\]\(([^\)]+)\)')
+
+
+def get_platform_from_url(url: str) -> str:
+    url_lower = url.lower()
+    if "youtube.com" in url_lower or "youtu.be" in url_lower:
+        return "youtube"
+    elif "medium.com" in url_lower:
+        return "medium"
+    elif "github.com" in url_lower:
+        return "github"
+    else:
+        return "docs"
+
+
+def parse_resource_link(match: tuple[str, str, str]) -> ResourceLink:
+    resource_type_raw = match[0].strip() if match[0] else ""
+    title = match[1].strip()
+    url = match[2].strip()
+
+    resource_type = "article"
+    if "video" in resource_type_raw.lower() or "youtube" in url.lower() or "youtu.be" in url.lower():
+        resource_type = "video"
+
+    platform = get_platform_from_url(url)
+
+    # Basic youtube video ID extraction for iframes to work off embed urls
+    video_id = None
+    if platform == "youtube":
+        if "v=" in url:
+            video_id = url.split("v=")[-1].split("&")[0]
+        elif "youtu.be/" in url:
+            video_id = url.split("youtu.be/")[-1].split("?")[0]
+
+    return ResourceLink(title, url, resource_type, platform, video_id or None)
+
+
+def parse_resource_file(path: str) -> tuple[str, list[ResourceLink]]:
+    """
+    Streams a roadmap content markdown file line by line and returns
+    (path, links) in file order. Links never span lines, so the whole file
+    is never held in memory.
+    """
+    links = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            links += [parse_resource_link(match) for match in LINK_PATTERN.findall(line)]
+    return path, links
+
+
+def try_parse_resource_file(path: str) -> tuple[list[ResourceLink] | None, str | None]:
+    """
+    parse_resource_file for pool workers: returns (links, error) instead of raising.
+    """
+    try:
+        return parse_resource_file(path)[1], None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
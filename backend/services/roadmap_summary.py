@@ -0,0 +1,145 @@
+import json
+import threading
+import logging
+from datetime import datetime
+from typing import NamedTuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from models.course import Course
+from models.course_prerequisite import CoursePrerequisite
+from models.course_resource import CourseResource
+from models.roadmap_summary import RoadmapSummary
+from services.catalog_version import get_catalog_version, register_invalidation_hook
+
+logger = logging.getLogger(__name__)
+
+
+class RoadmapSummarySnapshot(NamedTuple):
+    version: int
+    roadmaps: list[dict]
+
+
+def compute_roadmap_summaries(db: Session, roadmap_ids: list[str] | None = None) -> list[dict]:
+    """
+    Aggregates the catalog per roadmap (all roadmaps when roadmap_ids is
+    None) with one GROUP BY query per measure.
+    """
+    roadmap_filter = Course.roadmap_id.in_(roadmap_ids) if roadmap_ids is not None else Course.roadmap_id != None
+
+    histograms: dict[str, dict[str, int]] = {}
+    topic_counts: dict[str, int] = {}
+    rows = db.query(
+        Course.roadmap_id, Course.difficulty_level, func.count(Course.id)
+    ).filter(roadmap_filter).group_by(Course.roadmap_id, Course.difficulty_level).all()
+    for roadmap_id, level, count in rows:
+        topic_counts[roadmap_id] = topic_counts.get(roadmap_id, 0) + count
+        if level is not None:
+            histograms.setdefault(roadmap_id, {})[str(level)] = count
+
+    edge_counts = dict(
+        db.query(Course.roadmap_id, func.count())
+        .join(CoursePrerequisite, CoursePrerequisite.course_id == Course.id)
+        .filter(roadmap_filter)
+        .group_by(Course.roadmap_id)
+        .all()
+    )
+    resource_counts = dict(
+        db.query(Course.roadmap_id, func.count(CourseResource.id))
+        .join(CourseResource, CourseResource.course_id == Course.id)
+        .filter(roadmap_filter)
+        .group_by(Course.roadmap_id)
+        .all()
+    )
+
+    return [
+        {
+            "id": roadmap_id,
+            "topic_count": topic_count,
+            "difficulty_histogram": histograms.get(roadmap_id, {}),
+            "edge_count": edge_counts.get(roadmap_id, 0),
+            "resource_count": resource_counts.get(roadmap_id, 0),
+        }
+        for roadmap_id, topic_count in sorted(topic_counts.items())
+    ]
+
+
+def rebuild_roadmap_summaries(db: Session, roadmap_ids: list[str] | None = None) -> int:
+    """
+    Replaces the summaries of the given roadmaps (the whole table when None)
+    with fresh aggregates in one transaction. Callers bump the catalog
+    version afterwards so serving processes reload it.
+    """
+    summaries = compute_roadmap_summaries(db, roadmap_ids)
+    now = datetime.utcnow()
+
+    stale = db.query(RoadmapSummary)
+    if roadmap_ids is not None:
+        stale = stale.filter(RoadmapSummary.roadmap_id.in_(roadmap_ids))
+    stale.delete(synchronize_session=False)
+    if summaries:
+        db.execute(RoadmapSummary.__table__.insert(), [
+            {
+                "roadmap_id": s["id"],
+                "topic_count": s["topic_count"],
+                "difficulty_histogram": json.dumps(s["difficulty_histogram"]),
+                "edge_count": s["edge_count"],
+                "resource_count": s["resource_count"],
+                "updated_at": now,
+            }
+            for s in summaries
+        ])
+    db.commit()
+
+    logger.info("Rebuilt roadmap summaries for %d roadmaps", len(summaries))
+    return len(summaries)
+
+
+def load_roadmap_summaries(db: Session) -> list[dict]:
+    rows = db.query(RoadmapSummary).order_by(RoadmapSummary.roadmap_id).all()
+    if not rows:
+        # Not rebuilt yet (e.g. a database populated before the table existed)
+        return compute_roadmap_summaries(db)
+
+    return [
+        {
+            "id": row.roadmap_id,
+            "topic_count": row.topic_count,
+            "difficulty_histogram": json.loads(row.difficulty_histogram),
+            "edge_count": row.edge_count,
+            "resource_count": row.resource_count,
+        }
+        for row in rows
+    ]
+
+
+_snapshot: RoadmapSummarySnapshot | None = None
+_load_lock = threading.Lock()
+
+
+def get_roadmap_summaries(db: Session) -> RoadmapSummarySnapshot:
+    """
+    Returns the process-wide summaries, loading them on first use or after
+    the catalog version has changed.
+    """
+    global _snapshot
+
+    version = get_catalog_version(db)
+
+    snapshot = _snapshot
+    if snapshot is not None:
+        return snapshot
+
+    with _load_lock:
+        if _snapshot is None:
+            _snapshot = RoadmapSummarySnapshot(version, load_roadmap_summaries(db))
+        return _snapshot
+
+
+def invalidate_roadmap_summaries() -> None:
+    global _snapshot
+    _snapshot = None
+
+
+register_invalidation_hook(invalidate_roadmap_summaries)
@@ -1,4 +1,7 @@
+from datetime import datetime
+from sqlalchemy import DateTime, String, cast, func, literal, select
 from sqlalchemy.orm import Session
+from db.upsert import insert_for
 from models.course import Course
 from models.skill_edge import SkillEdge
 from models.event import Event
@@ -6,48 +9,72 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+def _uuid_expression(db: Session):
+    """
+    Random UUID v4 text generated by the database, one per inserted row.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return cast(func.gen_random_uuid(), String)
+
+    def random_hex(n: int):
+        return func.lower(func.hex(func.randomblob(n)))
+
+    # SQLite has no uuid function: assemble the 8-4-4-4-12 layout with the
+    # version (4) and variant (8, 9, a or b) nibbles set
+    return (
+        random_hex(4) + "-" + random_hex(2) + "-4" + func.substr(random_hex(2), 2) + "-"
+        + func.substr("89ab", 1 + func.abs(func.random()) % 4, 1) + func.substr(random_hex(2), 2) + "-"
+        + random_hex(6)
+    )
+
+
+def generate_skill_edges(db: Session, roadmap_ids: list[str] | None = None) -> int:
+    """
+    Links consecutive courses of each roadmap (ordered by course id) with
+    one INSERT ... SELECT: LAG() pairs every course with its predecessor and
+    pairs that already exist are skipped by ON CONFLICT DO NOTHING. Covers
+    the given roadmaps, or the whole catalog when None. Commits and returns
+    the number of new edges.
+    """
+    pairs = select(
+        Course.roadmap_id,
+        func.lag(Course.id).over(partition_by=Course.roadmap_id, order_by=Course.id).label("from_skill_id"),
+        Course.id.label("to_skill_id"),
+    )
+    if roadmap_ids is not None:
+        pairs = pairs.where(Course.roadmap_id.in_(roadmap_ids))
+    pairs = pairs.subquery("pairs")
+
+    source = select(
+        _uuid_expression(db),
+        pairs.c.roadmap_id,
+        pairs.c.from_skill_id,
+        pairs.c.to_skill_id,
+        literal(datetime.utcnow(), DateTime),
+    ).where(pairs.c.from_skill_id.is_not(None))  # also keeps SQLite from parsing ON CONFLICT as a join
+
+    stmt = insert_for(db, SkillEdge.__table__).from_select(
+        ["id", "roadmap_id", "from_skill_id", "to_skill_id", "created_at"], source
+    ).on_conflict_do_nothing(index_elements=["from_skill_id", "to_skill_id"])
+
+    inserted = db.execute(stmt).rowcount
+    db.commit()
+    return inserted
+
+
 def generate_graph_for_roadmap(roadmap_id: str, db: Session):
     """
     Generates a linear prerequisite graph for all courses sequentially ordered within a roadmap.
-    Assumes the courses are ordered by node_id based on original roadmap format ingestion.
+    Courses are ordered by id, which is how they have always been sequenced here.
     """
     try:
-        # Fetch all courses for the valid roadmap ordered by sequence.
-        # Based on extract_roadmaps.py, it sorts primarily sequentially or node_id when inserted.
-        # The prompt instructed to order by original ingestion sequencing (e.g. node_id lexicographically/numerically, since JSON parse preserves array order but DB doesn't inherently without order_by). 
-        # If node_id is an integer representation as a string, casting might be needed, but we'll try sorting strings or relying on insertion ID if they are chronological. Wait, extract_roadmaps.py didn't store a explicit sequence number. Let's look at `node_id`. The prompt: "You must order by the original roadmap ordering field used during ingestion. That is usually: position, sequence, node_order, created index".
-        # Since extract_roadmaps iterates linearly through JSON, insertion order (rowid in SQLite) guarantees the sequence and created_at timestamps can be identical.
-        from sqlalchemy.sql import text
-        courses = db.query(Course).filter(Course.roadmap_id == roadmap_id).order_by(Course.id).all()
-
-        if len(courses) < 2:
-            return # Skip if less than 2 courses
-
-        existing_edges = set(
-            (e.from_skill_id, e.to_skill_id)
-            for e in db.query(SkillEdge).filter_by(roadmap_id=roadmap_id)
-        )
-
-        new_edges = []
-        for i in range(len(courses) - 1):
-            from_course = courses[i]
-            to_course = courses[i+1]
-            
-            if (from_course.id, to_course.id) not in existing_edges:
-                edge = SkillEdge(
-                    roadmap_id=roadmap_id,
-                    from_skill_id=from_course.id,
-                    to_skill_id=to_course.id
-                )
-                db.add(edge)
-                new_edges.append(edge)
-        
-        db.commit()
-        logger.info(f"Generated {len(new_edges)} new edges for roadmap {roadmap_id}")
+        inserted = generate_skill_edges(db, [roadmap_id])
+        logger.info("Generated %d new edges for roadmap %s", inserted, roadmap_id)
 
     except Exception as e:
         db.rollback()
-        logger.error(f"Error generating graph for roadmap {roadmap_id}: {e}")
+        logger.error("Error generating graph for roadmap %s: %s", roadmap_id, e)
+
 
 def get_edges_for_roadmap(roadmap_id: str, db: Session) -> list[SkillEdge]:
     return db.query(SkillEdge).filter(SkillEdge.roadmap_id == roadmap_id).all()
@@ -0,0 +1,159 @@
+import re
+import threading
+import logging
+
+from sqlalchemy.orm import Session
+
+from models.course import Course
+from services.catalog_version import get_catalog_version, register_invalidation_hook
+
+logger = logging.getLogger(__name__)
+
+# Used when the catalog is empty (e.g. a fresh dev database)
+DEFAULT_ROADMAP_IDS = ["frontend", "backend", "fullstack", "devops", "qa", "android", "ios", "ai", "react", "python"]
+
+# Common spellings of roadmap ids that do not appear in the id itself.
+# Only applied to roadmaps that exist in the catalog.
+SKILL_ALIASES = {
+    "aspnet-core": ["asp.net core", "asp.net"],
+    "aws": ["amazon web services"],
+    "cpp": ["c++"],
+    "git-github": ["git", "github"],
+    "javascript": ["js"],
+    "kubernetes": ["k8s"],
+    "machine-learning": ["ml"],
+    "nodejs": ["node.js", "node"],
+    "postgresql-dba": ["postgresql", "postgres"],
+    "react": ["react.js", "reactjs"],
+    "vue": ["vue.js", "vuejs"],
+}
+
+# Single-word course titles ("Testing", "Security") are too generic to
+# attribute to one roadmap, so titles need at least this many words.
+MIN_TITLE_WORDS = 2
+
+
+def _trie_pattern(terms: list[str]) -> str:
+    """
+    Builds a regex body from a character trie of the terms, so that matching
+    at a position costs the length of the longest term, not the number of
+    terms. Longer terms are tried first; whitespace matches any run of it.
+    """
+    trie: dict = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def emit(node: dict) -> str:
+        ends_here = "" in node
+        branches = [
+            (r"\s+" if ch == " " else re.escape(ch)) + emit(child)
+            for ch, child in sorted(node.items())
+            if ch != ""
+        ]
+        if not branches:
+            return ""
+        if len(branches) == 1 and not ends_here:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if ends_here else group
+
+    return emit(trie)
+
+
+class SkillMatcher:
+    """
+    Precompiled matcher mapping every catalog term (roadmap id, alias or
+    course title) to its roadmap id. Counts all occurrences in one pass.
+    """
+
+    def __init__(self, terms: dict[str, str]):
+        self.terms = {" ".join(term.lower().split()): skill for term, skill in terms.items() if term.strip()}
+        self.pattern = re.compile(r"(?<!\w)" + _trie_pattern(list(self.terms)) + r"(?!\w)") if self.terms else None
+
+    def count(self, text: str) -> dict[str, int]:
+        """
+        Returns {roadmap_id: occurrences} for lowercased text. Overlapping
+        terms count once, for the longest match ("react native" is not also
+        counted as "react").
+        """
+        counts: dict[str, int] = {}
+        if self.pattern is None:
+            return counts
+        for match in self.pattern.finditer(text):
+            skill = self.terms[" ".join(match.group(0).split())]
+            counts[skill] = counts.get(skill, 0) + 1
+        return counts
+
+
+def build_terms(roadmap_ids: list[str], titles: list[tuple[str, str]]) -> dict[str, str]:
+    """
+    Vocabulary for the matcher: each roadmap id, its spaced form
+    ("react-native" -> "react native"), its aliases, and every sufficiently
+    specific course title that belongs to exactly one roadmap.
+    """
+    terms: dict[str, str] = {}
+
+    title_roadmaps: dict[str, set[str]] = {}
+    for roadmap_id, title in titles:
+        key = " ".join(title.lower().split())
+        if len(key.split()) >= MIN_TITLE_WORDS:
+            title_roadmaps.setdefault(key, set()).add(roadmap_id.lower())
+    for title, owners in title_roadmaps.items():
+        if len(owners) == 1:
+            terms[title] = next(iter(owners))
+
+    # Roadmap ids and aliases win over titles that spell the same term
+    for roadmap_id in roadmap_ids:
+        skill = roadmap_id.lower()
+        terms[skill] = skill
+        terms.setdefault(skill.replace("-", " "), skill)
+        for alias in SKILL_ALIASES.get(skill, ()):
+            terms[alias] = skill
+
+    return terms
+
+
+def build_skill_matcher(db: Session) -> SkillMatcher:
+    roadmap_ids = [r[0] for r in db.query(Course.roadmap_id).distinct().all()]
+    if not roadmap_ids:
+        logger.warning("[SkillMatcher] No courses found in DB! Falling back to default list.")
+        return SkillMatcher(build_terms(DEFAULT_ROADMAP_IDS, []))
+
+    titles = db.query(Course.roadmap_id, Course.title).distinct().all()
+    terms = build_terms(roadmap_ids, [(r[0], r[1]) for r in titles])
+    logger.info("[SkillMatcher] Compiled %d terms for %d roadmaps", len(terms), len(roadmap_ids))
+    return SkillMatcher(terms)
+
+
+_matcher: SkillMatcher | None = None
+_build_lock = threading.Lock()
+
+
+def get_skill_matcher(db: Session) -> SkillMatcher:
+    """
+    Returns the process-wide matcher, compiling it on first use or after
+    the catalog version has changed.
+    """
+    global _matcher
+
+    get_catalog_version(db)
+
+    matcher = _matcher
+    if matcher is not None:
+        return matcher
+
+    with _build_lock:
+        if _matcher is None:
+            _matcher = build_skill_matcher(db)
+        return _matcher
+
+
+def invalidate_skill_matcher() -> None:
+    global _matcher
+    _matcher = None
+
+
+register_invalidation_hook(invalidate_skill_matcher)
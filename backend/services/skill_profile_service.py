@@ -1,7 +1,11 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
+from datetime import datetime
+import uuid
+from db.upsert import insert_for
 from models.skill_profile import SkillProfile
 from models.skill_weight import SkillWeight
+from services.adaptive_score_cache import invalidate_adaptive_score
 import logging
 
 logger = logging.getLogger(__name__)
@@ -29,6 +33,7 @@ def get_or_create_skill_profile(user_id: str, skill_id: str, roadmap_id: str, db
         db.add(new_profile)
         db.commit()
         db.refresh(new_profile)
+        invalidate_adaptive_score(user_id, roadmap_id)
         return new_profile
     except IntegrityError:
         # Caused by concurrent insert
@@ -71,6 +76,20 @@ def initialize_skill_profile_from_cold_start(user_id: str, skill_id: str, db: Se
         SkillWeight.source == 'resume'
     ).first()
     
+    values = _cold_start_values(github_weight, resume_weight)
+    if values:
+        # We also need to store these components safely onto the profile per prompt schemas
+        for column, value in values.items():
+            setattr(profile, column, value)
+
+        db.commit()
+        invalidate_adaptive_score(user_id, course.roadmap_id)
+
+def _cold_start_values(github_weight: SkillWeight | None, resume_weight: SkillWeight | None) -> dict | None:
+    """
+    Blends github and resume signals into cold-start profile values.
+    Returns None when neither source carries any confidence.
+    """
     github_prof = github_weight.weight if github_weight else 0.0
     github_conf = github_weight.confidence if github_weight else 0.0
     
@@ -78,28 +97,128 @@ def initialize_skill_profile_from_cold_start(user_id: str, skill_id: str, db: Se
     resume_conf = resume_weight.confidence if resume_weight else 0.0
     
     total_conf = github_conf + resume_conf
-    
-    if total_conf > 0:
-        cold_start_proficiency = (github_prof * github_conf + resume_prof * resume_conf) / total_conf
-        cold_start_confidence = max(github_conf, resume_conf)
-        
-        # We also need to store these components safely onto the profile per prompt schemas
-        profile.github_proficiency = github_prof
-        profile.github_confidence = github_conf
-        profile.resume_proficiency = resume_prof
-        profile.resume_confidence = resume_conf
-        
-        profile.proficiency_level = cold_start_proficiency
-        profile.confidence = cold_start_confidence
-        
-        db.commit()
+    if total_conf <= 0:
+        return None
 
-def update_skill_profile_from_quiz(user_id: str, skill_id: str, quiz_score: float, roadmap_id: str, db: Session):
+    return {
+        "github_proficiency": github_prof,
+        "github_confidence": github_conf,
+        "resume_proficiency": resume_prof,
+        "resume_confidence": resume_conf,
+        "proficiency_level": (github_prof * github_conf + resume_prof * resume_conf) / total_conf,
+        "confidence": max(github_conf, resume_conf),
+    }
+
+COLD_START_COLUMNS = (
+    "github_proficiency",
+    "github_confidence",
+    "resume_proficiency",
+    "resume_confidence",
+    "proficiency_level",
+    "confidence",
+)
+
+def bulk_initialize_skill_profiles(user_id: str, roadmap_id: str, skill_ids: list[str], db: Session) -> int:
     """
-    Updates adaptive score deterministically using quiz signal as authoritative.
+    Batch equivalent of get_or_create_skill_profile followed by
+    initialize_skill_profile_from_cold_start for every skill of a roadmap.
+    Reads profiles and weights with one query each and writes all missing or
+    stale profiles with a single upsert inside one transaction.
+    Returns the number of rows written.
+    """
+    if not skill_ids:
+        return 0
+
+    profiles = {
+        p.skill_id: p
+        for p in db.query(SkillProfile).filter(
+            SkillProfile.user_id == user_id,
+            SkillProfile.skill_id.in_(skill_ids)
+        )
+    }
+
+    weights: dict[str, dict[str, SkillWeight]] = {}
+    for w in db.query(SkillWeight).filter(
+        SkillWeight.user_id == user_id,
+        SkillWeight.skill_name.in_(skill_ids),
+        SkillWeight.source.in_(("github", "resume"))
+    ):
+        weights.setdefault(w.skill_name, {})[w.source] = w
+
+    now = datetime.utcnow()
+    rows = []
+    for skill_id in skill_ids:
+        profile = profiles.get(skill_id)
+        if profile and profile.quiz_confidence > 0:
+            continue # Skip cold start if we already have quiz signals
+
+        skill_weights = weights.get(skill_id, {})
+        values = _cold_start_values(skill_weights.get("github"), skill_weights.get("resume"))
+
+        if profile:
+            if not values or all(getattr(profile, c) == v for c, v in values.items()):
+                continue # Nothing new to write
+        elif not values:
+            values = {column: 0.0 for column in COLD_START_COLUMNS}
+
+        rows.append({
+            "id": str(uuid.uuid4()),
+            "user_id": user_id,
+            "skill_id": skill_id,
+            "roadmap_id": roadmap_id,
+            "created_at": now,
+            "updated_at": now,
+            **values,
+        })
+
+    if not rows:
+        return 0
+
+    table = SkillProfile.__table__
+    stmt = insert_for(db, table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id", "skill_id"],
+        set_={
+            **{column: stmt.excluded[column] for column in COLD_START_COLUMNS},
+            "updated_at": stmt.excluded.updated_at,
+        },
+        # Never overwrite a profile that picked up quiz signals concurrently
+        where=table.c.quiz_confidence == 0,
+    )
+    db.execute(stmt, rows)
+    db.commit()
+    invalidate_adaptive_score(user_id, roadmap_id)
+
+    logger.info("Cold-started %d skill profiles for user=%s roadmap=%s", len(rows), user_id, roadmap_id)
+    return len(rows)
+
+def create_skill_profile_if_missing(user_id: str, skill_id: str, roadmap_id: str, db: Session) -> SkillProfile:
+    """
+    Inserts an empty profile unless one exists and returns it, without
+    committing. Uses INSERT ... ON CONFLICT DO NOTHING instead of the
+    IntegrityError/rollback dance so it is safe inside a larger transaction.
+    """
+    now = datetime.utcnow()
+    stmt = insert_for(db, SkillProfile.__table__).values(
+        id=str(uuid.uuid4()),
+        user_id=user_id,
+        skill_id=skill_id,
+        roadmap_id=roadmap_id,
+        created_at=now,
+        updated_at=now,
+    ).on_conflict_do_nothing(index_elements=["user_id", "skill_id"])
+    db.execute(stmt)
+
+    return db.query(SkillProfile).filter(
+        SkillProfile.user_id == user_id,
+        SkillProfile.skill_id == skill_id
+    ).one()
+
+def apply_quiz_signal(profile: SkillProfile, quiz_score: float) -> None:
+    """
+    Folds a quiz score into the profile in memory, treating the quiz signal
+    as authoritative over cold-start data. Does not commit.
     """
-    profile = get_or_create_skill_profile(user_id, skill_id, roadmap_id, db)
-    
     QUIZ_SIGNAL_WEIGHT = 0.8
     QUIZ_CONFIDENCE_INCREMENT = 0.2
     MAX_CONFIDENCE = 1.0
@@ -129,5 +248,13 @@ def update_skill_profile_from_quiz(user_id: str, skill_id: str, quiz_score: floa
     
     profile.proficiency_level = final_proficiency
     profile.confidence = final_confidence
+
+def update_skill_profile_from_quiz(user_id: str, skill_id: str, quiz_score: float, roadmap_id: str, db: Session):
+    """
+    Updates adaptive score deterministically using quiz signal as authoritative.
+    """
+    profile = get_or_create_skill_profile(user_id, skill_id, roadmap_id, db)
+    apply_quiz_signal(profile, quiz_score)
     
     db.commit()
+    invalidate_adaptive_score(user_id, roadmap_id)
@@ -0,0 +1,215 @@
+from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import NamedTuple
+import uuid
+import logging
+
+import numpy as np
+
+from db.upsert import insert_for
+from models.course import Course
+from models.skill_weight import SkillWeight
+from models.skill_profile import SkillProfile
+from services.adaptive_score_cache import adaptive_score_cache, invalidate_adaptive_score
+
+logger = logging.getLogger(__name__)
+
+SOURCE_MULTIPLIERS = {
+    "github": 1.0,
+    "resume": 0.6,
+    "quiz": 1.3,
+    "engagement": 1.1
+}
+
+
+class SkillSynthesis(NamedTuple):
+    roadmap_id: str
+    synthesized_weight: float
+    confidence: float
+
+
+class WeightColumns(NamedTuple):
+    """
+    SkillWeight rows as parallel arrays, one element per row.
+    """
+    user_ids: np.ndarray
+    skill_ids: np.ndarray
+    weight: np.ndarray
+    confidence: np.ndarray
+    multiplier: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.weight)
+
+
+class BlendedSkills(NamedTuple):
+    """
+    One element per (user, skill) group with a usable blend.
+    """
+    user_ids: np.ndarray
+    skill_ids: np.ndarray
+    synthesized_weight: np.ndarray
+    confidence: np.ndarray
+
+
+def load_weight_columns(db: Session, user_ids: list[str] | None = None, skill_ids: list[str] | None = None) -> WeightColumns:
+    """
+    Loads every matching SkillWeight row with a single query.
+    """
+    query = db.query(
+        SkillWeight.user_id, SkillWeight.skill_name, SkillWeight.source,
+        SkillWeight.weight, SkillWeight.confidence
+    )
+    if user_ids is not None:
+        query = query.filter(SkillWeight.user_id.in_(user_ids))
+    if skill_ids is not None:
+        query = query.filter(SkillWeight.skill_name.in_(skill_ids))
+    rows = query.all()
+
+    if not rows:
+        empty = np.array([], dtype=object)
+        return WeightColumns(empty, empty, np.array([]), np.array([]), np.array([]))
+
+    users, skills, sources, weights, confidences = zip(*rows)
+
+    # Look the multiplier up once per distinct source, then broadcast
+    source_values, source_codes = np.unique(np.array(sources, dtype=object).astype(str), return_inverse=True)
+    multipliers = np.array([SOURCE_MULTIPLIERS.get(s, 1.0) for s in source_values])
+
+    return WeightColumns(
+        np.array(users, dtype=object),
+        np.array(skills, dtype=object),
+        np.array(weights, dtype=float),
+        np.array(confidences, dtype=float),
+        multipliers[source_codes],
+    )
+
+
+def blend_weight_columns(columns: WeightColumns) -> BlendedSkills:
+    """
+    Confidence-weighted blend per (user, skill), as grouped reductions:
+        weight     = sum(w * c * m) / sum(c * m)
+        confidence = min(1, sum(c * m) / count)
+    Groups whose sum(c * m) is zero are dropped.
+    """
+    if len(columns) == 0:
+        empty = np.array([], dtype=object)
+        return BlendedSkills(empty, empty, np.array([]), np.array([]))
+
+    user_values, user_codes = np.unique(columns.user_ids.astype(str), return_inverse=True)
+    skill_values, skill_codes = np.unique(columns.skill_ids.astype(str), return_inverse=True)
+    pair_keys = user_codes.astype(np.int64) * len(skill_values) + skill_codes
+    groups, group_index = np.unique(pair_keys, return_inverse=True)
+
+    scaled_confidence = columns.confidence * columns.multiplier
+    numerator = np.bincount(group_index, weights=columns.weight * scaled_confidence, minlength=len(groups))
+    denominator = np.bincount(group_index, weights=scaled_confidence, minlength=len(groups))
+    counts = np.bincount(group_index, minlength=len(groups))
+
+    usable = denominator != 0
+    groups = groups[usable]
+    numerator, denominator, counts = numerator[usable], denominator[usable], counts[usable]
+
+    return BlendedSkills(
+        user_values[groups // len(skill_values)],
+        skill_values[groups % len(skill_values)],
+        numerator / denominator,
+        np.minimum(1.0, denominator / counts),
+    )
+
+
+def _resolve_roadmaps(db: Session, blended: BlendedSkills) -> list[str]:
+    """
+    Keeps the roadmap of an existing profile; otherwise maps course ids to
+    their roadmap and treats any other skill id as its own roadmap.
+    """
+    user_ids = sorted(set(blended.user_ids.tolist()))
+    skill_ids = sorted(set(blended.skill_ids.tolist()))
+
+    existing = {
+        (r[0], r[1]): r[2]
+        for r in db.query(SkillProfile.user_id, SkillProfile.skill_id, SkillProfile.roadmap_id).filter(
+            SkillProfile.user_id.in_(user_ids),
+            SkillProfile.skill_id.in_(skill_ids)
+        )
+    }
+    course_roadmaps = dict(
+        db.query(Course.id, Course.roadmap_id).filter(Course.id.in_(skill_ids)).all()
+    )
+
+    return [
+        existing.get((user_id, skill_id)) or course_roadmaps.get(skill_id) or skill_id
+        for user_id, skill_id in zip(blended.user_ids.tolist(), blended.skill_ids.tolist())
+    ]
+
+
+def synthesize_profiles(
+    db: Session,
+    user_ids: list[str] | None = None,
+    skill_ids: list[str] | None = None,
+    commit: bool = True
+) -> dict[tuple[str, str], SkillSynthesis]:
+    """
+    Recomputes skill profiles for the given users (all users when None),
+    optionally restricted to some skills. Reads weights with one query,
+    blends them in NumPy and writes every profile with one bulk upsert.
+    Returns {(user_id, skill_id): SkillSynthesis}.
+    """
+    blended = blend_weight_columns(load_weight_columns(db, user_ids, skill_ids))
+    if len(blended.user_ids) == 0:
+        return {}
+
+    roadmaps = _resolve_roadmaps(db, blended)
+    results = {
+        (user_id, skill_id): SkillSynthesis(roadmap_id, weight, confidence)
+        for user_id, skill_id, roadmap_id, weight, confidence in zip(
+            blended.user_ids.tolist(),
+            blended.skill_ids.tolist(),
+            roadmaps,
+            blended.synthesized_weight.tolist(),
+            blended.confidence.tolist(),
+        )
+    }
+
+    now = datetime.utcnow()
+    table = SkillProfile.__table__
+    stmt = insert_for(db, table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id", "skill_id"],
+        set_={
+            "confidence": stmt.excluded.confidence,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    db.execute(stmt, [
+        {
+            "id": str(uuid.uuid4()),
+            "user_id": user_id,
+            "skill_id": skill_id,
+            "roadmap_id": result.roadmap_id,
+            "confidence": result.confidence,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for (user_id, skill_id), result in results.items()
+    ])
+
+    if commit:
+        db.commit()
+        invalidate_synthesized(results)
+
+    logger.debug("[SkillSynth] synthesized %d profiles", len(results))
+    return results
+
+
+def invalidate_synthesized(results: dict[tuple[str, str], SkillSynthesis]) -> None:
+    """
+    Drops cached adaptive scores affected by a committed synthesis.
+    """
+    affected = {(user_id, result.roadmap_id) for (user_id, _), result in results.items()}
+    if len({user_id for user_id, _ in affected}) > 100:
+        # Bulk recomputation: cheaper to start over than to scan per user
+        adaptive_score_cache.clear()
+        return
+    for user_id, roadmap_id in affected:
+        invalidate_adaptive_score(user_id, roadmap_id)
@@ -1,74 +1,34 @@
 from sqlalchemy.orm import Session
-from datetime import datetime
+import logging
 
-from models.skill_weight import SkillWeight
 from models.skill_profile import SkillProfile
+from services.skill_synthesis_engine import SkillSynthesis, synthesize_profiles
 
-def synthesize_skill_profile(user_id: str, skill_id: str, db: Session) -> SkillProfile:
-
-    weights = db.query(SkillWeight).filter(
-        SkillWeight.user_id == user_id,
-        SkillWeight.skill_name == skill_id
-    ).all()
-    
-    print(f"[SkillSynth Debug] weights extracted count: {len(weights)} for user {user_id}, skill {skill_id}")
+logger = logging.getLogger(__name__)
 
-    if not weights:
-        print(f"[SkillSynth Debug] No weights found, aborting synthesis early.")
-        return None
 
-    SOURCE_MULTIPLIERS = {
-        "github": 1.0,
-        "resume": 0.6,
-        "quiz": 1.3,
-        "engagement": 1.1
-    }
+def synthesize_skill_profiles(user_id: str, skill_ids: list[str], db: Session, commit: bool = True) -> dict[str, SkillSynthesis]:
+    """
+    Re-synthesizes several skills of one user in a single pass; see
+    skill_synthesis_engine.synthesize_profiles. Pass commit=False to fold the
+    write into the caller's transaction (the caller then invalidates caches).
+    """
+    skill_ids = list(dict.fromkeys(skill_ids))
+    if not skill_ids:
+        return {}
 
-    numerator = 0.0
-    denominator = 0.0
+    results = synthesize_profiles(db, [user_id], skill_ids, commit=commit)
+    return {skill_id: result for (_, skill_id), result in results.items()}
 
-    for w in weights:
-        multiplier = SOURCE_MULTIPLIERS.get(w.source, 1.0)
-        numerator += w.weight * w.confidence * multiplier
-        denominator += w.confidence * multiplier
 
-    if denominator == 0:
+def synthesize_skill_profile(user_id: str, skill_id: str, db: Session) -> SkillProfile:
+    results = synthesize_skill_profiles(user_id, [skill_id], db)
+    if skill_id not in results:
+        logger.debug("[SkillSynth] No usable weights for user %s, skill %s", user_id, skill_id)
         return None
 
-    synthesized_weight = numerator / denominator
-    aggregated_confidence = min(1.0, denominator / len(weights))
-
-    profile = db.query(SkillProfile).filter(
-        SkillProfile.user_id == user_id,
-        SkillProfile.skill_id == skill_id
-    ).first()
-
-    if not profile:
-        from models.course import Course
-        # Attempt to map skill_id back to a real course and extract roadmap_id
-        course = db.query(Course).filter(Course.roadmap_id == skill_id).first()
-        mapped_roadmap = course.roadmap_id if course else skill_id
-        
-        print(f"[SkillSynth Debug] Resolved missing profile mapping {skill_id} to roadmap {mapped_roadmap}")
-
-        profile = SkillProfile(
-            user_id=user_id,
-            skill_id=skill_id,
-            roadmap_id=mapped_roadmap
-        )
-        db.add(profile)
-    else:
-        print(f"[SkillSynth Debug] Profile found existing id={profile.id}")
-
-    profile.synthesized_weight = synthesized_weight
-    profile.confidence = aggregated_confidence
-    profile.last_updated = datetime.utcnow()
-
-    db.commit()
-    db.refresh(profile)
-    
-    print(f"[SkillSynth] user={user_id} skill={skill_id} roadmap={profile.roadmap_id} weight={synthesized_weight}")
-
+    profile = get_skill_profile(user_id, skill_id, db)
+    logger.debug("[SkillSynth] user=%s skill=%s roadmap=%s weight=%s", user_id, skill_id, profile.roadmap_id, results[skill_id].synthesized_weight)
     return profile
 
 
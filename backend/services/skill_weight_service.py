@@ -0,0 +1,59 @@
+from sqlalchemy.orm import Session
+from datetime import datetime
+import logging
+
+from db.upsert import insert_for
+from models.skill_weight import SkillWeight
+from services.skill_synthesis_engine import SkillSynthesis, invalidate_synthesized, synthesize_profiles
+
+logger = logging.getLogger(__name__)
+
+
+def upsert_skill_weights(user_id: str, weights: dict[str, tuple[float, float]], source: str, db: Session) -> None:
+    """
+    Writes {skill_name: (weight, confidence)} for one source with a single
+    INSERT ... ON CONFLICT (user_id, skill_name) DO UPDATE. Does not commit.
+    """
+    if not weights:
+        return
+
+    now = datetime.utcnow()
+    table = SkillWeight.__table__
+    stmt = insert_for(db, table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id", "skill_name"],
+        set_={
+            "weight": stmt.excluded.weight,
+            "confidence": stmt.excluded.confidence,
+            "source": stmt.excluded.source,
+            "last_updated": stmt.excluded.last_updated,
+        },
+    )
+    db.execute(stmt, [
+        {
+            "user_id": user_id,
+            "skill_name": skill_name,
+            "weight": weight,
+            "confidence": confidence,
+            "source": source,
+            "last_updated": now,
+        }
+        for skill_name, (weight, confidence) in weights.items()
+    ])
+
+
+def store_skill_weights(user_id: str, weights: dict[str, tuple[float, float]], source: str, db: Session) -> dict[str, SkillSynthesis]:
+    """
+    Upserts a batch of skill weights and re-synthesizes the affected skill
+    profiles in the same transaction, with one commit for the whole batch.
+    """
+    if not weights:
+        return {}
+
+    upsert_skill_weights(user_id, weights, source, db)
+    results = synthesize_profiles(db, [user_id], list(weights), commit=False)
+    db.commit()
+    invalidate_synthesized(results)
+
+    logger.info("Stored %d %s skill weights for user %s", len(weights), source, user_id)
+    return {skill_id: result for (_, skill_id), result in results.items()}
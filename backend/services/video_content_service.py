@@ -8,14 +8,13 @@ from models.course import Course
 from models.course_resource import CourseResource
 from difflib import SequenceMatcher
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 def extract_video_resources(course: Course, roadmap_id: str) -> List[dict]:
     """
     Disabled. Automatic resource generation is no longer supported.
     """
-    logger.info(f"[Disabled] Automatic resource generation is disabled. Skipping {course.id}")
+    logger.info("[Disabled] Automatic resource generation is disabled. Skipping %s", course.id)
     return []
 
 def store_resources(db: Session, resources_data: List[dict]):
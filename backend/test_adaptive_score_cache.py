@@ -0,0 +1,81 @@
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+# Import app and database
+from main import app
+from db.database import Base, get_async_db, get_db
+from models import User, UserSkill
+from models.course import Course
+from core.security import create_access_token
+from services.adaptive_score_cache import adaptive_score_cache, adaptive_score_cache_stats
+
+# Setup test DB
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_adaptive_score_cache.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# NullPool: TestClient may run each request on a fresh event loop
+async_engine = create_async_engine("sqlite+aiosqlite:///./test_adaptive_score_cache.db", poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+async def override_get_async_db():
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+client = TestClient(app)
+
+def test_adaptive_score_cache_invalidation():
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+    # Reset DB
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    adaptive_score_cache.clear()
+
+    db = TestingSessionLocal()
+    user_id = "cache-user"
+    db.add(User(id=user_id, email="cache@example.com", password_hash="pw"))
+    db.add(Course(id="k8s:pods", roadmap_id="k8s", node_id="pods", title="Pods", difficulty_level=900))
+    db.add(UserSkill(user_id=user_id, skill_name="k8s", trust_score=900.0, proficiency_level=0.2))
+    db.commit()
+
+    headers = {"Authorization": f"Bearer {create_access_token(user_id)}"}
+
+    first = client.get("/learning-path/k8s:pods", headers=headers).json()
+    before = adaptive_score_cache_stats()
+    second = client.get("/learning-path/k8s:pods", headers=headers).json()
+    after = adaptive_score_cache_stats()
+
+    assert first["user_elo"] == second["user_elo"] == 0.7 * 900.0 + 0.3 * 800.0
+    assert after["hits"] == before["hits"] + 1
+
+    # Completing a course bumps trust_score and must invalidate the cached score
+    response = client.post("/events", headers=headers, json={"event_type": "course_completed", "course_id": "k8s:pods"})
+    assert response.status_code == 200, response.text
+
+    third = client.get("/learning-path/k8s:pods", headers=headers).json()
+    assert third["user_elo"] == 0.7 * 950.0 + 0.3 * 800.0
+
+    db.close()
+    app.dependency_overrides.pop(get_db, None)
+    app.dependency_overrides.pop(get_async_db, None)
+    if os.path.exists("./test_adaptive_score_cache.db"):
+        os.remove("./test_adaptive_score_cache.db")
+
+if __name__ == "__main__":
+    test_adaptive_score_cache_invalidation()
@@ -0,0 +1,108 @@
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+# Import app and database
+from main import app
+from db.database import Base, get_db
+from models.course import Course
+from services.catalog_version import bump_catalog_version
+
+# Setup test DB
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_course_catalog.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+client = TestClient(app)
+
+def test_courses_keyset_pagination_and_etags():
+    app.dependency_overrides[get_db] = override_get_db
+
+    # Reset DB
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = TestingSessionLocal()
+    levels = [3, 1, None, 2, 1, 3, None, 2]
+    db.add_all([
+        Course(id=f"c{i}", roadmap_id="python" if i % 2 else "react", node_id=str(i), title=f"Course {i}", difficulty_level=level)
+        for i, level in enumerate(levels)
+    ])
+    db.commit()
+    bump_catalog_version(db)
+
+    expected = ["c1", "c4", "c3", "c7", "c0", "c5", "c2", "c6"]
+
+    # Walk the catalog 3 courses at a time
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 3} if cursor is None else {"limit": 3, "cursor": cursor}
+        response = client.get("/courses", params=params)
+        assert response.status_code == 200
+        seen += [c["id"] for c in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+    assert seen == expected
+
+    # Every page seeks the (difficulty_level, id) index instead of scanning it
+    statements = []
+    listener = lambda conn, cursor, statement, parameters, context, executemany: statements.append((statement, parameters))
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        # Rated courses only; rated then unrated; unrated only
+        response = client.get("/courses", params={"limit": 5})
+        response = client.get("/courses", params={"limit": 2, "cursor": response.headers["X-Next-Cursor"]})
+        assert [c["id"] for c in response.json()] == ["c5", "c2"]
+        response = client.get("/courses", params={"limit": 2, "cursor": response.headers["X-Next-Cursor"]})
+        assert [c["id"] for c in response.json()] == ["c6"]
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    page_queries = [(q, p) for q, p in statements if "FROM courses" in q and "LIMIT" in q]
+    assert len(page_queries) == 4
+    with engine.connect() as conn:
+        for query, parameters in page_queries:
+            plan = " ".join(row[-1] for row in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + query, parameters))
+            assert "SEARCH courses USING INDEX ix_courses_difficulty_id" in plan and "SCAN" not in plan, plan
+
+    response = client.get("/courses", params={"roadmap_id": "python", "limit": 2})
+    assert [c["id"] for c in response.json()] == ["c1", "c3"]
+    response = client.get("/courses", params={"roadmap_id": "python", "cursor": response.headers["X-Next-Cursor"]})
+    assert [c["id"] for c in response.json()] == ["c7", "c5"]
+    assert "X-Next-Cursor" not in response.headers
+
+    assert client.get("/courses", params={"cursor": "not-a-cursor"}).status_code == 400
+
+    # Conditional requests
+    response = client.get("/courses")
+    etag = response.headers["ETag"]
+    last_modified = response.headers["Last-Modified"]
+    assert client.get("/courses", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/courses", headers={"If-Modified-Since": last_modified}).status_code == 304
+
+    # A catalog rewrite changes the validator
+    bump_catalog_version(db)
+    response = client.get("/courses", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+    db.close()
+    app.dependency_overrides.pop(get_db, None)
+    if os.path.exists("./test_course_catalog.db"):
+        os.remove("./test_course_catalog.db")
+
+if __name__ == "__main__":
+    test_courses_keyset_pagination_and_etags()
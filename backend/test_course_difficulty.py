@@ -0,0 +1,88 @@
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from db.database import Base
+from models.course import Course
+from models.course_prerequisite import CoursePrerequisite
+from services.course_difficulty import compute_course_difficulty
+
+# Setup test DB
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_course_difficulty.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def levels(db, roadmap_id):
+    return dict(db.query(Course.id, Course.difficulty_level).filter(Course.roadmap_id == roadmap_id).all())
+
+def test_difficulty_engine_is_incremental_and_reports_cycles():
+    # Reset DB
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = TestingSessionLocal()
+    try:
+        db.add_all(
+            [Course(id=f"python:{n}", roadmap_id="python", node_id=n, title=n) for n in "abcd"]
+            + [Course(id=f"go:{n}", roadmap_id="go", node_id=n, title=n) for n in "wxyz"]
+        )
+        db.commit()
+        db.add_all([
+            # python: a -> b -> d and a -> c -> d (d depends on both)
+            CoursePrerequisite(course_id="python:b", prerequisite_id="python:a"),
+            CoursePrerequisite(course_id="python:c", prerequisite_id="python:a"),
+            CoursePrerequisite(course_id="python:d", prerequisite_id="python:b"),
+            CoursePrerequisite(course_id="python:d", prerequisite_id="python:c"),
+            # go: w -> x <-> y -> z, with a cycle between x and y
+            CoursePrerequisite(course_id="go:x", prerequisite_id="go:w"),
+            CoursePrerequisite(course_id="go:y", prerequisite_id="go:x"),
+            CoursePrerequisite(course_id="go:x", prerequisite_id="go:y"),
+            CoursePrerequisite(course_id="go:z", prerequisite_id="go:y"),
+        ])
+        db.commit()
+
+        report = compute_course_difficulty(db)
+        assert sorted(report.computed) == ["go", "python"]
+        assert report.courses_updated == 8
+        assert levels(db, "python") == {"python:a": 800, "python:b": 900, "python:c": 900, "python:d": 1000}
+        # The cycle counts as one step instead of silently resetting to depth 0
+        assert levels(db, "go") == {"go:w": 800, "go:x": 900, "go:y": 900, "go:z": 1000}
+        assert report.cycles == {"go": [["go:x", "go:y"]]}
+
+        # Unchanged graphs are skipped without touching any row
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            report = compute_course_difficulty(db)
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+        assert sorted(report.skipped) == ["go", "python"]
+        assert report.courses_updated == 0
+        assert not any(s.lstrip().upper().startswith("UPDATE") for s in statements)
+
+        # A new edge only recomputes its roadmap, and only changed rows are written
+        db.add(CoursePrerequisite(course_id="python:a", prerequisite_id="python:e"))
+        db.add(Course(id="python:e", roadmap_id="python", node_id="e", title="e"))
+        db.commit()
+        report = compute_course_difficulty(db)
+        assert report.computed == ["python"]
+        assert report.skipped == ["go"]
+        assert report.changed_roadmaps == ["python"]
+        assert report.courses_updated == 5
+        assert levels(db, "python")["python:d"] == 1100
+
+        report = compute_course_difficulty(db, ["go"], force=True)
+        assert (report.computed, report.courses_updated) == (["go"], 0)
+    finally:
+        db.close()
+        engine.dispose()
+        if os.path.exists("./test_course_difficulty.db"):
+            os.remove("./test_course_difficulty.db")
+
+if __name__ == "__main__":
+    test_difficulty_engine_is_incremental_and_reports_cycles()
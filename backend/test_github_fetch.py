@@ -0,0 +1,45 @@
+import sys
+import os
+import asyncio
+
+# Add backend to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import httpx
+
+from services import github_service
+from services.http_client import close_http_client, set_http_client
+from scripts.fake_github_server import create_fake_github_app
+
+def test_fetch_paginates_bounds_fan_out_and_backs_off():
+    app = create_fake_github_app(repo_count=150, latency=0.01, rate_limit_every=7, retry_after=0)
+    api_url = github_service.GITHUB_API_URL
+    github_service.GITHUB_API_URL = "http://fake-github"
+
+    async def crawl():
+        set_http_client(httpx.AsyncClient(transport=httpx.ASGITransport(app=app)))
+        try:
+            repos = await github_service.fetch_user_repositories("fake-token")
+            names = [r["full_name"] for r in repos]
+            return repos, await github_service.fetch_languages_for_repositories("fake-token", names, concurrency=5)
+        finally:
+            await close_http_client()
+
+    try:
+        repos, languages = asyncio.run(crawl())
+    finally:
+        github_service.GITHUB_API_URL = api_url
+
+    # 150 repos at 100 per page
+    assert len(repos) == 150
+    assert len({r["id"] for r in repos}) == 150
+
+    # Rate-limited calls were retried rather than dropped
+    assert app.state.stats.rate_limited > 0
+    assert len(languages) == 150
+    assert all(languages.values())
+
+    assert app.state.stats.max_in_flight <= 5
+
+if __name__ == "__main__":
+    test_fetch_paginates_bounds_fan_out_and_backs_off()
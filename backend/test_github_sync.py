@@ -0,0 +1,210 @@
+import sys
+import os
+import asyncio
+
+# Add backend to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import httpx
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+# Import app and database
+from main import app
+from db.database import Base, get_db
+from models import User
+from models.skill_weight import SkillWeight
+from models.github_repo_cache import GitHubRepoCache
+from core.security import create_access_token
+from routers import github_auth
+from services import github_service
+from services.http_client import close_http_client, set_http_client
+from services.job_runner import get_job_runner
+from services.github_skill_extractor import enqueue_github_sync
+from scripts.fake_github_server import create_fake_github_app
+
+# Setup test DB
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_github_sync.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+client = TestClient(app)
+
+def run_sync(fake_app, user_id):
+    async def sync():
+        set_http_client(httpx.AsyncClient(transport=httpx.ASGITransport(app=fake_app)))
+        try:
+            job = enqueue_github_sync(user_id, TestingSessionLocal)
+            await get_job_runner().join()
+            return job
+        finally:
+            await close_http_client()
+
+    return asyncio.run(sync())
+
+def test_github_sync_job_is_incremental():
+    app.dependency_overrides[get_db] = override_get_db
+
+    # Reset DB
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = TestingSessionLocal()
+    db.add(User(id="sync-user", email="sync@example.com", password_hash="pw",
+                github_id="1", github_username="fake-user", github_access_token="fake-token"))
+    db.add(User(id="plain-user", email="plain@example.com", password_hash="pw"))
+    db.commit()
+
+    fake_app = create_fake_github_app(repo_count=20, latency=0)
+    api_url = github_service.GITHUB_API_URL
+    github_service.GITHUB_API_URL = "http://fake-github"
+    try:
+        job = run_sync(fake_app, "sync-user")
+        assert job.status == "succeeded", job.error
+        assert job.result == {"repos": 20, "changed": 20, "skills": 8}
+        assert db.query(GitHubRepoCache).count() == 20
+        assert db.query(SkillWeight).filter(SkillWeight.user_id == "sync-user").count() == 8
+
+        # Only the pushed repo is downloaded again
+        fake_app.state.versions["repo-3"] = 2
+        job = run_sync(fake_app, "sync-user")
+        assert job.status == "succeeded", job.error
+        assert job.result["changed"] == 1
+        assert fake_app.state.stats.not_modified == 19
+    finally:
+        github_service.GITHUB_API_URL = api_url
+
+    headers = {"Authorization": f"Bearer {create_access_token('sync-user')}"}
+    status = client.get("/auth/github/status", headers=headers).json()
+    assert status["connected"] is True
+    assert status["sync"]["status"] == "succeeded"
+    assert status["sync"]["id"] == job.id
+
+    headers = {"Authorization": f"Bearer {create_access_token('plain-user')}"}
+    assert client.get("/auth/github/status", headers=headers).json()["sync"] is None
+    assert client.post("/auth/github/sync", headers=headers).status_code == 400
+
+    db.close()
+    app.dependency_overrides.pop(get_db, None)
+    if os.path.exists("./test_github_sync.db"):
+        os.remove("./test_github_sync.db")
+
+def test_github_sync_keeps_cache_when_listing_is_incomplete():
+    # Reset DB (pooled connections may still point at a removed file)
+    engine.dispose()
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = TestingSessionLocal()
+    db.add(User(id="sync-user", email="sync@example.com", password_hash="pw",
+                github_id="1", github_username="fake-user", github_access_token="fake-token"))
+    db.commit()
+
+    def weights():
+        return dict(db.query(SkillWeight.skill_name, SkillWeight.weight).filter(SkillWeight.user_id == "sync-user").all())
+
+    fake_app = create_fake_github_app(repo_count=150, latency=0)
+    api_url = github_service.GITHUB_API_URL
+    github_service.GITHUB_API_URL = "http://fake-github"
+    try:
+        job = run_sync(fake_app, "sync-user")
+        assert job.status == "succeeded", job.error
+        assert db.query(GitHubRepoCache).count() == 150
+        before = weights()
+
+        # Page 2 fails: repos 100-149 are unlisted, not deleted
+        fake_app.state.failing_repo_pages.add(2)
+        fake_app.state.versions["repo-3"] = 2
+        job = run_sync(fake_app, "sync-user")
+        assert job.status == "succeeded", job.error
+        assert job.result["repos"] == 100
+        assert db.query(GitHubRepoCache).count() == 150
+        db.expire_all()
+        assert weights().keys() == before.keys()
+
+        # The same shortfall from the page cap is treated alike
+        fake_app.state.failing_repo_pages.clear()
+        max_pages = github_service.GITHUB_MAX_REPO_PAGES
+        github_service.GITHUB_MAX_REPO_PAGES = 1
+        try:
+            job = run_sync(fake_app, "sync-user")
+        finally:
+            github_service.GITHUB_MAX_REPO_PAGES = max_pages
+        assert job.status == "succeeded", job.error
+        assert db.query(GitHubRepoCache).count() == 150
+    finally:
+        github_service.GITHUB_API_URL = api_url
+        db.close()
+        if os.path.exists("./test_github_sync.db"):
+            os.remove("./test_github_sync.db")
+
+def test_github_callback_links_account_off_the_event_loop():
+    # Reset DB (pooled connections may still point at a removed file)
+    engine.dispose()
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = TestingSessionLocal()
+    db.add(User(id="link-user", email="link@example.com", password_hash="pw"))
+    db.commit()
+
+    # Statements executed on the event loop thread
+    on_loop = []
+    def listener(conn, cursor, statement, parameters, context, executemany):
+        try:
+            asyncio.get_running_loop()
+            on_loop.append(statement)
+        except RuntimeError:
+            pass
+
+    async def callback():
+        set_http_client(httpx.AsyncClient(transport=httpx.ASGITransport(app=create_fake_github_app(latency=0))))
+        session = TestingSessionLocal()
+        try:
+            return await github_auth.github_callback(code="abc", state=create_access_token("link-user"), db=session)
+        finally:
+            session.close()
+            await close_http_client()
+
+    enqueued = []
+    env = {"GITHUB_CLIENT_ID": "id", "GITHUB_CLIENT_SECRET": "secret", "GITHUB_REDIRECT_URI": "http://app/callback"}
+    saved_env = {name: os.environ.get(name) for name in env}
+    urls = github_service.GITHUB_URL, github_service.GITHUB_API_URL
+    enqueue = github_auth.enqueue_github_sync
+    os.environ.update(env)
+    github_service.GITHUB_URL = github_service.GITHUB_API_URL = "http://fake-github"
+    github_auth.enqueue_github_sync = lambda user_id, session_factory: enqueued.append(user_id)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        response = asyncio.run(callback())
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+        github_auth.enqueue_github_sync = enqueue
+        github_service.GITHUB_URL, github_service.GITHUB_API_URL = urls
+        for name, value in saved_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+    assert response.status_code == 307
+    assert on_loop == []
+    assert enqueued == ["link-user"]
+    user = db.query(User).filter(User.id == "link-user").one()
+    assert (user.github_id, user.github_username, user.github_access_token) == ("1", "fake-user", "fake-token")
+
+    db.close()
+    if os.path.exists("./test_github_sync.db"):
+        os.remove("./test_github_sync.db")
+
+if __name__ == "__main__":
+    test_github_sync_job_is_incremental()
+    test_github_sync_keeps_cache_when_listing_is_incomplete()
+    test_github_callback_links_account_off_the_event_loop()
@@ -0,0 +1,117 @@
+import sys
+import os
+import json
+import tempfile
+
+# Add backend to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from db.database import Base
+from models.course import Course
+from models.ingestion_manifest import IngestionManifest
+from models.roadmap_summary import RoadmapSummary
+from services.course_difficulty import compute_course_difficulty
+from services.ingestion_manifest import (
+    ROADMAPS_PIPELINE, clear_pending, forget_missing_files, get_pending, record_files, scan_files
+)
+from services.roadmap_ingestion import ingest_roadmaps
+from services.roadmap_summary import rebuild_roadmap_summaries
+
+# Setup test DB
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_ingestion_manifest.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def write_roadmap(directory, roadmap_id, titles):
+    nodes = [{"id": str(i), "type": "topic", "data": {"label": title}} for i, title in enumerate(titles)]
+    edges = [{"source": str(i), "target": str(i + 1)} for i in range(len(titles) - 1)]
+    path = os.path.join(directory, f"{roadmap_id}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"nodes": nodes, "edges": edges}, f)
+    return path
+
+def run(db, files):
+    scan = scan_files(db, ROADMAPS_PIPELINE, files)
+    record_files(db, ROADMAPS_PIPELINE, list(scan.touched.values()))
+    forget_missing_files(db, ROADMAPS_PIPELINE, set(files))
+    db.commit()
+    report = ingest_roadmaps(db, sorted(scan.changed), workers=1, manifest=scan.changed)
+    return scan, report
+
+def test_manifest_skips_untouched_roadmaps():
+    # Reset DB
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = TestingSessionLocal()
+    with tempfile.TemporaryDirectory() as directory:
+        python_path = write_roadmap(directory, "python", ["Basics", "Functions"])
+        react_path = write_roadmap(directory, "react", ["JSX", "Hooks", "State"])
+        files = {python_path: "python", react_path: "react"}
+
+        scan, report = run(db, files)
+        assert sorted(scan.changed) == sorted(files)
+        assert report.changed_roadmaps == ["python", "react"]
+        assert db.query(IngestionManifest).count() == 2
+        # Marked pending with the rows, until derived tables are rebuilt
+        assert get_pending(db, ROADMAPS_PIPELINE) == ["python", "react"]
+
+        compute_course_difficulty(db)
+        rebuild_roadmap_summaries(db)
+        clear_pending(db, ROADMAPS_PIPELINE, ["python", "react"])
+        db.commit()
+
+        # Nothing changed: no file is even read
+        scan, report = run(db, files)
+        assert (len(scan.changed), len(scan.touched), scan.unchanged) == (0, 0, 2)
+        assert report.files == 0
+
+        # Same content, new mtime: only the manifest row is refreshed
+        os.utime(react_path, (1, 1))
+        scan, report = run(db, files)
+        assert list(scan.touched) == [react_path]
+        assert report.files == 0
+        assert db.query(IngestionManifest.mtime).filter(IngestionManifest.source_path == react_path).scalar() == 1
+
+        # One roadmap edited: only it is parsed, and downstream work is scoped to it
+        write_roadmap(directory, "python", ["Basics", "Functions", "Classes"])
+        scan, report = run(db, files)
+        assert list(scan.changed) == [python_path]
+        assert report.changed_roadmaps == ["python"]
+        assert report.courses_inserted == 1
+        assert get_pending(db, ROADMAPS_PIPELINE) == ["python"]
+
+        # Downstream work failed: the file is recorded, but the roadmap stays
+        # pending so the next run still rebuilds it
+        db.rollback()
+        scan, report = run(db, files)
+        assert (len(scan.changed), report.changed_roadmaps) == (0, [])
+        assert get_pending(db, ROADMAPS_PIPELINE) == ["python"]
+
+        db.query(Course).filter(Course.roadmap_id == "react").update({"difficulty_level": 1})
+        db.commit()
+        compute_course_difficulty(db, get_pending(db, ROADMAPS_PIPELINE))
+        rebuild_roadmap_summaries(db, get_pending(db, ROADMAPS_PIPELINE))
+        assert db.query(Course.difficulty_level).filter(Course.id == "python:2").scalar() == 1000
+        assert {r[0] for r in db.query(Course.difficulty_level).filter(Course.roadmap_id == "react")} == {1}
+        assert db.query(RoadmapSummary.topic_count).filter(RoadmapSummary.roadmap_id == "python").scalar() == 3
+        assert db.query(RoadmapSummary.topic_count).filter(RoadmapSummary.roadmap_id == "react").scalar() == 3
+        clear_pending(db, ROADMAPS_PIPELINE, ["python"])
+        db.commit()
+        assert get_pending(db, ROADMAPS_PIPELINE) == []
+
+        # A deleted file leaves the manifest; the catalog keeps its courses
+        os.remove(react_path)
+        del files[react_path]
+        run(db, files)
+        assert [r[0] for r in db.query(IngestionManifest.source_path)] == [python_path]
+        assert db.query(Course).filter(Course.roadmap_id == "react").count() == 3
+
+    db.close()
+    if os.path.exists("./test_ingestion_manifest.db"):
+        os.remove("./test_ingestion_manifest.db")
+
+if __name__ == "__main__":
+    test_manifest_skips_untouched_roadmaps()
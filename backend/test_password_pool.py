@@ -0,0 +1,64 @@
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+# Import app and database
+from main import app
+from db.database import Base, get_async_db
+from core.passwords import password_hash_pool
+
+# Setup test DB
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_password_pool.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+# NullPool: TestClient may run each request on a fresh event loop
+async_engine = create_async_engine("sqlite+aiosqlite:///./test_password_pool.db", poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+async def override_get_async_db():
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+client = TestClient(app)
+
+def test_signup_and_login_through_hash_pool():
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+    # Reset DB
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    credentials = {"email": "pool@example.com", "password": "password123"}
+    response = client.post("/auth/signup", json=credentials)
+    assert response.status_code == 200, response.text
+    user_id = response.json()["user_id"]
+
+    response = client.post("/auth/login", json=credentials)
+    assert response.status_code == 200, response.text
+    assert response.json()["user_id"] == user_id
+
+    response = client.post("/auth/login", json={**credentials, "password": "wrong"})
+    assert response.status_code == 401
+
+    # A full pool rejects instead of queueing
+    max_pending = password_hash_pool.max_pending
+    password_hash_pool.max_pending = 0
+    try:
+        response = client.post("/auth/login", json=credentials)
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+    finally:
+        password_hash_pool.max_pending = max_pending
+
+    password_hash_pool.shutdown()
+    app.dependency_overrides.pop(get_async_db, None)
+    if os.path.exists("./test_password_pool.db"):
+        os.remove("./test_password_pool.db")
+
+if __name__ == "__main__":
+    test_signup_and_login_through_hash_pool()
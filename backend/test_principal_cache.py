@@ -0,0 +1,86 @@
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+# Import app and database
+from main import app
+from db.database import Base, get_db
+from models import User
+from core.security import create_access_token, principal_cache, principal_cache_stats
+
+# Setup test DB
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_principal_cache.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+client = TestClient(app)
+
+def test_principal_cache_skips_users_query():
+    app.dependency_overrides[get_db] = override_get_db
+
+    # Reset DB
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    principal_cache.clear()
+
+    db = TestingSessionLocal()
+    db.add(User(id="principal-user", email="principal@example.com", password_hash="pw"))
+    db.commit()
+
+    before = principal_cache_stats()
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+
+    headers = {"Authorization": f"Bearer {create_access_token('principal-user')}"}
+    response = client.get("/auth/github/status", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["connected"] is False
+    assert len(statements) == 1
+
+    # Cached: no users query at all
+    response = client.get("/auth/github/status", headers=headers)
+    assert response.status_code == 200
+    assert len(statements) == 1
+
+    event.remove(engine, "before_cursor_execute", listener)
+
+    stats = principal_cache_stats()
+    assert stats["db_fallbacks"] - before["db_fallbacks"] == 1
+    assert stats["hits"] - before["hits"] == 1
+
+    # Linking GitHub through the ORM drops the cached principal
+    user = db.query(User).filter(User.id == "principal-user").first()
+    user.github_id = "42"
+    user.github_username = "octocat"
+    db.commit()
+
+    response = client.get("/auth/github/status", headers=headers)
+    assert response.json()["connected"] is True
+    assert response.json()["username"] == "octocat"
+
+    # So does deleting the user
+    db.delete(user)
+    db.commit()
+    response = client.get("/auth/github/status", headers=headers)
+    assert response.status_code == 401
+
+    db.close()
+    app.dependency_overrides.pop(get_db, None)
+    if os.path.exists("./test_principal_cache.db"):
+        os.remove("./test_principal_cache.db")
+
+if __name__ == "__main__":
+    test_principal_cache_skips_users_query()
@@ -0,0 +1,96 @@
+import sys
+import os
+import json
+
+# Add backend to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+# Import app and database
+from main import app
+from db.database import Base, get_async_db, get_db
+from models import User, SkillQuiz, SkillProfile, Event
+from models.course import Course
+from core.security import create_access_token
+from services.quiz_cache import parse_quiz
+
+# Setup test DB
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_quiz_cache.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# NullPool: TestClient may run each request on a fresh event loop
+async_engine = create_async_engine("sqlite+aiosqlite:///./test_quiz_cache.db", poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+async def override_get_async_db():
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+client = TestClient(app)
+
+QUESTIONS = [
+    {"question": f"Q{i}", "options": ["A", "B", "C", "D"], "correct_answer": "B", "explanation": "B"}
+    for i in range(4)
+]
+
+def test_quiz_served_and_graded_from_parsed_cache():
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+    # Reset DB
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = TestingSessionLocal()
+    user_id = "quiz-user"
+    db.add(User(id=user_id, email="quiz@example.com", password_hash="pw"))
+    db.add(Course(id="css:grid", roadmap_id="css", node_id="grid", title="Grid"))
+    db.commit()
+    db.add(SkillQuiz(skill_id="css:grid", questions=json.dumps(QUESTIONS), passing_score=100))
+    db.commit()
+
+    response = client.get("/quiz/css:grid")
+    assert response.status_code == 200, response.text
+    questions = response.json()["questions"]
+    assert len(questions) == 4
+    assert all("correct_answer" not in q for q in questions)
+
+    quiz = db.query(SkillQuiz).first()
+    parsed = parse_quiz(quiz)
+    assert parse_quiz(quiz) is parsed
+    assert dict(parsed.answer_key) == {f"q{i}": "B" for i in range(4)}
+
+    headers = {"Authorization": f"Bearer {create_access_token(user_id)}"}
+    wrong = client.post("/quiz/css:grid/submit", headers=headers, json={"answers": {"q0": "B", "q1": "A"}})
+    assert wrong.json()["score"] == 25.0
+    assert not wrong.json()["passed"]
+
+    right = client.post("/quiz/css:grid/submit", headers=headers, json={"answers": {f"q{i}": "B" for i in range(4)}})
+    assert right.status_code == 200, right.text
+    assert right.json()["passed"]
+
+    # Both attempts updated the profile; only the passing one completed the course
+    profile = db.query(SkillProfile).filter(SkillProfile.user_id == user_id).one()
+    assert abs(profile.quiz_confidence - 0.4) < 1e-9
+    assert db.query(Event).filter(Event.user_id == user_id).count() == 1
+    assert client.get("/progress/css", headers=headers).json()["completed_courses"] == 1
+
+    db.close()
+    app.dependency_overrides.pop(get_db, None)
+    app.dependency_overrides.pop(get_async_db, None)
+    if os.path.exists("./test_quiz_cache.db"):
+        os.remove("./test_quiz_cache.db")
+
+if __name__ == "__main__":
+    test_quiz_served_and_graded_from_parsed_cache()
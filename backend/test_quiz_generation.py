@@ -0,0 +1,85 @@
+import sys
+import os
+import asyncio
+
+# Add backend to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+# Import app and database
+import main
+from db.database import Base
+from models import SkillQuiz
+from models.course import Course
+from services import quiz_generation_service
+from services.quiz_cache import parse_quiz
+from services.quiz_generation_service import (
+    get_or_generate_quiz,
+    quiz_pregeneration_queue,
+    set_quiz_text_generator,
+    stub_generate_text,
+)
+
+# Setup test DB
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_quiz_generation.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# NullPool: each asyncio.run() below uses a fresh event loop
+async_engine = create_async_engine("sqlite+aiosqlite:///./test_quiz_generation.db", poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+def test_quiz_generation_single_flight_and_queue():
+    # Reset DB
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = TestingSessionLocal()
+    db.add_all([
+        Course(id=f"bash:{i}", roadmap_id="bash", node_id=str(i), title=f"Bash {i}")
+        for i in range(1, 4)
+    ])
+    db.commit()
+
+    calls = []
+
+    async def slow_stub(prompt: str) -> str:
+        calls.append(prompt)
+        await asyncio.sleep(0.05)
+        return await stub_generate_text(prompt)
+
+    set_quiz_text_generator(slow_stub)
+
+    async def concurrent_requests():
+        sessions = [TestingAsyncSessionLocal() for _ in range(5)]
+        try:
+            return await asyncio.gather(*(get_or_generate_quiz("bash:1", s) for s in sessions))
+        finally:
+            for s in sessions:
+                await s.close()
+
+    quizzes = asyncio.run(concurrent_requests())
+    assert len(calls) == 1
+    assert len({q.id for q in quizzes}) == 1
+    assert len(parse_quiz(quizzes[0]).questions) == 4
+
+    async def pregenerate():
+        queued = quiz_pregeneration_queue.enqueue(["bash:1", "bash:2", "bash:3", "bash:3"], TestingAsyncSessionLocal)
+        await quiz_pregeneration_queue.join()
+        await quiz_pregeneration_queue.stop()
+        return queued
+
+    assert asyncio.run(pregenerate()) == 3
+    assert len(calls) == 3
+    assert db.query(SkillQuiz).count() == 3
+    assert not quiz_generation_service._inflight
+
+    set_quiz_text_generator(quiz_generation_service.gemini_generate_text)
+    db.close()
+    if os.path.exists("./test_quiz_generation.db"):
+        os.remove("./test_quiz_generation.db")
+
+if __name__ == "__main__":
+    test_quiz_generation_single_flight_and_queue()
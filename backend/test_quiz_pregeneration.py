@@ -0,0 +1,113 @@
+import sys
+import os
+import json
+import time
+import asyncio
+
+# Add backend to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+from db.database import Base
+from models import SkillQuiz
+from models.course import Course
+from services import quiz_generation_service
+from services.quiz_generation_service import set_quiz_text_generator, stub_generate_text
+from scripts import pregenerate_quizzes
+from scripts.pregenerate_quizzes import (
+    RateLimiter,
+    find_skills_with_invalid_quiz,
+    find_skills_without_quiz,
+    percentile,
+    pregenerate,
+    remove_skill_quizzes,
+)
+
+# Setup test DB
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_quiz_pregeneration.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# NullPool: each asyncio.run() below uses a fresh event loop
+async_engine = create_async_engine("sqlite+aiosqlite:///./test_quiz_pregeneration.db", poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+def test_rate_limiter_and_percentile():
+    async def timed_acquires(limiter, count):
+        started = time.monotonic()
+        for _ in range(count):
+            await limiter.acquire()
+        return time.monotonic() - started
+
+    # The burst is free, later acquisitions wait for tokens
+    assert asyncio.run(timed_acquires(RateLimiter(20, burst=3), 3)) < 0.04
+    assert asyncio.run(timed_acquires(RateLimiter(20, burst=1), 3)) >= 0.09
+
+    assert percentile([], 50) == 0.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.5
+    assert percentile([1.0, 2.0, 3.0, 4.0], 100) == 4.0
+
+def test_pregeneration_retries_and_resumes():
+    # Reset DB
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = TestingSessionLocal()
+    db.add_all([
+        Course(id=f"bash:{i}", roadmap_id="bash", node_id=str(i), title=f"Bash {i}")
+        for i in range(1, 5)
+    ])
+    db.add_all([
+        SkillQuiz(skill_id="bash:1", questions=json.dumps([{"question": "?"}] * 4), passing_score=100),
+        # Incomplete: only replaced when asked to
+        SkillQuiz(skill_id="bash:4", questions="[]", passing_score=100),
+    ])
+    db.commit()
+
+    calls = []
+
+    async def flaky_stub(prompt: str) -> str:
+        calls.append(prompt)
+        # First attempt for Bash 2 hits a transient upstream failure
+        if "Bash 2" in prompt and sum("Bash 2" in c for c in calls) == 1:
+            raise HTTPException(status_code=503, detail="Quiz generation temporarily unavailable")
+        return await stub_generate_text(prompt)
+
+    previous_generator = quiz_generation_service._quiz_text_generator
+    set_quiz_text_generator(flaky_stub)
+    base_delay = pregenerate_quizzes.RETRY_BASE_SECONDS
+    pregenerate_quizzes.RETRY_BASE_SECONDS = 0.01
+    try:
+        assert find_skills_with_invalid_quiz(db) == ["bash:4"]
+        assert find_skills_without_quiz(db) == ["bash:2", "bash:3"]
+        assert db.query(SkillQuiz).count() == 2
+
+        remove_skill_quizzes(db, find_skills_with_invalid_quiz(db))
+        assert find_skills_without_quiz(db, "bash") == ["bash:2", "bash:3", "bash:4"]
+        assert find_skills_without_quiz(db, "git") == []
+
+        # A missing course is a 404: reported as failed without retrying
+        skill_ids = find_skills_without_quiz(db) + ["bash:9"]
+        results = asyncio.run(pregenerate(skill_ids, 2, 1000, 2, TestingAsyncSessionLocal))
+        assert [r is not None for r in results] == [True, True, True, False]
+        assert sum("Bash 2" in c for c in calls) == 2
+        assert len(calls) == 4
+
+        # Resume: every stored quiz is valid and nothing is left to generate
+        assert find_skills_without_quiz(db) == []
+        assert find_skills_with_invalid_quiz(db) == []
+        assert db.query(SkillQuiz).count() == 4
+        assert not quiz_generation_service._inflight
+    finally:
+        pregenerate_quizzes.RETRY_BASE_SECONDS = base_delay
+        set_quiz_text_generator(previous_generator)
+        db.close()
+        if os.path.exists("./test_quiz_pregeneration.db"):
+            os.remove("./test_quiz_pregeneration.db")
+
+if __name__ == "__main__":
+    test_rate_limiter_and_percentile()
+    test_pregeneration_retries_and_resumes()
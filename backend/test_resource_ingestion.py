@@ -0,0 +1,106 @@
+import sys
+import os
+import json
+import tempfile
+
+# Add backend to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from db.database import Base
+from models.course import Course
+from models.course_resource import CourseResource
+from models.ingestion_manifest import IngestionManifest
+from services.ingestion_manifest import RESOURCES_PIPELINE, scan_files
+from services import resource_ingestion
+from services.resource_ingestion import collect_resource_sources, ingest_resources
+
+# Setup test DB
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_resource_ingestion.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def write_content(directory, roadmap_id, node_id, lines):
+    with open(os.path.join(directory, roadmap_id, "content", f"topic@{node_id}.md"), "w", encoding="utf-8") as f:
+        f.write("\n".join(["# Topic", "", *lines]) + "\n")
+
+def run(db, directory, workers):
+    sources = collect_resource_sources(directory)
+    scan = scan_files(db, RESOURCES_PIPELINE, sources.files)
+    return ingest_resources(db, sources, scan.changed, workers)
+
+def test_resource_ingestion_preloads_and_bulk_inserts():
+    # Reset DB
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = TestingSessionLocal()
+    db.add_all([
+        Course(id="python:a", roadmap_id="python", node_id="a", title="Basics", difficulty_level=800),
+        Course(id="python:b", roadmap_id="python", node_id="b", title="Functions", difficulty_level=900),
+    ])
+    db.commit()
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.makedirs(os.path.join(directory, "python", "content"))
+        with open(os.path.join(directory, "python", "python.json"), "w") as f:
+            json.dump({"nodes": [{"id": "a"}, {"id": "b"}, {"id": "c"}]}, f)
+        write_content(directory, "python", "a", [
+            "- [@video@Intro](https://www.youtube.com/watch?v=abc123&t=5)",
+            "- [@article@Docs](https://docs.python.org)",
+            "- [Docs again](https://docs.python.org)",
+        ])
+        write_content(directory, "python", "b", ["- [Repo](https://github.com/python/cpython)"])
+        # No course for node c yet
+        write_content(directory, "python", "c", ["- [Later](https://example.com/later)"])
+
+        # Force the process pool even for a handful of files
+        min_files = resource_ingestion.RESOURCE_POOL_MIN_FILES
+        resource_ingestion.RESOURCE_POOL_MIN_FILES = 0
+        try:
+            report = run(db, directory, workers=2)
+        finally:
+            resource_ingestion.RESOURCE_POOL_MIN_FILES = min_files
+        assert (report.added, report.skipped, report.missing_courses) == (3, 1, 1)
+        assert report.affected_roadmaps == ["python"]
+
+        video = db.query(CourseResource).filter(CourseResource.platform == "youtube").one()
+        assert (video.course_id, video.resource_type, video.youtube_video_id, video.is_primary, video.difficulty_level) == (
+            "python:a", "video", "abc123", True, 800
+        )
+        docs = db.query(CourseResource).filter(CourseResource.url == "https://docs.python.org").one()
+        assert (docs.resource_type, docs.platform, docs.is_primary) == ("article", "docs", False)
+
+        # The file without a course stays unrecorded so it is retried
+        recorded = {r[0] for r in db.query(IngestionManifest.source_path)}
+        assert not any(path.endswith("topic@c.md") for path in recorded)
+
+        db.add(Course(id="python:c", roadmap_id="python", node_id="c", title="Classes", difficulty_level=1000))
+        db.commit()
+        write_content(directory, "python", "a", [
+            "- [@video@Intro](https://www.youtube.com/watch?v=abc123&t=5)",
+            "- [New](https://medium.com/new)",
+        ])
+
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(engine, "before_cursor_execute", listener)
+        report = run(db, directory, workers=1)
+        event.remove(engine, "before_cursor_execute", listener)
+
+        assert (report.added, report.skipped, report.missing_courses, report.files_parsed) == (2, 1, 0, 2)
+        # Manifest read, two preloads, one resource insert, one pending mark, one manifest upsert
+        assert len([s for s in statements if s.lstrip().upper().startswith(("SELECT", "INSERT"))]) == 6
+        assert db.query(CourseResource).count() == 5
+
+        # Nothing changed: nothing parsed
+        report = run(db, directory, workers=1)
+        assert (report.added, report.files_parsed) == (0, 0)
+
+    db.close()
+    if os.path.exists("./test_resource_ingestion.db"):
+        os.remove("./test_resource_ingestion.db")
+
+if __name__ == "__main__":
+    test_resource_ingestion_preloads_and_bulk_inserts()
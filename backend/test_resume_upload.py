@@ -0,0 +1,118 @@
+import sys
+import os
+import time
+
+# Add backend to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+# Import app and database
+from main import app
+from db.database import Base, get_db
+from models import User
+from models.course import Course
+from models.skill_weight import SkillWeight
+from core.security import create_access_token
+from routers import resume
+
+# Setup test DB
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_resume_upload.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+SAMPLE_RESUME = os.path.join(os.path.dirname(os.path.abspath(__file__)), "uploads", "resumes", "41c34f0d-ec97-4ceb-8c4b-8186084b0e7c_dummy_resume.pdf")
+
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+def wait_for_job(client, job_id, headers):
+    for _ in range(200):
+        job = client.get(f"/resume/jobs/{job_id}", headers=headers).json()
+        if job["status"] in ("succeeded", "failed"):
+            return job
+        time.sleep(0.05)
+    raise AssertionError("resume job did not finish")
+
+def test_resume_upload_runs_in_background_and_dedupes():
+    app.dependency_overrides[get_db] = override_get_db
+
+    # Reset DB
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = TestingSessionLocal()
+    user_id = "resume-user"
+    db.add(User(id=user_id, email="resume@example.com", password_hash="pw"))
+    db.add_all([
+        Course(id="python:1", roadmap_id="python", node_id="1", title="Python 1"),
+        Course(id="react:1", roadmap_id="react", node_id="1", title="React 1"),
+        Course(id="go:1", roadmap_id="go", node_id="1", title="Go 1"),
+    ])
+    db.commit()
+
+    with open(SAMPLE_RESUME, "rb") as f:
+        content = f.read()
+
+    headers = {"Authorization": f"Bearer {create_access_token(user_id)}"}
+    stored_files = []
+    with TestClient(app) as client:
+        response = client.post("/resume/upload", headers=headers, files={"file": ("resume.pdf", content, "application/pdf")})
+        assert response.status_code == 202, response.text
+        assert response.json()["deduplicated"] is False
+        job_id = response.json()["job_id"]
+
+        job = wait_for_job(client, job_id, headers)
+        assert job["status"] == "succeeded", job["error"]
+        assert job["result"]["skills"] == ["python", "react"]
+        assert job["progress"]["stage"] == "done"
+        assert job["progress"]["pages_done"] == job["progress"]["pages_total"] == 1
+
+        # Same bytes again: no second parse
+        response = client.post("/resume/upload", headers=headers, files={"file": ("copy.pdf", content, "application/pdf")})
+        assert response.json() == {"status": "succeeded", "job_id": job_id, "deduplicated": True}
+        stored_files = [f for f in os.listdir(resume.UPLOAD_DIR) if f.startswith(user_id)]
+        assert len(stored_files) == 1
+
+        # Other users cannot read the job
+        other = {"Authorization": f"Bearer {create_access_token('someone-else')}"}
+        db.add(User(id="someone-else", email="else@example.com", password_hash="pw"))
+        db.commit()
+        assert client.get(f"/resume/jobs/{job_id}", headers=other).status_code == 404
+
+        max_bytes = resume.RESUME_MAX_BYTES
+        resume.RESUME_MAX_BYTES = 10
+        try:
+            # Within the multipart allowance: caught while streaming to disk
+            response = client.post("/resume/upload", headers=headers, files={"file": ("big.pdf", content, "application/pdf")})
+            assert response.status_code == 413
+
+            # Declared Content-Length over the cap: rejected before the body is read
+            save_upload = resume.save_upload
+            resume.save_upload = None
+            try:
+                oversized = b"%PDF" + b"0" * (resume.MULTIPART_OVERHEAD_BYTES + 100)
+                response = client.post("/resume/upload", headers=headers, files={"file": ("big.pdf", oversized, "application/pdf")})
+                assert response.status_code == 413
+            finally:
+                resume.save_upload = save_upload
+        finally:
+            resume.RESUME_MAX_BYTES = max_bytes
+
+    weights = {w.skill_name for w in db.query(SkillWeight).filter(SkillWeight.user_id == user_id)}
+    assert weights == {"python", "react"}
+
+    db.close()
+    for name in stored_files:
+        os.remove(os.path.join(resume.UPLOAD_DIR, name))
+    app.dependency_overrides.pop(get_db, None)
+    if os.path.exists("./test_resume_upload.db"):
+        os.remove("./test_resume_upload.db")
+
+if __name__ == "__main__":
+    test_resume_upload_runs_in_background_and_dedupes()
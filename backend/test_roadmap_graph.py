@@ -0,0 +1,101 @@
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+# Import app and database
+from main import app
+from db.database import Base, get_async_db, get_db
+from models import User
+from models.course import Course
+from models.course_prerequisite import CoursePrerequisite
+from core.security import create_access_token
+from services.catalog_version import bump_catalog_version
+from services.roadmap_graph import get_compiled_graph
+
+# Setup test DB
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_roadmap_graph.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# NullPool: TestClient may run each request on a fresh event loop
+async_engine = create_async_engine("sqlite+aiosqlite:///./test_roadmap_graph.db", poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+async def override_get_async_db():
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+client = TestClient(app)
+
+def test_learning_path_uses_compiled_graph():
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+    # Reset DB
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = TestingSessionLocal()
+
+    user = User(id="graph-user", email="graph@example.com", password_hash="pw")
+    db.add(user)
+
+    # a -> b -> d, a -> c -> d, plus an unrelated roadmap
+    db.add_all([
+        Course(id="go:a", roadmap_id="go", node_id="a", title="A", difficulty_level=800),
+        Course(id="go:b", roadmap_id="go", node_id="b", title="B", difficulty_level=900),
+        Course(id="go:c", roadmap_id="go", node_id="c", title="C", difficulty_level=900),
+        Course(id="go:d", roadmap_id="go", node_id="d", title="D", difficulty_level=1000),
+        Course(id="rust:a", roadmap_id="rust", node_id="a", title="Rust A", difficulty_level=800),
+    ])
+    db.commit()
+    db.add_all([
+        CoursePrerequisite(course_id="go:b", prerequisite_id="go:a"),
+        CoursePrerequisite(course_id="go:c", prerequisite_id="go:a"),
+        CoursePrerequisite(course_id="go:d", prerequisite_id="go:b"),
+        CoursePrerequisite(course_id="go:d", prerequisite_id="go:c"),
+    ])
+    db.commit()
+    bump_catalog_version(db)
+
+    headers = {"Authorization": f"Bearer {create_access_token('graph-user')}"}
+    response = client.get("/learning-path/go:d", headers=headers)
+    assert response.status_code == 200, response.text
+
+    data = response.json()
+    assert [c["id"] for c in data["path"]][0] == "go:a"
+    assert sorted(c["id"] for c in data["path"]) == ["go:a", "go:b", "go:c", "go:d"]
+
+    graph = get_compiled_graph(db)
+    assert graph.roadmap_size("go") == 4
+    assert {n.id for n in graph.ancestors("go:b")} == {"go:a"}
+
+    # Courses added later are picked up without waiting for a version bump
+    db.add(Course(id="go:e", roadmap_id="go", node_id="e", title="E", difficulty_level=800))
+    db.commit()
+    response = client.get("/learning-path/go:e", headers=headers)
+    assert response.status_code == 200, response.text
+
+    assert client.get("/learning-path/go:missing", headers=headers).status_code == 404
+
+    db.close()
+    app.dependency_overrides.pop(get_db, None)
+    app.dependency_overrides.pop(get_async_db, None)
+    if os.path.exists("./test_roadmap_graph.db"):
+        os.remove("./test_roadmap_graph.db")
+
+if __name__ == "__main__":
+    test_learning_path_uses_compiled_graph()
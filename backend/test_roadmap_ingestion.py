@@ -0,0 +1,85 @@
+import sys
+import os
+import json
+import tempfile
+
+# Add backend to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from db.database import Base
+from models.course import Course
+from models.course_prerequisite import CoursePrerequisite
+from services.roadmap_ingestion import ingest_roadmaps
+from services.roadmap_parsing import find_roadmap_files
+
+# Setup test DB
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_roadmap_ingestion.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def topic(node_id, title):
+    return {"id": node_id, "type": "topic", "data": {"label": title}}
+
+def write_roadmap(directory, roadmap_id, nodes, edges):
+    with open(os.path.join(directory, f"{roadmap_id}.json"), "w", encoding="utf-8") as f:
+        json.dump({"nodes": nodes, "edges": [{"source": s, "target": t} for s, t in edges]}, f)
+
+def test_roadmap_ingestion_diffs_and_bulk_writes():
+    # Reset DB
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = TestingSessionLocal()
+    with tempfile.TemporaryDirectory() as directory:
+        write_roadmap(directory, "python", [
+            topic("a", "Basics"), topic("b", "Functions"), topic("c", "Classes"),
+            {"id": "t", "type": "title", "data": {"label": "Python"}},
+        ], [("a", "b"), ("b", "c"), ("t", "a")])
+        write_roadmap(directory, "react", [topic("x", "JSX"), topic("y", "Hooks")], [("x", "y")])
+        with open(os.path.join(directory, "meta.json"), "w") as f:
+            json.dump({"name": "not a roadmap"}, f)
+        with open(os.path.join(directory, "broken.json"), "w") as f:
+            f.write("{")
+
+        paths = find_roadmap_files(directory)
+        report = ingest_roadmaps(db, paths, workers=2)
+        assert report.files == 4
+        assert list(report.errors) == [os.path.join(directory, "broken.json")]
+        assert report.roadmaps == ["python", "react"]
+        assert report.changed_roadmaps == ["python", "react"]
+        assert (report.courses_inserted, report.courses_updated, report.edges_inserted) == (5, 0, 3)
+        assert db.query(Course).count() == 5
+        assert db.query(CoursePrerequisite).filter(CoursePrerequisite.course_id == "python:b").one().prerequisite_id == "python:a"
+
+        # Keep difficulty across re-imports
+        db.query(Course).filter(Course.id == "python:a").update({"difficulty_level": 800})
+        db.commit()
+
+        # Re-import with one renamed topic: only python is written
+        write_roadmap(directory, "python", [
+            topic("a", "Python Basics"), topic("b", "Functions"), topic("c", "Classes"),
+        ], [("a", "b"), ("b", "c")])
+
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(engine, "before_cursor_execute", listener)
+        report = ingest_roadmaps(db, paths, workers=1)
+        event.remove(engine, "before_cursor_execute", listener)
+
+        assert report.changed_roadmaps == ["python"]
+        assert (report.courses_inserted, report.courses_updated, report.courses_unchanged, report.edges_inserted) == (0, 1, 4, 0)
+        # Two snapshot reads, one bulk upsert and one pending mark
+        assert len([s for s in statements if s.lstrip().upper().startswith(("SELECT", "INSERT"))]) == 4
+
+    db.expire_all()
+    course = db.query(Course).filter(Course.id == "python:a").one()
+    assert (course.title, course.difficulty_level) == ("Python Basics", 800)
+
+    db.close()
+    if os.path.exists("./test_roadmap_ingestion.db"):
+        os.remove("./test_roadmap_ingestion.db")
+
+if __name__ == "__main__":
+    test_roadmap_ingestion_diffs_and_bulk_writes()
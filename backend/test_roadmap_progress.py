@@ -0,0 +1,103 @@
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+# Import app and database
+from main import app
+from db.database import Base, get_async_db, get_db
+from models import User, Event
+from models.course import Course
+from models.user_course_completion import UserCourseCompletion
+from models.user_roadmap_progress import UserRoadmapProgress
+from core.security import create_access_token
+from services.catalog_version import bump_catalog_version
+from services.progress_service import backfill_roadmap_progress, rebuild_roadmap_progress, record_course_completion
+
+# Setup test DB
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_roadmap_progress.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# NullPool: TestClient may run each request on a fresh event loop
+async_engine = create_async_engine("sqlite+aiosqlite:///./test_roadmap_progress.db", poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+async def override_get_async_db():
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+client = TestClient(app)
+
+def test_progress_counters_maintained_on_write():
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+    # Reset DB
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = TestingSessionLocal()
+    user_id = "progress-user"
+    db.add(User(id=user_id, email="counter@example.com", password_hash="pw"))
+    db.add_all([
+        Course(id=f"git:{i}", roadmap_id="git", node_id=str(i), title=f"Git {i}")
+        for i in range(1, 5)
+    ])
+    db.commit()
+    bump_catalog_version(db)
+
+    headers = {"Authorization": f"Bearer {create_access_token(user_id)}"}
+    for course_id in ["git:1", "git:2", "git:1"]:  # duplicate completion is not counted twice
+        response = client.post("/events", headers=headers, json={"event_type": "course_completed", "course_id": course_id})
+        assert response.status_code == 200, response.text
+
+    data = client.get("/progress/git", headers=headers).json()
+    assert data["total_courses"] == 4
+    assert data["completed_courses"] == 2
+    assert data["progress_percent"] == 50.0
+
+    # Rebuild reconciles the table from the events log
+    db.query(UserRoadmapProgress).delete()
+    db.add(Event(user_id=user_id, event_type="course_completed", course_id="git:3", roadmap_id="git"))
+    db.commit()
+    assert rebuild_roadmap_progress(db) == 1
+
+    data = client.get("/progress/git", headers=headers).json()
+    assert data["completed_courses"] == 3
+
+    # A completion already recorded never moves the counter, whatever the
+    # caller saw before inserting
+    assert record_course_completion(user_id, "git:3", "git", db) is False
+    assert record_course_completion(user_id, "git:4", "git", db) is True
+    db.commit()
+    assert client.get("/progress/git", headers=headers).json()["completed_courses"] == 4
+
+    # Databases whose events predate the completions table are backfilled once
+    db.query(UserCourseCompletion).delete()
+    db.query(UserRoadmapProgress).delete()
+    db.commit()
+    assert backfill_roadmap_progress(db) is True
+    assert client.get("/progress/git", headers=headers).json()["completed_courses"] == 3
+    assert backfill_roadmap_progress(db) is False
+
+    db.close()
+    app.dependency_overrides.pop(get_db, None)
+    app.dependency_overrides.pop(get_async_db, None)
+    if os.path.exists("./test_roadmap_progress.db"):
+        os.remove("./test_roadmap_progress.db")
+
+if __name__ == "__main__":
+    test_progress_counters_maintained_on_write()
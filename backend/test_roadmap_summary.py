@@ -0,0 +1,94 @@
+import sys
+import os
+import json
+
+# Add backend to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+# Import app and database
+from main import app
+from db.database import Base, get_db
+from models.course import Course
+from models.course_prerequisite import CoursePrerequisite
+from models.course_resource import CourseResource
+from models.roadmap_summary import RoadmapSummary
+from services.catalog_version import bump_catalog_version
+from services.roadmap_summary import rebuild_roadmap_summaries
+
+# Setup test DB
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_roadmap_summary.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+client = TestClient(app)
+
+def test_roadmaps_served_from_summary_snapshot():
+    app.dependency_overrides[get_db] = override_get_db
+
+    # Reset DB
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = TestingSessionLocal()
+    db.add_all([
+        Course(id="python:1", roadmap_id="python", node_id="1", title="Basics", difficulty_level=800),
+        Course(id="python:2", roadmap_id="python", node_id="2", title="Functions", difficulty_level=900),
+        Course(id="python:3", roadmap_id="python", node_id="3", title="Classes", difficulty_level=900),
+        Course(id="react:1", roadmap_id="react", node_id="1", title="JSX"),
+    ])
+    db.commit()
+    db.add_all([
+        CoursePrerequisite(course_id="python:2", prerequisite_id="python:1"),
+        CoursePrerequisite(course_id="python:3", prerequisite_id="python:2"),
+        CourseResource(course_id="react:1", resource_type="video", title="JSX intro", url="https://example.com"),
+    ])
+    db.commit()
+
+    assert rebuild_roadmap_summaries(db) == 2
+    bump_catalog_version(db)
+    row = db.query(RoadmapSummary).filter(RoadmapSummary.roadmap_id == "python").first()
+    assert json.loads(row.difficulty_histogram) == {"800": 1, "900": 2}
+
+    expected = [
+        {"id": "python", "topic_count": 3, "difficulty_histogram": {"800": 1, "900": 2}, "edge_count": 2, "resource_count": 0},
+        {"id": "react", "topic_count": 1, "difficulty_histogram": {}, "edge_count": 0, "resource_count": 1},
+    ]
+    response = client.get("/roadmaps")
+    assert response.status_code == 200
+    assert response.json() == expected
+
+    # Served from memory: no queries at all
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+    response = client.get("/roadmaps")
+    assert response.json() == expected
+    assert client.get("/roadmaps", headers={"If-None-Match": response.headers["ETag"]}).status_code == 304
+    assert statements == []
+    event.remove(engine, "before_cursor_execute", listener)
+
+    # Catalog rewrites are picked up after the scripts rebuild and bump
+    db.add(Course(id="rust:1", roadmap_id="rust", node_id="1", title="Ownership", difficulty_level=800))
+    db.commit()
+    rebuild_roadmap_summaries(db)
+    bump_catalog_version(db)
+    response = client.get("/roadmaps")
+    assert [r["id"] for r in response.json()] == ["python", "react", "rust"]
+
+    db.close()
+    app.dependency_overrides.pop(get_db, None)
+    if os.path.exists("./test_roadmap_summary.db"):
+        os.remove("./test_roadmap_summary.db")
+
+if __name__ == "__main__":
+    test_roadmaps_served_from_summary_snapshot()
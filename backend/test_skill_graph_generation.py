@@ -0,0 +1,80 @@
+import sys
+import os
+import re
+
+# Add backend to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from db.database import Base
+from models.course import Course
+from models.skill_edge import SkillEdge
+from services.skill_graph_service import generate_graph_for_roadmap, generate_skill_edges
+
+# Setup test DB
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_skill_graph_generation.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+UUID_PATTERN = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$")
+
+def edges(db, roadmap_id=None):
+    query = db.query(SkillEdge.from_skill_id, SkillEdge.to_skill_id)
+    if roadmap_id is not None:
+        query = query.filter(SkillEdge.roadmap_id == roadmap_id)
+    return set(query.all())
+
+def test_skill_edges_are_generated_with_one_statement():
+    # Reset DB
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = TestingSessionLocal()
+    db.add_all(
+        [Course(id=f"python:{n}", roadmap_id="python", node_id=n, title=n) for n in "cab"]
+        + [Course(id=f"go:{n}", roadmap_id="go", node_id=n, title=n) for n in "xy"]
+        + [Course(id="rust:a", roadmap_id="rust", node_id="a", title="a")]
+    )
+    db.commit()
+
+    # Single roadmap: consecutive courses by id, nothing else touched
+    generate_graph_for_roadmap("python", db)
+    assert edges(db) == {("python:a", "python:b"), ("python:b", "python:c")}
+
+    statements = []
+    def count_statements(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    event.listen(engine, "before_cursor_execute", count_statements)
+
+    # Whole catalog: one INSERT ... SELECT; existing edges are skipped
+    inserted = generate_skill_edges(db)
+    event.remove(engine, "before_cursor_execute", count_statements)
+
+    assert inserted == 1
+    assert len(statements) == 1
+    assert edges(db, "go") == {("go:x", "go:y")}
+    assert edges(db, "rust") == set()
+    assert all(UUID_PATTERN.match(edge_id) for (edge_id,) in db.query(SkillEdge.id))
+
+    # Idempotent
+    assert generate_skill_edges(db) == 0
+    assert db.query(SkillEdge).count() == 3
+
+    # Catalog-sized run
+    db.add_all([
+        Course(id=f"big{r}:{i:04d}", roadmap_id=f"big{r}", node_id=str(i), title=str(i))
+        for r in range(50) for i in range(200)
+    ])
+    db.commit()
+    assert generate_skill_edges(db) == 50 * 199
+    assert db.query(SkillEdge).count() == 3 + 50 * 199
+
+    db.close()
+
+    # Cleanup
+    if os.path.exists("./test_skill_graph_generation.db"):
+        os.remove("./test_skill_graph_generation.db")
+
+if __name__ == "__main__":
+    test_skill_edges_are_generated_with_one_statement()
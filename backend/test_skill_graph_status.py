@@ -0,0 +1,105 @@
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+# Import app and database
+from main import app
+from db.database import Base, get_async_db, get_db
+from models import User, SkillProfile
+from models.course import Course
+from models.skill_weight import SkillWeight
+from core.security import create_access_token
+
+# Setup test DB
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_skill_graph_status.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# NullPool: TestClient may run each request on a fresh event loop
+async_engine = create_async_engine("sqlite+aiosqlite:///./test_skill_graph_status.db", poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+async def override_get_async_db():
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+client = TestClient(app)
+
+def test_roadmap_status_bulk_cold_start():
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+    # Reset DB
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = TestingSessionLocal()
+
+    user_id = "status-user"
+    db.add(User(id=user_id, email="status@example.com", password_hash="pw"))
+    db.add_all([
+        Course(id=f"sql:{i}", roadmap_id="sql", node_id=str(i), title=f"SQL {i}")
+        for i in range(1, 21)
+    ])
+    db.commit()
+
+    db.add_all([
+        SkillWeight(user_id=user_id, skill_name="sql:1", weight=0.8, confidence=0.9, source="github"),
+        SkillWeight(user_id=user_id, skill_name="sql:2", weight=0.5, confidence=0.4, source="resume"),
+        # Quiz signals must never be overwritten by cold start
+        SkillProfile(user_id=user_id, skill_id="sql:3", roadmap_id="sql", quiz_confidence=0.2, proficiency_level=0.7),
+    ])
+    db.add(SkillWeight(user_id=user_id, skill_name="sql:3", weight=0.1, confidence=0.9, source="github"))
+    db.commit()
+
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+    event.listen(async_engine.sync_engine, "before_cursor_execute", listener)
+
+    headers = {"Authorization": f"Bearer {create_access_token(user_id)}"}
+    response = client.get("/skill-graph/sql/status", headers=headers)
+    assert response.status_code == 200, response.text
+    assert len(response.json()["skills"]) == 20
+
+    event.remove(engine, "before_cursor_execute", listener)
+    event.remove(async_engine.sync_engine, "before_cursor_execute", listener)
+    # Constant number of statements regardless of roadmap size
+    assert len(statements) <= 10, statements
+
+    profiles = {p.skill_id: p for p in db.query(SkillProfile).filter(SkillProfile.user_id == user_id)}
+    assert len(profiles) == 20
+
+    assert profiles["sql:1"].github_proficiency == 0.8
+    assert profiles["sql:1"].confidence == 0.9
+    assert abs(profiles["sql:1"].proficiency_level - 0.8) < 1e-9
+    assert profiles["sql:2"].resume_confidence == 0.4
+    assert profiles["sql:3"].proficiency_level == 0.7
+    assert profiles["sql:3"].github_confidence == 0.0
+    assert profiles["sql:20"].confidence == 0.0
+
+    # A second load has nothing left to write
+    response = client.get("/skill-graph/sql/status", headers=headers)
+    assert response.status_code == 200
+
+    db.close()
+    app.dependency_overrides.pop(get_db, None)
+    app.dependency_overrides.pop(get_async_db, None)
+    if os.path.exists("./test_skill_graph_status.db"):
+        os.remove("./test_skill_graph_status.db")
+
+if __name__ == "__main__":
+    test_roadmap_status_bulk_cold_start()
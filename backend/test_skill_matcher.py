@@ -0,0 +1,63 @@
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from db.database import Base
+from models.course import Course
+from services.catalog_version import bump_catalog_version
+from services.resume_parser import extract_skills_from_text
+from services.skill_matcher import get_skill_matcher
+
+# Setup test DB
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_skill_matcher.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def test_skill_matcher_counts_terms_in_one_pass():
+    # Reset DB
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = TestingSessionLocal()
+    db.add_all([
+        Course(id="react:1", roadmap_id="react", node_id="1", title="Hooks"),
+        Course(id="react-native:1", roadmap_id="react-native", node_id="1", title="Expo Router Basics"),
+        Course(id="cpp:1", roadmap_id="cpp", node_id="1", title="Introduction"),
+        Course(id="python:1", roadmap_id="python", node_id="1", title="Introduction"),
+    ])
+    db.commit()
+    bump_catalog_version(db)
+
+    text = (
+        "built react apps and react native apps (react-native, expo router\nbasics). "
+        "wrote c++ and cpp services. reactive systems. introduction to python."
+    )
+    assert extract_skills_from_text(text, db) == {"react": 1, "react-native": 3, "cpp": 2, "python": 1}
+
+    # Cached: no catalog queries on later calls
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+    matcher = get_skill_matcher(db)
+    assert extract_skills_from_text("python", db) == {"python": 1}
+    assert get_skill_matcher(db) is matcher
+    assert statements == []
+    event.remove(engine, "before_cursor_execute", listener)
+
+    # A catalog change rebuilds the matcher
+    db.add(Course(id="rust:1", roadmap_id="rust", node_id="1", title="Ownership"))
+    db.commit()
+    bump_catalog_version(db)
+    assert get_skill_matcher(db) is not matcher
+    assert extract_skills_from_text("rust and python", db) == {"rust": 1, "python": 1}
+
+    db.close()
+    if os.path.exists("./test_skill_matcher.db"):
+        os.remove("./test_skill_matcher.db")
+
+if __name__ == "__main__":
+    test_skill_matcher_counts_terms_in_one_pass()
@@ -0,0 +1,96 @@
+import sys
+import os
+import random
+
+# Add backend to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+# Import app and database
+import main
+from db.database import Base
+from models import User, SkillProfile
+from models.course import Course
+from models.skill_weight import SkillWeight
+from services.skill_synthesis_engine import (
+    SOURCE_MULTIPLIERS,
+    WeightColumns,
+    blend_weight_columns,
+    synthesize_profiles,
+)
+
+# Setup test DB
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_skill_synthesis_engine.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def reference_blend(rows):
+    numerator = sum(w * c * SOURCE_MULTIPLIERS.get(s, 1.0) for s, w, c in rows)
+    denominator = sum(c * SOURCE_MULTIPLIERS.get(s, 1.0) for s, w, c in rows)
+    if denominator == 0:
+        return None
+    return numerator / denominator, min(1.0, denominator / len(rows))
+
+def test_grouped_blend_matches_row_by_row_formula():
+    rng = random.Random(7)
+    groups = {}
+    rows = []
+    for _ in range(500):
+        user, skill = f"u{rng.randrange(20)}", f"s{rng.randrange(30)}"
+        source = rng.choice(["github", "resume", "quiz", "engagement", "other"])
+        weight, confidence = rng.random(), rng.choice([0.0, rng.random()])
+        groups.setdefault((user, skill), []).append((source, weight, confidence))
+        rows.append((user, skill, source, weight, confidence))
+
+    users, skills, sources, weights, confidences = zip(*rows)
+    columns = WeightColumns(
+        np.array(users, dtype=object),
+        np.array(skills, dtype=object),
+        np.array(weights),
+        np.array(confidences),
+        np.array([SOURCE_MULTIPLIERS.get(s, 1.0) for s in sources]),
+    )
+    blended = blend_weight_columns(columns)
+
+    expected = {key: reference_blend(group) for key, group in groups.items()}
+    expected = {key: value for key, value in expected.items() if value is not None}
+    assert len(blended.user_ids) == len(expected)
+    for user, skill, weight, confidence in zip(blended.user_ids, blended.skill_ids, blended.synthesized_weight, blended.confidence):
+        assert abs(weight - expected[(user, skill)][0]) < 1e-9
+        assert abs(confidence - expected[(user, skill)][1]) < 1e-9
+
+def test_synthesize_profiles_for_many_users():
+    # Reset DB
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = TestingSessionLocal()
+    db.add(Course(id="go:1", roadmap_id="go", node_id="1", title="Go 1"))
+    for i in range(10):
+        db.add(User(id=f"engine-{i}", email=f"engine{i}@example.com", password_hash="pw"))
+    db.commit()
+    db.add_all([
+        SkillWeight(user_id=f"engine-{i}", skill_name=skill, weight=0.5, confidence=0.1 * (i + 1), source="resume")
+        for i in range(10)
+        for skill in ("python", "go:1")
+    ])
+    db.commit()
+
+    results = synthesize_profiles(db, [f"engine-{i}" for i in range(5)])
+    assert len(results) == 10
+    assert results[("engine-0", "go:1")].roadmap_id == "go"
+    assert abs(results[("engine-4", "python")].confidence - 0.3) < 1e-9
+
+    results = synthesize_profiles(db)
+    assert len(results) == 20
+    assert db.query(SkillProfile).count() == 20
+
+    db.close()
+    if os.path.exists("./test_skill_synthesis_engine.db"):
+        os.remove("./test_skill_synthesis_engine.db")
+
+if __name__ == "__main__":
+    test_grouped_blend_matches_row_by_row_formula()
+    test_synthesize_profiles_for_many_users()
@@ -0,0 +1,65 @@
+import sys
+import os
+
+# Add backend to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+# Import app and database
+import main
+from db.database import Base
+from models import User, SkillProfile
+from models.course import Course
+from models.skill_weight import SkillWeight
+from services.skill_weight_service import store_skill_weights
+
+# Setup test DB
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_skill_weights.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def test_store_skill_weights_in_one_batch():
+    # Reset DB
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = TestingSessionLocal()
+    user_id = "weights-user"
+    db.add(User(id=user_id, email="weights@example.com", password_hash="pw"))
+    db.add(Course(id="python:1", roadmap_id="python", node_id="1", title="Python 1"))
+    db.commit()
+
+    weights = {f"skill-{i}": (i / 50, 0.5) for i in range(50)}
+    weights["python:1"] = (1.0, 0.8)
+
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+    results = store_skill_weights(user_id, weights, "resume", db)
+    event.remove(engine, "before_cursor_execute", listener)
+
+    # Constant number of statements regardless of batch size
+    assert len(statements) <= 6, statements
+    assert len(results) == 51
+    # Course ids resolve to their roadmap
+    assert results["python:1"].roadmap_id == "python"
+    assert results["skill-3"].roadmap_id == "skill-3"
+    assert abs(results["python:1"].confidence - 0.48) < 1e-9
+
+    # Re-ingesting updates rows in place
+    store_skill_weights(user_id, {"python:1": (0.5, 0.2)}, "github", db)
+    db.expire_all()
+    weight = db.query(SkillWeight).filter(SkillWeight.user_id == user_id, SkillWeight.skill_name == "python:1").one()
+    assert (weight.weight, weight.confidence, weight.source) == (0.5, 0.2, "github")
+    assert db.query(SkillWeight).count() == 51
+    assert db.query(SkillProfile).count() == 51
+    profile = db.query(SkillProfile).filter(SkillProfile.skill_id == "python:1").one()
+    assert profile.confidence == 0.2
+
+    db.close()
+    if os.path.exists("./test_skill_weights.db"):
+        os.remove("./test_skill_weights.db")
+
+if __name__ == "__main__":
+    test_store_skill_weights_in_one_batch()
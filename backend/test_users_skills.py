@@ -7,17 +7,24 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 # Import app and database
 from main import app
-from db.database import Base, get_db
+from db.database import Base, get_async_db, get_db
 from models import User, UserSkill, Event
 from models.course import Course
+from services.catalog_version import bump_catalog_version
+from services.progress_service import rebuild_roadmap_progress
 
 # Setup test DB
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test_users_skills.db"
 engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# NullPool: TestClient may run each request on a fresh event loop
+async_engine = create_async_engine("sqlite+aiosqlite:///./test_users_skills.db", poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
 
 def override_get_db():
     try:
@@ -26,7 +33,12 @@ def override_get_db():
     finally:
         db.close()
 
+async def override_get_async_db():
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_async_db] = override_get_async_db
 
 client = TestClient(app)
 
@@ -61,6 +73,8 @@ def test_users_skills_endpoint():
     ]
     db.add_all(events)
     db.commit()
+    bump_catalog_version(db)
+    rebuild_roadmap_progress(db)
 
     # 4. Create UserSkill
     skill = UserSkill(user_id=user_id, skill_name="ai-agents", trust_score=850.0, proficiency_level=0.1)
@@ -1,7 +1,7 @@
 import React, { useEffect, useState } from "react";
 import { Link, useNavigate } from "react-router-dom";
 import { getGithubStatus, redirectToGithubConnect } from "../../services/githubApi";
-import { uploadResume } from "../../services/resumeApi";
+import { uploadResume, waitForResumeJob } from "../../services/resumeApi";
 import { getUserSkills } from "../../services/userApi";
 import { getToken } from "../../services/auth";
 import { useProgress } from "../hooks/useProgress";
@@ -60,7 +60,10 @@ export default function DashboardPage() {
     setResumeUploading(true);
 
     try {
-      await uploadResume(file);
+      const upload = await uploadResume(file);
+      if (upload.status !== "succeeded") {
+        await waitForResumeJob(upload.job_id);
+      }
       const updatedSkills = await getUserSkills();
       setSkills(updatedSkills.skills || []);
     } catch (err: any) {
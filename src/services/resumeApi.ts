@@ -16,3 +16,29 @@ export async function uploadResume(file: File) {
 
     return res.json();
 }
+
+export async function getResumeJob(jobId: string) {
+    const res = await fetch(`${BACKEND_URL}/resume/jobs/${jobId}`, {
+        headers: {
+            Authorization: `Bearer ${localStorage.getItem("access_token")}`,
+        },
+    });
+
+    if (!res.ok) throw new Error("Failed to fetch resume job");
+
+    return res.json();
+}
+
+// Uploads are parsed in the background: poll the job until it finishes
+export async function waitForResumeJob(jobId: string, intervalMs = 1000, timeoutMs = 120000) {
+    const deadline = Date.now() + timeoutMs;
+
+    while (true) {
+        const job = await getResumeJob(jobId);
+        if (job.status === "succeeded") return job;
+        if (job.status === "failed") throw new Error(job.error || "Resume processing failed");
+        if (Date.now() > deadline) throw new Error("Resume processing timed out");
+
+        await new Promise(resolve => setTimeout(resolve, intervalMs));
+    }
+}